@@ -1,6 +1,7 @@
 """
 NDK Dashboard - Flask Application Factory
 """
+import logging
 from flask import Flask
 from datetime import timedelta
 from config import Config
@@ -13,9 +14,19 @@ def create_app(config_class=Config):
                 static_folder='../static')
     app.config.from_object(config_class)
     
+    # Configure logging
+    logging.basicConfig(
+        level=getattr(logging, config_class.LOG_LEVEL, logging.INFO),
+        format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
+    )
+    
     # Set session configuration
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=config_class.SESSION_TIMEOUT_HOURS)
     
+    # Serialize JSON responses with orjson
+    from app.utils.json_provider import init_json_provider
+    init_json_provider(app)
+    
     # Initialize extensions
     from app.extensions import init_extensions
     init_extensions(app)
@@ -23,7 +34,7 @@ def create_app(config_class=Config):
     # Register blueprints
     from app.routes import (
         main_bp, auth_bp, applications_bp, snapshots_bp,
-        storage_bp, protectionplans_bp, deployment_bp, restores_bp
+        storage_bp, protectionplans_bp, deployment_bp, restores_bp, tasks_bp
     )
     
     app.register_blueprint(main_bp)
@@ -34,5 +45,6 @@ def create_app(config_class=Config):
     app.register_blueprint(protectionplans_bp, url_prefix='/api')
     app.register_blueprint(deployment_bp, url_prefix='/api')
     app.register_blueprint(restores_bp, url_prefix='/api')
+    app.register_blueprint(tasks_bp, url_prefix='/api')
     
     return app
\ No newline at end of file
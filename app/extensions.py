@@ -1,32 +1,49 @@
 """
 Flask extensions and Kubernetes client initialization
 """
+import logging
+import os
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from flask_caching import Cache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from kubernetes import client, config as k8s_config
 from kubernetes.client.rest import ApiException
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 # Kubernetes API clients (initialized on app startup)
 k8s_api = None
 k8s_core_api = None
 k8s_apps_api = None
 k8s_storage_api = None
 
+# Cache entry for keys with no valid data; entries are (data, timestamp) tuples
+INVALID_CACHE_ENTRY = (None, None)
+
 # Cache for API responses
 cache = {
-    'applicationcrds': {'data': None, 'timestamp': None},
-    'snapshots': {'data': None, 'timestamp': None},
-    'storageclusters': {'data': None, 'timestamp': None},
-    'protectionplans': {'data': None, 'timestamp': None},
-    'applicationsnapshotrestores': {'data': None, 'timestamp': None},
-    'persistentvolumeclaims': {'data': None, 'timestamp': None},
-    'persistentvolumes': {'data': None, 'timestamp': None},
-    'volumesnapshots': {'data': None, 'timestamp': None}
+    'applications': INVALID_CACHE_ENTRY,
+    'snapshots': INVALID_CACHE_ENTRY,
+    'storageclusters': INVALID_CACHE_ENTRY,
+    'protectionplans': INVALID_CACHE_ENTRY,
+    'applications:resources': INVALID_CACHE_ENTRY,
+    'snapshots:resources': INVALID_CACHE_ENTRY,
+    'storageclusters:resources': INVALID_CACHE_ENTRY,
+    'protectionplans:resources': INVALID_CACHE_ENTRY,
+    'applicationsnapshotrestores': INVALID_CACHE_ENTRY,
+    'persistentvolumeclaims': INVALID_CACHE_ENTRY,
+    'persistentvolumes': INVALID_CACHE_ENTRY,
+    'volumesnapshots': INVALID_CACHE_ENTRY
 }
 
-# Cache buster for static files
-CACHE_BUST_VERSION = str(int(datetime.now().timestamp()))
+# Cache shared by all workers (Redis), set up on startup when CACHE_REDIS_URL is configured
+shared_cache = None
+
+# Rate limiter (limits are applied per route, e.g. on login)
+limiter = Limiter(key_func=get_remote_address, storage_uri='memory://')
 
 # Track last successful authentication
 _last_auth_time = None
@@ -44,26 +61,33 @@ def init_kubernetes_client(force_reload=False):
     global k8s_api, k8s_core_api, k8s_apps_api, k8s_storage_api, _last_auth_time, _auth_retry_count
     
     try:
+        k8s_configuration = client.Configuration()
         if Config.IN_CLUSTER:
-            k8s_config.load_incluster_config()
-            print("✓ Loaded in-cluster Kubernetes configuration")
+            k8s_config.load_incluster_config(client_configuration=k8s_configuration)
+            logger.info("✓ Loaded in-cluster Kubernetes configuration")
         else:
             # Force reload kubeconfig to pick up refreshed credentials
-            k8s_config.load_kube_config()
-            print(f"✓ Loaded kubeconfig from local system{' (refreshed)' if force_reload else ''}")
+            k8s_config.load_kube_config(client_configuration=k8s_configuration)
+            logger.info("✓ Loaded kubeconfig from local system%s", ' (refreshed)' if force_reload else '')
         
-        k8s_api = client.CustomObjectsApi()
-        k8s_core_api = client.CoreV1Api()
-        k8s_apps_api = client.AppsV1Api()
-        k8s_storage_api = client.StorageV1Api()
-        print("✓ Kubernetes API client initialized")
+        # Enlarge the urllib3 pool so concurrent fetches reuse keep-alive connections
+        # instead of opening (and TLS-handshaking) new ones past the default of 4
+        k8s_configuration.connection_pool_maxsize = Config.K8S_CONNECTION_POOL_MAXSIZE
+        
+        # All API groups share one ApiClient, and therefore one connection pool
+        api_client = client.ApiClient(k8s_configuration)
+        k8s_api = client.CustomObjectsApi(api_client)
+        k8s_core_api = client.CoreV1Api(api_client)
+        k8s_apps_api = client.AppsV1Api(api_client)
+        k8s_storage_api = client.StorageV1Api(api_client)
+        logger.info("✓ Kubernetes API client initialized")
         
         _last_auth_time = datetime.now()
         _auth_retry_count = 0
         
         return True
     except Exception as e:
-        print(f"✗ Failed to initialize Kubernetes client: {e}")
+        logger.error("✗ Failed to initialize Kubernetes client: %s", e)
         k8s_api = None
         k8s_core_api = None
         k8s_apps_api = None
@@ -89,19 +113,19 @@ def handle_auth_error():
     global _auth_retry_count
     
     if _auth_retry_count >= _max_auth_retries:
-        print(f"✗ Max authentication retry attempts ({_max_auth_retries}) reached")
+        logger.error("✗ Max authentication retry attempts (%s) reached", _max_auth_retries)
         return False
     
     _auth_retry_count += 1
-    print(f"⚠ Authentication error detected. Attempting to refresh credentials (attempt {_auth_retry_count}/{_max_auth_retries})...")
+    logger.warning("⚠ Authentication error detected. Attempting to refresh credentials (attempt %s/%s)...", _auth_retry_count, _max_auth_retries)
     
     # Reinitialize the client to pick up refreshed credentials
     success = init_kubernetes_client(force_reload=True)
     
     if success:
-        print("✓ Kubernetes client reinitialized successfully")
+        logger.info("✓ Kubernetes client reinitialized successfully")
     else:
-        print("✗ Failed to reinitialize Kubernetes client")
+        logger.error("✗ Failed to reinitialize Kubernetes client")
     
     return success
 
@@ -121,18 +145,18 @@ def with_auth_retry(func):
             return func(*args, **kwargs)
         except ApiException as e:
             if is_auth_error(e):
-                print(f"⚠ Authentication error in {func.__name__}: {e.status} {e.reason}")
+                logger.warning("⚠ Authentication error in %s: %s %s", func.__name__, e.status, e.reason)
                 
                 # Try to refresh credentials and retry once
                 if handle_auth_error():
-                    print(f"↻ Retrying {func.__name__} after credential refresh...")
+                    logger.info("↻ Retrying %s after credential refresh...", func.__name__)
                     try:
                         return func(*args, **kwargs)
                     except Exception as retry_error:
-                        print(f"✗ Retry failed for {func.__name__}: {retry_error}")
+                        logger.error("✗ Retry failed for %s: %s", func.__name__, retry_error)
                         raise
                 else:
-                    print(f"✗ Could not refresh credentials for {func.__name__}")
+                    logger.error("✗ Could not refresh credentials for %s", func.__name__)
                     raise
             else:
                 # Not an auth error, re-raise
@@ -140,12 +164,64 @@ def with_auth_retry(func):
     return wrapper
 
 
+def init_shared_cache(app):
+    """
+    Set up the Redis-backed cache shared across workers, if configured
+    
+    Args:
+        app: Flask application
+    """
+    global shared_cache
+    if not Config.CACHE_REDIS_URL:
+        return
+    # Bound to the app so background threads can use it outside a request
+    shared_cache = Cache(app, config={
+        'CACHE_TYPE': 'RedisCache',
+        'CACHE_REDIS_URL': Config.CACHE_REDIS_URL,
+        'CACHE_DEFAULT_TIMEOUT': Config.CACHE_TTL,
+        'CACHE_KEY_PREFIX': 'ndk-dashboard:'
+    })
+    logger.info("✓ Shared Redis cache enabled")
+
+
+@lru_cache(maxsize=128)
+def static_file_version(static_folder, filename):
+    """Cache buster for a static file: its modification time, so unchanged files stay cached across deploys"""
+    try:
+        return str(int(os.path.getmtime(os.path.join(static_folder, filename))))
+    except OSError:
+        return '0'
+
+
+def start_background_tasks():
+    """Start the cache refresher and resource watch threads (once per process, safe after fork)"""
+    # Keep cached API responses warm so requests don't wait on the Kubernetes API
+    from app.utils.cache import start_cache_refresher
+    start_cache_refresher()
+    
+    # Follow NDK resources with watches so list fetches are served from memory
+    from app.utils.watch import start_resource_watches
+    start_resource_watches()
+
+
 def init_extensions(app):
     """Initialize Flask extensions"""
     # Initialize Kubernetes client
     init_kubernetes_client()
     
-    # Make cache bust version available in templates
+    # Rate limiting
+    limiter.init_app(app)
+    
+    # Shared response cache
+    init_shared_cache(app)
+    
+    # Threads don't survive fork, so a preloading server starts these in each worker instead
+    if not Config.DEFER_BACKGROUND_TASKS:
+        start_background_tasks()
+    
+    # Make per-file cache bust versions available in templates, e.g. cache_bust('app.js')
     @app.context_processor
     def inject_cache_bust():
-        return {'cache_bust': CACHE_BUST_VERSION}
\ No newline at end of file
+        # Re-read mtimes in debug mode so edited files are picked up
+        version = static_file_version.__wrapped__ if app.debug else static_file_version
+        return {'cache_bust': lambda filename: version(app.static_folder, filename)}
\ No newline at end of file
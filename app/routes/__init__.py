@@ -9,6 +9,7 @@ from .storage import storage_bp
 from .protectionplans import protectionplans_bp
 from .deployment import deployment_bp
 from .restores import restores_bp
+from .tasks import tasks_bp
 
 __all__ = [
     'main_bp',
@@ -18,5 +19,6 @@ __all__ = [
     'storage_bp',
     'protectionplans_bp',
     'deployment_bp',
-    'restores_bp'
+    'restores_bp',
+    'tasks_bp'
 ]
\ No newline at end of file
@@ -1,10 +1,15 @@
 """
 Application routes - API endpoints for NDK Applications
 """
+import logging
 from flask import Blueprint, jsonify, request
 from app.utils import login_required, get_cached_or_fetch, invalidate_cache
+from app.utils.json_provider import stream_json_list
+from app.utils.tasks import submit_task
 from app.services import ApplicationService
 
+logger = logging.getLogger(__name__)
+
 applications_bp = Blueprint('applications', __name__)
 
 
@@ -13,7 +18,7 @@ applications_bp = Blueprint('applications', __name__)
 def list_applications():
     """Get all NDK Applications from non-system namespaces"""
     applications = get_cached_or_fetch('applications', ApplicationService.list_applications)
-    return jsonify(applications)
+    return stream_json_list(applications)
 
 
 @applications_bp.route('/applications/<namespace>/<name>', methods=['GET'])
@@ -27,26 +32,33 @@ def get_application(namespace, name):
         return jsonify({'error': str(e)}), 404
 
 
+def _cleanup_application(namespace, name, force, app_only, log):
+    """Background task: delete an application and its resources"""
+    try:
+        message, _ = ApplicationService.delete_application(
+            namespace, name, force, app_only, cleanup_log=log
+        )
+        return {'message': message}
+    finally:
+        # Invalidate all relevant caches
+        invalidate_cache('applications', 'snapshots', 'protectionplans')
+
+
 @applications_bp.route('/applications/<namespace>/<name>', methods=['DELETE'])
 @login_required
 def delete_application(namespace, name):
-    """Delete an NDK Application"""
+    """Start deleting an NDK Application; poll /api/tasks/<task_id> for progress"""
     try:
         force = request.args.get('force', 'false').lower() == 'true'
         app_only = request.args.get('app_only', 'false').lower() == 'true'
         
-        message, cleanup_log = ApplicationService.delete_application(
-            namespace, name, force, app_only
-        )
-        
-        # Invalidate all relevant caches
-        invalidate_cache('applications', 'snapshots', 'protectionplans')
+        task_id = submit_task(_cleanup_application, namespace, name, force, app_only)
         
         return jsonify({
             'success': True,
-            'message': message,
-            'cleanup_log': cleanup_log
-        }), 200
+            'task_id': task_id,
+            'status_url': f'/api/tasks/{task_id}'
+        }), 202
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -61,9 +73,9 @@ def update_labels(namespace, name):
         new_labels = data.get('labels', {})
         labels_to_remove = data.get('labels_to_remove', [])
         
-        print(f"[DEBUG] Received labels update request:")
-        print(f"[DEBUG] - new_labels: {new_labels}")
-        print(f"[DEBUG] - labels_to_remove: {labels_to_remove}")
+        logger.debug("Received labels update request:")
+        logger.debug("- new_labels: %s", new_labels)
+        logger.debug("- labels_to_remove: %s", labels_to_remove)
         
         updated_labels = ApplicationService.update_labels(
             namespace, name, new_labels, labels_to_remove
@@ -99,7 +111,7 @@ def get_pods(namespace, name):
         pods_info = ApplicationService.get_pods(namespace, name)
         return jsonify(pods_info)
     except Exception as e:
-        print(f"Error fetching pods for {namespace}/{name}: {e}")
+        logger.error("Error fetching pods for %s/%s: %s", namespace, name, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -111,7 +123,7 @@ def get_pvcs(namespace, name):
         pvcs_info = ApplicationService.get_pvcs(namespace, name)
         return jsonify(pvcs_info)
     except Exception as e:
-        print(f"Error fetching PVCs for {namespace}/{name}: {e}")
+        logger.error("Error fetching PVCs for %s/%s: %s", namespace, name, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -123,5 +135,5 @@ def get_restore_progress(namespace, name):
         progress_info = ApplicationService.get_restore_progress(namespace, name)
         return jsonify(progress_info)
     except Exception as e:
-        print(f"Error fetching restore progress for {namespace}/{name}: {e}")
+        logger.error("Error fetching restore progress for %s/%s: %s", namespace, name, e)
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -1,20 +1,26 @@
 """
 Authentication routes
 """
+from secrets import compare_digest
 from flask import Blueprint, render_template, request, session, redirect, url_for
+from app.extensions import limiter
 from config import Config
 
 auth_bp = Blueprint('auth', __name__)
 
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
+@limiter.limit(Config.LOGIN_RATE_LIMIT, methods=['POST'])
 def login():
     """Login page"""
     if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
+        username = request.form.get('username') or ''
+        password = request.form.get('password') or ''
         
-        if username == Config.DASHBOARD_USERNAME and password == Config.DASHBOARD_PASSWORD:
+        # Constant-time compare; evaluate both so timing doesn't reveal a valid username
+        username_ok = compare_digest(username.encode(), Config.DASHBOARD_USERNAME.encode())
+        password_ok = compare_digest(password.encode(), Config.DASHBOARD_PASSWORD.encode())
+        if username_ok and password_ok:
             session['logged_in'] = True
             session.permanent = True
             return redirect(url_for('main.index'))
@@ -28,4 +34,10 @@ def login():
 def logout():
     """Logout"""
     session.clear()
-    return redirect(url_for('auth.login'))
\ No newline at end of file
+    return redirect(url_for('auth.login'))
+
+
+@auth_bp.app_errorhandler(429)
+def too_many_requests(e):
+    """Show the login page when the login rate limit is exceeded"""
+    return render_template('login.html', error='Too many login attempts. Please try again later.'), 429
\ No newline at end of file
@@ -3,10 +3,8 @@ Deployment routes - API endpoints for deploying applications
 """
 from flask import Blueprint, jsonify, request
 from kubernetes.client.rest import ApiException
-import json
-import re
-from app.utils import login_required, invalidate_cache
-from app.services.deployment import DeploymentService
+from app.utils import login_required, invalidate_cache, api_error_response
+from app.services.deployment import DeploymentService, NKP_WORKER_NODE_PATTERN
 from app.extensions import k8s_core_api, k8s_storage_api
 
 deployment_bp = Blueprint('deployment', __name__)
@@ -60,14 +58,7 @@ def deploy_application():
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except ApiException as e:
-        error_msg = f"Failed to deploy application: {e.reason}"
-        if e.body:
-            try:
-                error_body = json.loads(e.body)
-                error_msg = error_body.get('message', error_msg)
-            except:
-                pass
-        return jsonify({'error': error_msg}), e.status
+        return api_error_response(e, f"Failed to deploy application: {e.reason}")
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -107,7 +98,7 @@ def get_worker_pools():
             # First, try to extract worker pool from node name (for NKP/Karbon clusters)
             # Pattern: nkp-{cluster}-{id}-{POOL_NAME}-worker-{N}
             # Example: nkp-dev01-a8970c-nkp-dev-worker-pool-worker-0 -> nkp-dev-worker-pool
-            match = re.search(r'nkp-[^-]+-[^-]+-(.+?)-worker-\d+$', node_name)
+            match = NKP_WORKER_NODE_PATTERN.search(node_name)
             if match:
                 pool_name = match.group(1)
                 worker_pools.add(pool_name)
@@ -1,16 +1,26 @@
 """
 Main routes - Dashboard pages and health check
 """
-from flask import Blueprint, render_template, jsonify, request
+import logging
+from flask import Blueprint, render_template, jsonify, request, current_app, Response, stream_with_context
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from kubernetes.client import models as k8s_models
 from kubernetes.client.rest import ApiException
 from app.utils import login_required, get_cached_or_fetch
 from app.extensions import k8s_api, k8s_core_api, k8s_apps_api, with_auth_retry
+from app.utils.watch import list_custom_objects, count_custom_objects, wait_for_change
+from app.services import ProtectionPlanService
+from app.services.applications import SYSTEM_NAMESPACES
 from config import Config
 import json
 import os
+import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 main_bp = Blueprint('main', __name__)
 
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'instance', 'settings.json')
@@ -48,10 +58,10 @@ def load_settings_from_configmap():
         return json.loads(settings_json)
     except ApiException as e:
         if e.status != 404:
-            print(f"Error reading ConfigMap: {e}")
+            logger.error("Error reading ConfigMap: %s", e)
         return None
     except Exception as e:
-        print(f"Error loading settings from ConfigMap: {e}")
+        logger.error("Error loading settings from ConfigMap: %s", e)
         return None
 
 def save_settings_to_configmap(settings):
@@ -68,7 +78,6 @@ def save_settings_to_configmap(settings):
             k8s_core_api.patch_namespaced_config_map(CONFIGMAP_NAME, CONFIGMAP_NAMESPACE, configmap)
         except ApiException as e:
             if e.status == 404:
-                from kubernetes.client import models as k8s_models
                 configmap = k8s_models.V1ConfigMap(
                     metadata=k8s_models.V1ObjectMeta(name=CONFIGMAP_NAME, namespace=CONFIGMAP_NAMESPACE),
                     data={'settings.json': settings_json}
@@ -79,7 +88,7 @@ def save_settings_to_configmap(settings):
         
         return True
     except Exception as e:
-        print(f"Error saving settings to ConfigMap: {e}")
+        logger.error("Error saving settings to ConfigMap: %s", e)
         return False
 
 def load_settings():
@@ -118,8 +127,6 @@ def patch_deployment_env(pod_name, host, database_name, password):
         if not deployment:
             return False, f"Deployment '{pod_name}' not found"
         
-        from kubernetes.client import models as k8s_models
-        
         container = deployment.spec.template.spec.containers[0]
         new_env = []
         env_names_found = set()
@@ -173,7 +180,6 @@ def rollout_restart_deployment(pod_name):
             namespace=CONFIGMAP_NAMESPACE
         )
         
-        from kubernetes.client import models as k8s_models
         now = datetime.utcnow()
         deployment.spec.template.metadata.annotations = {
             'kubectl.kubernetes.io/restartedAt': now.isoformat() + 'Z'
@@ -194,25 +200,47 @@ def rollout_restart_deployment(pod_name):
         return False, error_msg
 
 
+@lru_cache(maxsize=16)
+def _render_cached_page(template_name, script_root):
+    """Render a page once per URL prefix; the output only depends on url_for and static file versions"""
+    return render_template(template_name)
+
+
+def render_page(template_name):
+    """
+    Render a dashboard page, reusing the rendered HTML outside debug mode
+    
+    Args:
+        template_name: Template file name
+        
+    Returns:
+        Rendered HTML
+    """
+    if current_app.debug:
+        # Pick up template edits while developing
+        return render_template(template_name)
+    return _render_cached_page(template_name, request.script_root)
+
+
 @main_bp.route('/')
 @login_required
 def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    return render_page('index.html')
 
 
 @main_bp.route('/admin')
 @login_required
 def admin():
     """Admin page for managing applications and protection plans"""
-    return render_template('admin.html')
+    return render_page('admin.html')
 
 
 @main_bp.route('/resources')
 @login_required
 def resources():
     """NDK Resources listing page"""
-    return render_template('resources.html')
+    return render_page('resources.html')
 
 
 @main_bp.route('/health')
@@ -318,483 +346,442 @@ def get_taskapp_db_settings(pod_name):
         }), 500
 
 
-@main_bp.route('/api/stats')
-@login_required
-def get_stats():
-    """Get dashboard statistics"""
+def _list_and_transform(plural, transform, description):
+    """
+    List an NDK custom resource and transform each item for the resources view
+    
+    Items in system namespaces are skipped.
+    
+    Args:
+        plural: Custom resource plural
+        transform: Function (item, namespace) -> resource dict
+        description: Resource description used in error messages
+        
+    Returns:
+        List of transformed resources (empty on error)
+    """
+    if not k8s_api:
+        return []
+    
+    @with_auth_retry
+    def _fetch():
+        return list_custom_objects(plural)
+    
     try:
-        # Fetch application CRDs
-        def fetch_applicationcrds_stats():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='applications'
-                )
-            
-            try:
-                result = _fetch()
-                return result.get('items', [])
-            except ApiException as e:
-                print(f"Error fetching application CRDs for stats: {e}")
-                return []
+        result = _fetch()
+        items = []
+        for item in result.get('items', []):
+            namespace = item.get('metadata', {}).get('namespace', 'default')
+            if namespace in SYSTEM_NAMESPACES:
+                continue
+            items.append(transform(item, namespace))
+        return items
+    except ApiException as e:
+        logger.error("Error fetching %s: %s", description, e)
+        return []
+
+
+def _transform_application(item, namespace):
+    """Resources view entry for an NDK Application"""
+    metadata = item.get('metadata', {})
+    status = item.get('status', {})
+    
+    state = 'Unknown'
+    conditions = status.get('conditions', [])
+    for condition in conditions:
+        if condition.get('type') == 'Active':
+            state = 'Active' if condition.get('status') == 'True' else 'Inactive'
+            break
+        elif condition.get('type') == 'Ready':
+            state = 'Ready' if condition.get('status') == 'True' else 'NotReady'
+            break
+    
+    return {
+        'type': 'Application',
+        'name': metadata.get('name', 'Unknown'),
+        'namespace': namespace,
+        'created': metadata.get('creationTimestamp', ''),
+        'state': state,
+        'message': status.get('message', '')
+    }
+
+
+def _transform_snapshot(item, namespace):
+    """Resources view entry for an NDK Application Snapshot"""
+    metadata = item.get('metadata', {})
+    status = item.get('status', {})
+    
+    ready_to_use = status.get('readyToUse', False)
+    if ready_to_use:
+        state = 'Ready'
+    elif 'readyToUse' in status:
+        state = 'Not Ready'
+    else:
+        state = 'Unknown'
+    
+    return {
+        'type': 'ApplicationSnapshot',
+        'name': metadata.get('name', 'Unknown'),
+        'namespace': namespace,
+        'created': metadata.get('creationTimestamp', ''),
+        'state': state,
+        'message': status.get('message', '')
+    }
+
+
+def _transform_plan(item, namespace):
+    """Resources view entry for an NDK Protection Plan"""
+    metadata = item.get('metadata', {})
+    
+    return {
+        'type': 'ProtectionPlan',
+        'name': metadata.get('name', 'Unknown'),
+        'namespace': namespace,
+        'created': metadata.get('creationTimestamp', ''),
+        'state': 'Ready',
+        'message': ''
+    }
+
+
+def _transform_cluster(item, namespace):
+    """Resources view entry for an NDK Storage Cluster"""
+    metadata = item.get('metadata', {})
+    status = item.get('status', {})
+    
+    return {
+        'type': 'StorageCluster',
+        'name': metadata.get('name', 'Unknown'),
+        'namespace': namespace,
+        'created': metadata.get('creationTimestamp', ''),
+        'state': 'Ready' if status.get('available', False) else 'Not Ready',
+        'message': status.get('message', '')
+    }
+
+
+def _transform_restore(item, namespace):
+    """Resources view entry for an Application Snapshot Restore"""
+    metadata = item.get('metadata', {})
+    spec = item.get('spec', {})
+    status = item.get('status', {})
+    
+    is_completed = status.get('completed', False)
+    conditions = status.get('conditions', [])
+    state = 'Unknown'
+    
+    if is_completed:
+        failed = False
+        for condition in conditions:
+            if condition.get('type') == 'Failed' and condition.get('status') == 'True':
+                state = 'Failed'
+                failed = True
+                break
+        
+        if not failed:
+            for condition in conditions:
+                if condition.get('type') == 'ApplicationRestoreFinalised':
+                    if condition.get('status') == 'True':
+                        state = 'Successful'
+                    break
+            if state == 'Unknown':
+                state = 'Successful'
+    else:
+        state = 'InProgress'
+    
+    return {
+        'type': 'ApplicationSnapshotRestore',
+        'name': metadata.get('name', 'Unknown'),
+        'namespace': namespace,
+        'snapshot': spec.get('snapshotName', ''),
+        'created': metadata.get('creationTimestamp', ''),
+        'state': state,
+        'message': ''
+    }
+
+
+def _fetch_resource_applications():
+    """Fetch NDK Applications for the resources view"""
+    return _list_and_transform('applications', _transform_application, 'application CRDs')
+
+
+def _fetch_resource_snapshots():
+    """Fetch NDK Application Snapshots for the resources view"""
+    return _list_and_transform('applicationsnapshots', _transform_snapshot, 'snapshots')
+
+
+def _fetch_resource_plans():
+    """Fetch NDK Protection Plans for the resources view"""
+    return _list_and_transform('protectionplans', _transform_plan, 'protection plans')
+
+
+def _fetch_resource_clusters():
+    """Fetch NDK Storage Clusters for the resources view"""
+    return _list_and_transform('storageclusters', _transform_cluster, 'storage clusters')
+
+
+def _fetch_resource_restores():
+    """Fetch Application Snapshot Restores for the resources view"""
+    return _list_and_transform('applicationsnapshotrestores', _transform_restore, 'application snapshot restores')
+
+
+def _fetch_resource_pvcs():
+    """Fetch PersistentVolumeClaims for the resources view"""
+    if not k8s_core_api:
+        return []
+    
+    items = []
+    try:
+        @with_auth_retry
+        def _fetch_all_pvcs():
+            # Served from the API server's watch cache rather than etcd
+            return k8s_core_api.list_persistent_volume_claim_for_all_namespaces(
+                resource_version='0',
+                resource_version_match='NotOlderThan'
+            )
         
-        # Fetch snapshots
-        def fetch_snapshots():
-            if not k8s_api:
-                return []
+        pvcs = _fetch_all_pvcs()
+        for pvc in (pvcs.items if hasattr(pvcs, 'items') else []):
+            namespace = pvc.metadata.namespace
+            if namespace in SYSTEM_NAMESPACES:
+                continue
             
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='applicationsnapshots'
-                )
+            volume_name = pvc.spec.volume_name or 'Pending' if pvc.spec else 'Pending'
+            capacity = pvc.status.capacity.get('storage', 'Unknown') if pvc.status and pvc.status.capacity else 'Pending'
+            storage_class = pvc.spec.storage_class_name or 'default' if pvc.spec else 'default'
+            status = pvc.status.phase if pvc.status else 'Unknown'
             
-            try:
-                result = _fetch()
-                return result.get('items', [])
-            except ApiException as e:
-                print(f"Error fetching snapshots for stats: {e}")
-                return []
+            items.append({
+                'type': 'PVC',
+                'name': pvc.metadata.name,
+                'namespace': namespace,
+                'status': status,
+                'volume': volume_name,
+                'capacity': capacity,
+                'storageClass': storage_class,
+                'age': pvc.metadata.creation_timestamp.isoformat() if pvc.metadata.creation_timestamp else ''
+            })
         
-        # Fetch storage clusters
-        def fetch_clusters():
-            if not k8s_api:
-                return []
+        return items
+    except ApiException as e:
+        logger.error("Error fetching PVCs: %s", e)
+        return []
+
+
+def _fetch_resource_volume_snapshots():
+    """Fetch VolumeSnapshots for the resources view"""
+    if not k8s_api:
+        return []
+    
+    @with_auth_retry
+    def _fetch():
+        return k8s_api.list_cluster_custom_object(
+            group='snapshot.storage.k8s.io',
+            version='v1',
+            plural='volumesnapshots',
+            resource_version='0',
+            resource_version_match='NotOlderThan'
+        )
+    
+    try:
+        result = _fetch()
+        items = []
+        for item in result.get('items', []):
+            metadata = item.get('metadata', {})
+            spec = item.get('spec', {})
+            status = item.get('status', {})
             
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='storageclusters'
-                )
+            namespace = metadata.get('namespace', 'default')
+            if namespace in SYSTEM_NAMESPACES:
+                continue
             
-            try:
-                result = _fetch()
-                return result.get('items', [])
-            except ApiException as e:
-                print(f"Error fetching storage clusters for stats: {e}")
-                return []
+            ready_to_use = status.get('readyToUse', False)
+            state = 'Ready' if ready_to_use else 'Pending'
+            
+            items.append({
+                'type': 'VolumeSnapshot',
+                'name': metadata.get('name', 'Unknown'),
+                'namespace': namespace,
+                'created': metadata.get('creationTimestamp', ''),
+                'state': state,
+                'message': ''
+            })
+        return items
+    except ApiException as e:
+        logger.error("Error fetching volume snapshots: %s %s", e.status, e.reason)
+        return []
+    except Exception as e:
+        logger.error("Error fetching volume snapshots: %s", e)
+        return []
+
+
+def _fetch_resource_pvs():
+    """Fetch PersistentVolumes for the resources view"""
+    if not k8s_core_api:
+        return []
+    
+    items = []
+    try:
+        @with_auth_retry
+        def _fetch_all_pvs():
+            return k8s_core_api.list_persistent_volume(
+                resource_version='0',
+                resource_version_match='NotOlderThan'
+            )
         
-        # Fetch protection plans
-        def fetch_plans():
-            if not k8s_api:
-                return []
+        pvs = _fetch_all_pvs()
+        for pv in (pvs.items if hasattr(pvs, 'items') else []):
+            capacity = pv.spec.capacity.get('storage', 'Unknown') if pv.spec and pv.spec.capacity else 'Unknown'
+            access_modes = ','.join(pv.spec.access_modes) if pv.spec and pv.spec.access_modes else ''
+            reclaim_policy = pv.spec.persistent_volume_reclaim_policy or 'Unknown' if pv.spec else 'Unknown'
+            storage_class = pv.spec.storage_class_name or 'default' if pv.spec else 'default'
+            status = pv.status.phase if pv.status else 'Unknown'
             
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='protectionplans'
-                )
+            claim_name = pv.spec.claim_ref.name if pv.spec and pv.spec.claim_ref else '-'
             
-            try:
-                result = _fetch()
-                return result.get('items', [])
-            except ApiException as e:
-                print(f"Error fetching protection plans for stats: {e}")
-                return []
-        
-        applicationcrds = get_cached_or_fetch('applicationcrds', fetch_applicationcrds_stats)
-        snapshots = get_cached_or_fetch('snapshots', fetch_snapshots)
-        clusters = get_cached_or_fetch('storageclusters', fetch_clusters)
-        plans = get_cached_or_fetch('protectionplans', fetch_plans)
+            items.append({
+                'name': pv.metadata.name,
+                'capacity': capacity,
+                'accessModes': access_modes,
+                'reclaimPolicy': reclaim_policy,
+                'status': status,
+                'claim': claim_name,
+                'storageClass': storage_class,
+                'age': pv.metadata.creation_timestamp.isoformat() if pv.metadata.creation_timestamp else ''
+            })
         
-        return jsonify({
-            'applications': len(applicationcrds),
-            'snapshots': len(snapshots),
-            'storageClusters': len(clusters),
-            'protectionPlans': len(plans)
-        })
+        return items
+    except ApiException as e:
+        logger.error("Error fetching PVs: %s", e)
+        return []
+
+
+# Fetchers for the resources view, keyed by cache key. Kept at module level so the
+# background cache refresher can call them outside of a request.
+RESOURCE_FETCHERS = {
+    'applications:resources': _fetch_resource_applications,
+    'snapshots:resources': _fetch_resource_snapshots,
+    'protectionplans:resources': _fetch_resource_plans,
+    'storageclusters:resources': _fetch_resource_clusters,
+    'applicationsnapshotrestores': _fetch_resource_restores,
+    'persistentvolumeclaims': _fetch_resource_pvcs,
+    'persistentvolumes': _fetch_resource_pvs,
+    'volumesnapshots': _fetch_resource_volume_snapshots
+}
+
+# Shared pool so a cold resources view fetches every list at once instead of one after another
+_resource_executor = ThreadPoolExecutor(max_workers=len(RESOURCE_FETCHERS), thread_name_prefix='resources')
+
+
+# Seconds between stats stream checks when no watch event arrives (also the keep-alive interval)
+STATS_STREAM_TIMEOUT = Config.CACHE_TTL
+
+# Minimum seconds between stats stream events, so bursts of watch events send one update
+STATS_STREAM_MIN_INTERVAL = 1
+
+# Each open stats stream holds a worker thread, so cap them below the gthread pool size
+_stats_stream_slots = threading.BoundedSemaphore(Config.STATS_STREAM_MAX_CLIENTS)
+
+# Stat name -> (NDK plural, cache key of its fallback list)
+STAT_SOURCES = {
+    'applications': ('applications', 'applications:stats'),
+    'snapshots': ('applicationsnapshots', 'snapshots:stats'),
+    'storageClusters': ('storageclusters', 'storageclusters:stats'),
+    'protectionPlans': ('protectionplans', 'protectionplans:stats')
+}
+
+
+def _fetch_stat_items(plural):
+    """List an NDK custom resource in every namespace for the stats counts"""
+    if not k8s_api:
+        return []
+    
+    @with_auth_retry
+    def _fetch():
+        return list_custom_objects(plural)
+    
+    try:
+        return _fetch().get('items', [])
+    except ApiException as e:
+        logger.error("Error fetching %s for stats: %s", plural, e)
+        return []
+
+
+def _get_stat_counts():
+    """Count dashboard resources in every namespace, from the watch stores when in sync"""
+    counts = {}
+    for stat, (plural, cache_key) in STAT_SOURCES.items():
+        count = count_custom_objects(plural)
+        if count is None:
+            # Store not in sync (or watches disabled): count a cached, unfiltered list instead
+            count = len(get_cached_or_fetch(cache_key, partial(_fetch_stat_items, plural)))
+        counts[stat] = count
+    return counts
+
+
+@main_bp.route('/api/stats')
+@login_required
+def get_stats():
+    """Get dashboard statistics"""
+    try:
+        return jsonify(_get_stat_counts())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@main_bp.route('/api/stats/stream')
+@login_required
+def stream_stats():
+    """Push dashboard statistics as server-sent events whenever they change"""
+    if not _stats_stream_slots.acquire(blocking=False):
+        # EventSource gives up on a non-200 response; the page keeps its polled counts
+        return jsonify({'error': 'Too many open stats streams'}), 503
+    
+    def generate():
+        version = None
+        last_counts = None
+        while True:
+            version = wait_for_change(version, STATS_STREAM_TIMEOUT)
+            try:
+                counts = _get_stat_counts()
+            except Exception as e:
+                counts = {'error': str(e)}
+            if counts != last_counts:
+                last_counts = counts
+                yield f"data: {current_app.json.dumps(counts)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            time.sleep(STATS_STREAM_MIN_INTERVAL)
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    # The server closes the response even if the stream never started, so release the slot there
+    response.call_on_close(_stats_stream_slots.release)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx-style proxies from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @main_bp.route('/api/resources')
 @login_required
 def resources_api():
     """Get all NDK resources"""
     try:
-        def fetch_applicationcrds():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='applications'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    spec = item.get('spec', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    state = 'Unknown'
-                    conditions = status.get('conditions', [])
-                    for condition in conditions:
-                        if condition.get('type') == 'Active':
-                            state = 'Active' if condition.get('status') == 'True' else 'Inactive'
-                            break
-                        elif condition.get('type') == 'Ready':
-                            state = 'Ready' if condition.get('status') == 'True' else 'NotReady'
-                            break
-                    
-                    items.append({
-                        'type': 'Application',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': state,
-                        'message': status.get('message', '')
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching application CRDs: {e}")
-                return []
-        
-        def fetch_snapshots():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='applicationsnapshots'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    ready_to_use = status.get('readyToUse', False)
-                    if ready_to_use:
-                        state = 'Ready'
-                    elif 'readyToUse' in status:
-                        state = 'Not Ready'
-                    else:
-                        state = 'Unknown'
-                    
-                    items.append({
-                        'type': 'ApplicationSnapshot',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': state,
-                        'message': status.get('message', '')
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching snapshots: {e}")
-                return []
-        
-        def fetch_plans():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='protectionplans'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    spec = item.get('spec', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    items.append({
-                        'type': 'ProtectionPlan',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': 'Ready',
-                        'message': ''
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching protection plans: {e}")
-                return []
-        
-        def fetch_clusters():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='storageclusters'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    state = 'Unknown'
-                    
-                    available = status.get('available', False)
-                    if available:
-                        state = 'Ready'
-                    else:
-                        state = 'Not Ready'
-                    
-                    items.append({
-                        'type': 'StorageCluster',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': state,
-                        'message': status.get('message', '')
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching storage clusters: {e}")
-                return []
-        
-        def fetch_restores():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    plural='applicationsnapshotrestores'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    spec = item.get('spec', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    is_completed = status.get('completed', False)
-                    conditions = status.get('conditions', [])
-                    state = 'Unknown'
-                    
-                    if is_completed:
-                        failed = False
-                        for condition in conditions:
-                            if condition.get('type') == 'Failed' and condition.get('status') == 'True':
-                                state = 'Failed'
-                                failed = True
-                                break
-                        
-                        if not failed:
-                            for condition in conditions:
-                                if condition.get('type') == 'ApplicationRestoreFinalised':
-                                    if condition.get('status') == 'True':
-                                        state = 'Successful'
-                                    break
-                            if state == 'Unknown':
-                                state = 'Successful'
-                    else:
-                        state = 'InProgress'
-                    
-                    snapshot_ref = spec.get('snapshotName', '')
-                    
-                    items.append({
-                        'type': 'ApplicationSnapshotRestore',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'snapshot': snapshot_ref,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': state,
-                        'message': ''
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching application snapshot restores: {e}")
-                return []
-        
-        def fetch_pvcs():
-            if not k8s_core_api:
-                return []
-            
-            items = []
-            try:
-                @with_auth_retry
-                def _fetch_all_pvcs():
-                    return k8s_core_api.list_persistent_volume_claim_for_all_namespaces()
-                
-                pvcs = _fetch_all_pvcs()
-                for pvc in (pvcs.items if hasattr(pvcs, 'items') else []):
-                    namespace = pvc.metadata.namespace
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    volume_name = pvc.spec.volume_name or 'Pending' if pvc.spec else 'Pending'
-                    capacity = pvc.status.capacity.get('storage', 'Unknown') if pvc.status and pvc.status.capacity else 'Pending'
-                    storage_class = pvc.spec.storage_class_name or 'default' if pvc.spec else 'default'
-                    status = pvc.status.phase if pvc.status else 'Unknown'
-                    
-                    items.append({
-                        'type': 'PVC',
-                        'name': pvc.metadata.name,
-                        'namespace': namespace,
-                        'status': status,
-                        'volume': volume_name,
-                        'capacity': capacity,
-                        'storageClass': storage_class,
-                        'age': pvc.metadata.creation_timestamp.isoformat() if pvc.metadata.creation_timestamp else ''
-                    })
-                
-                return items
-            except ApiException as e:
-                print(f"Error fetching PVCs: {e}")
-                return []
-        
-        def fetch_volume_snapshots():
-            if not k8s_api:
-                return []
-            
-            @with_auth_retry
-            def _fetch():
-                return k8s_api.list_cluster_custom_object(
-                    group='snapshot.storage.k8s.io',
-                    version='v1',
-                    plural='volumesnapshots'
-                )
-            
-            try:
-                result = _fetch()
-                items = []
-                for item in result.get('items', []):
-                    metadata = item.get('metadata', {})
-                    spec = item.get('spec', {})
-                    status = item.get('status', {})
-                    
-                    namespace = metadata.get('namespace', 'default')
-                    if namespace in ['kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system']:
-                        continue
-                    
-                    ready_to_use = status.get('readyToUse', False)
-                    state = 'Ready' if ready_to_use else 'Pending'
-                    
-                    items.append({
-                        'type': 'VolumeSnapshot',
-                        'name': metadata.get('name', 'Unknown'),
-                        'namespace': namespace,
-                        'created': metadata.get('creationTimestamp', ''),
-                        'state': state,
-                        'message': ''
-                    })
-                return items
-            except ApiException as e:
-                print(f"Error fetching volume snapshots: {e.status} {e.reason}")
-                return []
-            except Exception as e:
-                print(f"Error fetching volume snapshots: {e}")
-                return []
-        
-        def fetch_pvs():
-            if not k8s_core_api:
-                return []
-            
-            items = []
-            try:
-                @with_auth_retry
-                def _fetch_all_pvs():
-                    return k8s_core_api.list_persistent_volume()
-                
-                pvs = _fetch_all_pvs()
-                for pv in (pvs.items if hasattr(pvs, 'items') else []):
-                    capacity = pv.spec.capacity.get('storage', 'Unknown') if pv.spec and pv.spec.capacity else 'Unknown'
-                    access_modes = ','.join(pv.spec.access_modes) if pv.spec and pv.spec.access_modes else ''
-                    reclaim_policy = pv.spec.persistent_volume_reclaim_policy or 'Unknown' if pv.spec else 'Unknown'
-                    storage_class = pv.spec.storage_class_name or 'default' if pv.spec else 'default'
-                    status = pv.status.phase if pv.status else 'Unknown'
-                    
-                    claim_name = pv.spec.claim_ref.name if pv.spec and pv.spec.claim_ref else '-'
-                    
-                    items.append({
-                        'name': pv.metadata.name,
-                        'capacity': capacity,
-                        'accessModes': access_modes,
-                        'reclaimPolicy': reclaim_policy,
-                        'status': status,
-                        'claim': claim_name,
-                        'storageClass': storage_class,
-                        'age': pv.metadata.creation_timestamp.isoformat() if pv.metadata.creation_timestamp else ''
-                    })
-                
-                return items
-            except ApiException as e:
-                print(f"Error fetching PVs: {e}")
-                return []
-        
-        applicationcrds = get_cached_or_fetch('applicationcrds', fetch_applicationcrds)
-        snapshots = get_cached_or_fetch('snapshots', fetch_snapshots)
-        plans = get_cached_or_fetch('protectionplans', fetch_plans)
-        clusters = get_cached_or_fetch('storageclusters', fetch_clusters)
-        restores = get_cached_or_fetch('applicationsnapshotrestores', fetch_restores)
-        pvcs = get_cached_or_fetch('persistentvolumeclaims', fetch_pvcs)
-        pvs = get_cached_or_fetch('persistentvolumes', fetch_pvs)
-        volume_snapshots = get_cached_or_fetch('volumesnapshots', fetch_volume_snapshots)
+        futures = {
+            cache_key: _resource_executor.submit(get_cached_or_fetch, cache_key, fetch_function)
+            for cache_key, fetch_function in RESOURCE_FETCHERS.items()
+        }
         
         return jsonify({
-            'applicationCRDs': applicationcrds,
-            'snapshots': snapshots,
-            'protectionPlans': plans,
-            'storageClusters': clusters,
-            'applicationSnapshotRestores': restores,
-            'persistentVolumeClaims': pvcs,
-            'persistentVolumes': pvs,
-            'volumeSnapshots': volume_snapshots
+            'applicationCRDs': futures['applications:resources'].result(),
+            'snapshots': futures['snapshots:resources'].result(),
+            'protectionPlans': futures['protectionplans:resources'].result(),
+            'storageClusters': futures['storageclusters:resources'].result(),
+            'applicationSnapshotRestores': futures['applicationsnapshotrestores'].result(),
+            'persistentVolumeClaims': futures['persistentvolumeclaims'].result(),
+            'persistentVolumes': futures['persistentvolumes'].result(),
+            'volumeSnapshots': futures['volumesnapshots'].result()
         })
     except Exception as e:
-        print(f"Error in resources_api: {e}")
+        logger.error("Error in resources_api: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1017,7 +1004,6 @@ def get_deployments():
 @main_bp.route('/api/protectionplans/<namespace>/<name>/applications', methods=['GET'])
 def get_protection_plan_applications(namespace, name):
     try:
-        from app.services.protection_plans import ProtectionPlanService
         plan = ProtectionPlanService.get_protection_plan(namespace, name)
         
         applications = plan.get('applications', [])
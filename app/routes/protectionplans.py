@@ -1,17 +1,25 @@
 """
 Protection Plans routes - API endpoints for NDK Protection Plans
 """
+import logging
 from flask import Blueprint, jsonify, request
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes.client.rest import ApiException
-from datetime import datetime
-import json
-from app.utils import login_required, get_cached_or_fetch, invalidate_cache
+import secrets
+import time
+from app.utils import login_required, get_cached_or_fetch, invalidate_cache, api_error_response
 from app.services import ProtectionPlanService
 from app.extensions import k8s_api
+from app.utils.watch import list_custom_objects, get_custom_object, list_plan_snapshots
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 protectionplans_bp = Blueprint('protectionplans', __name__)
 
+# Upper bound on concurrent snapshot creates when triggering a plan
+TRIGGER_SNAPSHOT_WORKERS = 16
+
 
 @protectionplans_bp.route('/protectionplans', methods=['GET', 'POST'])
 @login_required
@@ -52,14 +60,7 @@ def manage_protectionplans():
             }), 201
             
         except ApiException as e:
-            error_msg = f"Failed to create protection plan: {e.reason}"
-            if e.body:
-                try:
-                    error_body = json.loads(e.body)
-                    error_msg = error_body.get('message', error_msg)
-                except:
-                    pass
-            return jsonify({'error': error_msg}), e.status
+            return api_error_response(e, f"Failed to create protection plan: {e.reason}")
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
@@ -101,28 +102,21 @@ def manage_protection_plan(namespace, name):
 def trigger_protection_plan(namespace, name):
     """Manually trigger a protection plan to create a snapshot now"""
     try:
-        print(f"\n=== Triggering Protection Plan: {name} in namespace {namespace} ===")
+        logger.info("=== Triggering Protection Plan: %s in namespace %s ===", name, namespace)
         
         if not k8s_api:
             return jsonify({'error': 'Kubernetes API not available'}), 503
         
         # Get the protection plan to extract retention policy
-        plan = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='protectionplans',
-            name=name
-        )
+        plan = get_custom_object('protectionplans', namespace, name)
         
         spec = plan.get('spec', {})
         retention_policy = spec.get('retentionPolicy', {})
         metadata = plan.get('metadata', {})
         annotations = metadata.get('annotations', {})
         
-        import sys
-        print(f"DEBUG: Plan metadata: {metadata}", file=sys.stderr, flush=True)
-        print(f"DEBUG: Annotations: {annotations}", file=sys.stderr, flush=True)
+        logger.debug("Plan metadata: %s", metadata)
+        logger.debug("Annotations: %s", annotations)
         
         # Convert retention to expiresAfter format
         # Check for time-based retention in annotations first
@@ -135,7 +129,7 @@ def trigger_protection_plan(namespace, name):
         
         # Determine selection mode from annotations
         selection_mode = annotations.get('ndk-dashboard/selection-mode', 'by-name')
-        print(f"  Selection mode: {selection_mode}")
+        logger.info("  Selection mode: %s", selection_mode)
         
         # Find applications protected by this plan
         # Use a set to track unique app+namespace combinations to avoid duplicates
@@ -152,41 +146,33 @@ def trigger_protection_plan(namespace, name):
                     'error': f'Protection plan is configured for label-based selection but label selector is missing'
                 }), 400
             
-            print(f"  Using label selector: {label_key}={label_value}")
+            logger.info("  Using label selector: %s=%s", label_key, label_value)
             
-            # Get all applications in the namespace
+            # Let the API server select applications with the matching label
             applications = k8s_api.list_namespaced_custom_object(
                 group=Config.NDK_API_GROUP,
                 version=Config.NDK_API_VERSION,
                 namespace=namespace,
-                plural='applications'
+                plural='applications',
+                label_selector=f'{label_key}={label_value}'
             )
             
-            # Filter applications by label
             for app in applications.get('items', []):
                 app_metadata = app.get('metadata', {})
-                app_labels = app_metadata.get('labels', {})
                 app_name = app_metadata.get('name')
                 app_namespace = app_metadata.get('namespace')
                 
-                # Check if application has matching label
-                if app_labels.get(label_key) == label_value:
-                    app_key = f"{app_namespace}/{app_name}"
-                    if app_key not in seen_apps:
-                        seen_apps.add(app_key)
-                        protected_apps.append({
-                            'name': app_name,
-                            'namespace': app_namespace
-                        })
-                        print(f"  Found matching app: {app_name} in namespace {app_namespace}")
+                app_key = f"{app_namespace}/{app_name}"
+                if app_key not in seen_apps:
+                    seen_apps.add(app_key)
+                    protected_apps.append({
+                        'name': app_name,
+                        'namespace': app_namespace
+                    })
+                    logger.info("  Found matching app: %s in namespace %s", app_name, app_namespace)
         else:
             # By-name selection: use AppProtectionPlan resources
-            app_protection_plans = k8s_api.list_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='appprotectionplans'
-            )
+            app_protection_plans = list_custom_objects('appprotectionplans', namespace=namespace)
             
             for app_plan in app_protection_plans.get('items', []):
                 app_plan_spec = app_plan.get('spec', {})
@@ -207,9 +193,9 @@ def trigger_protection_plan(namespace, name):
                                 'name': app_name,
                                 'namespace': app_namespace
                             })
-                            print(f"  Found protected app: {app_name} in namespace {app_namespace}")
+                            logger.info("  Found protected app: %s in namespace %s", app_name, app_namespace)
                         else:
-                            print(f"  Skipping duplicate: {app_name} in namespace {app_namespace}")
+                            logger.info("  Skipping duplicate: %s in namespace %s", app_name, app_namespace)
         
         if not protected_apps:
             if selection_mode == 'by-label':
@@ -224,15 +210,17 @@ def trigger_protection_plan(namespace, name):
                 }), 404
         
         # Create snapshots for protected applications
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        # UTC time plus a random suffix so triggers in the same second don't collide (409)
+        snapshot_suffix = f"{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}-{secrets.token_hex(2)}"
         created_snapshots = []
         failed_snapshots = []
         
+        snapshot_jobs = []
         for app in protected_apps:
-            snapshot_name = f"{app['name']}-{name}-{timestamp}"
+            snapshot_name = f"{app['name']}-{name}-{snapshot_suffix}"
             
             snapshot_manifest = {
-                'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+                'apiVersion': Config.NDK_API_GROUP_VERSION,
                 'kind': 'ApplicationSnapshot',
                 'metadata': {
                     'name': snapshot_name,
@@ -252,20 +240,31 @@ def trigger_protection_plan(namespace, name):
                 }
             }
             
-            try:
-                k8s_api.create_namespaced_custom_object(
+            snapshot_jobs.append((app, snapshot_name, snapshot_manifest))
+        
+        # Creates are independent, so issue them concurrently and collect results here
+        with ThreadPoolExecutor(max_workers=min(TRIGGER_SNAPSHOT_WORKERS, len(snapshot_jobs))) as executor:
+            futures = [
+                (executor.submit(
+                    k8s_api.create_namespaced_custom_object,
                     group=Config.NDK_API_GROUP,
                     version=Config.NDK_API_VERSION,
                     namespace=app['namespace'],
                     plural='applicationsnapshots',
                     body=snapshot_manifest
-                )
-                created_snapshots.append(f"{app['name']} ({app['namespace']})")
-                print(f"✓ Created snapshot {snapshot_name} for {app['name']} in {app['namespace']}")
-            except Exception as e:
-                error_msg = f"{app['name']} ({app['namespace']}): {str(e)}"
-                failed_snapshots.append(error_msg)
-                print(f"✗ Failed to create snapshot for {app['name']}: {e}")
+                ), app, snapshot_name)
+                for app, snapshot_name, snapshot_manifest in snapshot_jobs
+            ]
+            
+            for future, app, snapshot_name in futures:
+                try:
+                    future.result()
+                    created_snapshots.append(f"{app['name']} ({app['namespace']})")
+                    logger.info("✓ Created snapshot %s for %s in %s", snapshot_name, app['name'], app['namespace'])
+                except Exception as e:
+                    error_msg = f"{app['name']} ({app['namespace']}): {str(e)}"
+                    failed_snapshots.append(error_msg)
+                    logger.error("✗ Failed to create snapshot for %s: %s", app['name'], e)
         
         # Invalidate caches
         invalidate_cache('snapshots', 'protectionplans')
@@ -298,13 +297,7 @@ def get_protection_plan_applications(namespace, name):
             return jsonify({'error': 'Kubernetes API not available'}), 503
         
         # Get the protection plan to extract selection mode
-        plan = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='protectionplans',
-            name=name
-        )
+        plan = get_custom_object('protectionplans', namespace, name)
         
         metadata = plan.get('metadata', {})
         annotations = metadata.get('annotations', {})
@@ -319,37 +312,30 @@ def get_protection_plan_applications(namespace, name):
             label_value = annotations.get('ndk-dashboard/label-selector-value')
             
             if label_key and label_value:
-                # Get all applications in the namespace
+                # Let the API server select applications with the matching label
                 applications = k8s_api.list_namespaced_custom_object(
                     group=Config.NDK_API_GROUP,
                     version=Config.NDK_API_VERSION,
                     namespace=namespace,
-                    plural='applications'
+                    plural='applications',
+                    label_selector=f'{label_key}={label_value}'
                 )
                 
-                # Filter applications by label
                 for app in applications.get('items', []):
                     app_metadata = app.get('metadata', {})
-                    app_labels = app_metadata.get('labels', {})
                     app_name = app_metadata.get('name')
                     app_namespace = app_metadata.get('namespace')
                     
-                    if app_labels.get(label_key) == label_value:
-                        app_key = f"{app_namespace}/{app_name}"
-                        if app_key not in seen_apps:
-                            seen_apps.add(app_key)
-                            protected_apps.append({
-                                'name': app_name,
-                                'namespace': app_namespace
-                            })
+                    app_key = f"{app_namespace}/{app_name}"
+                    if app_key not in seen_apps:
+                        seen_apps.add(app_key)
+                        protected_apps.append({
+                            'name': app_name,
+                            'namespace': app_namespace
+                        })
         else:
             # By-name selection: use AppProtectionPlan resources
-            app_protection_plans = k8s_api.list_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='appprotectionplans'
-            )
+            app_protection_plans = list_custom_objects('appprotectionplans', namespace=namespace)
             
             for app_plan in app_protection_plans.get('items', []):
                 app_plan_spec = app_plan.get('spec', {})
@@ -390,36 +376,23 @@ def get_protection_plan_history(namespace, name):
         if not k8s_api:
             return jsonify({'error': 'Kubernetes API not available'}), 503
         
-        # Get all snapshots with the protection plan label
-        # NDK uses the full domain prefix for protection plan labels
-        result = k8s_api.list_cluster_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            plural='applicationsnapshots',
-            label_selector=f'dataservices.nutanix.com/protection-plan={name}'
-        )
-        
+        # Already sorted by creation time (newest first)
         snapshots = []
-        for item in result.get('items', []):
+        for item in list_plan_snapshots(namespace, name):
             metadata = item.get('metadata', {})
             spec = item.get('spec', {})
             status = item.get('status', {})
             
-            # Only include snapshots from the same namespace
-            if metadata.get('namespace') == namespace:
-                ready_to_use = status.get('readyToUse', False)
-                state = 'Ready' if ready_to_use else 'Creating'
-                
-                snapshots.append({
-                    'name': metadata.get('name', 'Unknown'),
-                    'namespace': metadata.get('namespace', 'default'),
-                    'created': metadata.get('creationTimestamp', ''),
-                    'expiresAfter': spec.get('expiresAfter', 'Not set'),
-                    'state': state
-                })
-        
-        # Sort by creation time (newest first)
-        snapshots.sort(key=lambda x: x['created'], reverse=True)
+            ready_to_use = status.get('readyToUse', False)
+            state = 'Ready' if ready_to_use else 'Creating'
+            
+            snapshots.append({
+                'name': metadata.get('name', 'Unknown'),
+                'namespace': metadata.get('namespace', 'default'),
+                'created': metadata.get('creationTimestamp', ''),
+                'expiresAfter': spec.get('expiresAfter', 'Not set'),
+                'state': state
+            })
         
         return jsonify(snapshots), 200
         
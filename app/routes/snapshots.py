@@ -1,11 +1,14 @@
 """
 Snapshot routes - API endpoints for NDK Application Snapshots
 """
+import logging
 from flask import Blueprint, jsonify, request
 from kubernetes.client.rest import ApiException
-import json
-from app.utils import login_required, get_cached_or_fetch, invalidate_cache
+from app.utils import login_required, get_cached_or_fetch, invalidate_cache, api_error_message, api_error_response
 from app.services import SnapshotService
+from app.utils.json_provider import stream_json_list
+
+logger = logging.getLogger(__name__)
 
 snapshots_bp = Blueprint('snapshots', __name__)
 
@@ -38,20 +41,13 @@ def manage_snapshots():
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         except ApiException as e:
-            error_msg = f"Failed to create snapshot: {e.reason}"
-            if e.body:
-                try:
-                    error_body = json.loads(e.body)
-                    error_msg = error_body.get('message', error_msg)
-                except:
-                    pass
-            return jsonify({'error': error_msg}), e.status
+            return api_error_response(e, f"Failed to create snapshot: {e.reason}")
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
     # GET request - list snapshots
     snapshots = get_cached_or_fetch('snapshots', SnapshotService.list_snapshots)
-    return jsonify(snapshots)
+    return stream_json_list(snapshots)
 
 
 @snapshots_bp.route('/snapshots/<namespace>/<name>', methods=['DELETE'])
@@ -101,17 +97,11 @@ def restore_snapshot(namespace, name):
         }), 201
         
     except ApiException as e:
-        error_msg = f"{e.reason}"
+        error_msg = api_error_message(e)
+        # Log full error for debugging
+        logger.error("✗ Restore API error: %s", error_msg)
         if e.body:
-            try:
-                error_body = json.loads(e.body)
-                error_msg = error_body.get('message', error_msg)
-                # Log full error for debugging
-                print(f"✗ Restore API error: {error_msg}")
-                print(f"✗ Full error body: {e.body}")
-            except Exception as parse_error:
-                print(f"✗ Could not parse error body: {parse_error}")
-                pass
+            logger.error("✗ Full error body: %s", e.body)
         return jsonify({'error': error_msg}), e.status
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -125,14 +115,7 @@ def get_restore_status(namespace, restore_name):
         status_info = SnapshotService.get_restore_status(namespace, restore_name)
         return jsonify(status_info), 200
     except ApiException as e:
-        error_msg = f"Failed to get restore status: {e.reason}"
-        if e.body:
-            try:
-                error_body = json.loads(e.body)
-                error_msg = error_body.get('message', error_msg)
-            except:
-                pass
-        return jsonify({'error': error_msg}), e.status
+        return api_error_response(e, f"Failed to get restore status: {e.reason}")
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -0,0 +1,18 @@
+"""
+Task routes - API endpoints for polling background tasks
+"""
+from flask import Blueprint, jsonify
+from app.utils import login_required
+from app.utils.tasks import get_task
+
+tasks_bp = Blueprint('tasks', __name__)
+
+
+@tasks_bp.route('/tasks/<task_id>', methods=['GET'])
+@login_required
+def get_task_status(task_id):
+    """Get the status and progress log of a background task"""
+    task = get_task(task_id)
+    if task is None:
+        return jsonify({'error': f'Task {task_id} not found'}), 404
+    return jsonify(task)
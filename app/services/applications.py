@@ -1,21 +1,52 @@
 """
 Application service - Business logic for NDK Applications
 """
+import json
 import time
-import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes.client.rest import ApiException
 from config import Config
 from app.services.protection_plans import ProtectionPlanService
 from app.extensions import k8s_api, k8s_core_api, k8s_apps_api, with_auth_retry
-from app.utils.labels import filter_system_label_prefixes, filter_system_labels, preserve_system_labels
+from app.utils.labels import filter_system_label_prefixes, preserve_system_labels
+from app.utils.pagination import paged_list
+from app.utils.watch import (
+    list_custom_objects, get_custom_object, list_core_objects, get_persistent_volumes, wait_for_change
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent deletes while cleaning up an application
+DELETE_WORKERS = 16
+
 # System namespaces to exclude
-SYSTEM_NAMESPACES = {
+SYSTEM_NAMESPACES = frozenset({
     'kube-system', 'kube-public', 'kube-node-lease', 'ntnx-system'
-}
+})
+
+# Labels kept when the user replaces an application's labels
+PRESERVED_LABEL_PREFIXES = ('app.kubernetes.io/', 'kubernetes.io/', 'k8s.io/', 'helm.sh/', 'kubectl.kubernetes.io/')
+
+
+def _read_raw(read_function, name, namespace):
+    """Read a namespaced object as a dict, skipping the client's model deserialization"""
+    response = read_function(name, namespace, _preload_content=False)
+    try:
+        return json.loads(response.data)
+    finally:
+        response.release_conn()
+
+
+def _raw_list(list_function):
+    """Wrap a typed client list method so pages come back as dicts, skipping model deserialization"""
+    def list_raw(**kwargs):
+        response = list_function(_preload_content=False, **kwargs)
+        try:
+            return json.loads(response.data)
+        finally:
+            response.release_conn()
+    return list_raw
 
 
 class ApplicationService:
@@ -31,15 +62,12 @@ class ApplicationService:
         try:
             ProtectionPlanService.reconcile_label_based_apps()
         except Exception as e:
-            logger.warning(f"Failed to reconcile label-based protection plans in list_applications: {e}")
+            logger.warning("Failed to reconcile label-based protection plans in list_applications: %s", e)
         
         @with_auth_retry
         def _fetch_applications():
-            return k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='applications'
-            )
+            # System namespaces are excluded at the source rather than skipped below
+            return list_custom_objects('applications', exclude_namespaces=SYSTEM_NAMESPACES)
         
         try:
             result = _fetch_applications()
@@ -55,10 +83,6 @@ class ApplicationService:
                 namespace = metadata.get('namespace', 'default')
                 all_namespaces.add(namespace)
                 
-                # Skip system namespaces
-                if namespace in SYSTEM_NAMESPACES:
-                    continue
-                
                 # Extract state from conditions
                 state, message = ApplicationService._extract_state(status, namespace, metadata.get('name', 'Unknown'))
                 
@@ -77,13 +101,13 @@ class ApplicationService:
                     'labels': user_labels
                 })
             
-            print(f"✓ Found {len(applications)} applications across {len(all_namespaces)} namespaces")
-            print(f"  All namespaces: {sorted(all_namespaces)}")
-            print(f"  Non-system apps: {len(applications)}")
+            logger.debug("Found %d applications across %d namespaces", len(applications), len(all_namespaces))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("All namespaces: %s", sorted(all_namespaces))
             
             return applications
         except ApiException as e:
-            print(f"✗ Error fetching applications: {e}")
+            logger.error("Error fetching applications: %s", e)
             return []
     
     @staticmethod
@@ -94,13 +118,8 @@ class ApplicationService:
         
         @with_auth_retry
         def _fetch_application():
-            return k8s_api.get_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applications',
-                name=name
-            )
+            # Served from the watch store, so repeated lookups don't hit the API server
+            return get_custom_object('applications', namespace, name)
         
         try:
             result = _fetch_application()
@@ -109,7 +128,8 @@ class ApplicationService:
             labels = metadata.get('labels', {})
             
             # Filter out system labels
-            filtered_labels = filter_system_labels(labels)
+            # Same filtering as the application list
+            filtered_labels = filter_system_label_prefixes(labels)
             
             return {
                 'name': metadata.get('name'),
@@ -133,12 +153,8 @@ class ApplicationService:
         try:
             # Look for ApplicationSnapshotRestore CRDs for this application
             # The restore CRD name pattern is typically: {app-name}-restore-{timestamp}
-            restore_list = k8s_api.list_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applicationsnapshotrestores'
-            )
+            # Served from the watch store, so frequent progress polls don't re-list
+            restore_list = list_custom_objects('applicationsnapshotrestores', namespace=namespace)
             
             # Find the most recent restore for this application
             restore_crd = None
@@ -156,13 +172,7 @@ class ApplicationService:
             # If no restore CRD found, check if the Application exists and is Ready
             # (restore might have completed and CRD was cleaned up)
             try:
-                app = k8s_api.get_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=namespace,
-                    plural='applications',
-                    name=name
-                )
+                app = get_custom_object('applications', namespace, name)
                 
                 # Check if app is Ready
                 status = app.get('status', {})
@@ -262,7 +272,7 @@ class ApplicationService:
         volumes_restored = False
         restore_finalised = False
         
-        logger.info(f"Restore status for {name}: conditions={conditions}")
+        logger.info("Restore status for %s: conditions=%s", name, conditions)
         
         # Check each condition type
         for condition in conditions:
@@ -331,7 +341,7 @@ class ApplicationService:
             progress = 10
             stage = 'Initializing'
         
-        logger.info(f"Restore progress for {name}: prechecks={prechecks_passed}, vol_submit={volume_restore_submitted}, config={config_restored}, vol_restored={volumes_restored}, finalised={restore_finalised}, progress={progress}, stage={stage}")
+        logger.info("Restore progress for %s: prechecks=%s, vol_submit=%s, config=%s, vol_restored=%s, finalised=%s, progress=%s, stage=%s", name, prechecks_passed, volume_restore_submitted, config_restored, volumes_restored, restore_finalised, progress, stage)
         
         return {
             'is_restore': True,
@@ -346,7 +356,7 @@ class ApplicationService:
         }
     
     @staticmethod
-    def delete_application(namespace, name, force=False, app_only=False):
+    def delete_application(namespace, name, force=False, app_only=False, cleanup_log=None):
         """
         Delete an NDK Application and optionally its resources
         
@@ -355,6 +365,7 @@ class ApplicationService:
             name: Application name
             force: Force delete by removing finalizers
             app_only: Only delete the Application CRD, preserve snapshots and data
+            cleanup_log: List to append progress messages to as cleanup runs (optional)
             
         Returns:
             tuple: (success_message, cleanup_log)
@@ -362,11 +373,12 @@ class ApplicationService:
         if not k8s_api:
             raise Exception('Kubernetes API not available')
         
-        cleanup_log = []
+        if cleanup_log is None:
+            cleanup_log = []
         
         # If app_only mode, delete workloads and PVCs but preserve snapshots
         if app_only:
-            print(f"🔄 Preparing for restore: deleting workloads & PVCs (preserving snapshots): {namespace}/{name}")
+            logger.info("🔄 Preparing for restore: deleting workloads & PVCs (preserving snapshots): %s/%s", namespace, name)
             
             # Get the application to retrieve its selector
             try:
@@ -385,113 +397,8 @@ class ApplicationService:
                 
                 cleanup_log.append(f"Using selector: {label_selector}")
                 
-                # Step 1: Delete StatefulSets
-                if k8s_apps_api:
-                    try:
-                        statefulsets = k8s_apps_api.list_namespaced_stateful_set(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for sts in statefulsets.items:
-                            k8s_apps_api.delete_namespaced_stateful_set(
-                                name=sts.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted StatefulSet: {sts.metadata.name}")
-                            print(f"✓ Deleted StatefulSet: {sts.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting StatefulSets: {e.reason}")
-                
-                # Step 2: Delete Deployments
-                if k8s_apps_api:
-                    try:
-                        deployments = k8s_apps_api.list_namespaced_deployment(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for deploy in deployments.items:
-                            k8s_apps_api.delete_namespaced_deployment(
-                                name=deploy.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted Deployment: {deploy.metadata.name}")
-                            print(f"✓ Deleted Deployment: {deploy.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting Deployments: {e.reason}")
-                
-                # Step 3: Delete Services
-                if k8s_core_api:
-                    try:
-                        services = k8s_core_api.list_namespaced_service(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for svc in services.items:
-                            k8s_core_api.delete_namespaced_service(
-                                name=svc.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted Service: {svc.metadata.name}")
-                            print(f"✓ Deleted Service: {svc.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting Services: {e.reason}")
-                
-                # Step 4: Delete ConfigMaps
-                if k8s_core_api:
-                    try:
-                        configmaps = k8s_core_api.list_namespaced_config_map(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for cm in configmaps.items:
-                            k8s_core_api.delete_namespaced_config_map(
-                                name=cm.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted ConfigMap: {cm.metadata.name}")
-                            print(f"✓ Deleted ConfigMap: {cm.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting ConfigMaps: {e.reason}")
-                
-                # Step 5: Delete Secrets
-                if k8s_core_api:
-                    try:
-                        secrets = k8s_core_api.list_namespaced_secret(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for secret in secrets.items:
-                            k8s_core_api.delete_namespaced_secret(
-                                name=secret.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted Secret: {secret.metadata.name}")
-                            print(f"✓ Deleted Secret: {secret.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting Secrets: {e.reason}")
-                
-                # Step 6: Delete PVCs
-                if k8s_core_api:
-                    try:
-                        pvcs = k8s_core_api.list_namespaced_persistent_volume_claim(
-                            namespace=namespace,
-                            label_selector=label_selector
-                        )
-                        for pvc in pvcs.items:
-                            k8s_core_api.delete_namespaced_persistent_volume_claim(
-                                name=pvc.metadata.name,
-                                namespace=namespace
-                            )
-                            cleanup_log.append(f"✓ Deleted PVC: {pvc.metadata.name}")
-                            print(f"✓ Deleted PVC: {pvc.metadata.name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Error deleting PVCs: {e.reason}")
+                # Steps 1-6: Delete StatefulSets, Deployments, Services, ConfigMaps, Secrets and PVCs
+                ApplicationService._delete_workload_resources(namespace, label_selector, False, cleanup_log)
                 
                 # Step 7: Remove finalizers from Application if present
                 if app.get('metadata', {}).get('finalizers'):
@@ -519,7 +426,7 @@ class ApplicationService:
                     name=name
                 )
                 cleanup_log.append(f"✓ Deleted Application CRD: {name}")
-                print(f"✓ Deleted Application CRD: {name}")
+                logger.info("✓ Deleted Application CRD: %s", name)
             except ApiException as e:
                 if e.status != 404:
                     cleanup_log.append(f"Warning: Could not delete Application CRD: {e.reason}")
@@ -527,20 +434,35 @@ class ApplicationService:
             cleanup_log.append("✓ Preserved all snapshots")
             cleanup_log.append("✓ Preserved protection plans")
             
-            print(f"✓ Application prepared for restore: {namespace}/{name}")
+            logger.info("✓ Application prepared for restore: %s/%s", namespace, name)
             
             return 'Application prepared for restore (workloads & PVCs deleted, snapshots preserved)', cleanup_log
         
         # Full deletion with cleanup
-        # Step 1: Delete all snapshots
-        deleted_snapshots = ApplicationService._delete_application_snapshots(
-            namespace, name, force, cleanup_log
-        )
+        # Fetch the Application once: its selector and finalizers drive Steps 4 and 5
+        app = None
+        try:
+            app = k8s_api.get_namespaced_custom_object(
+                group=Config.NDK_API_GROUP,
+                version=Config.NDK_API_VERSION,
+                namespace=namespace,
+                plural='applications',
+                name=name
+            )
+        except ApiException as e:
+            if e.status != 404:
+                cleanup_log.append(f"Warning: Could not process application resources: {e.reason}")
         
-        # Step 2: Delete AppProtectionPlans
-        deleted_app_plans = ApplicationService._delete_app_protection_plans(
-            namespace, name, force, cleanup_log
-        )
+        # Steps 1-2: Delete all snapshots and AppProtectionPlans (independent of each other)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            snapshots_future = executor.submit(
+                ApplicationService._delete_application_snapshots, namespace, name, force, cleanup_log
+            )
+            app_plans_future = executor.submit(
+                ApplicationService._delete_app_protection_plans, namespace, name, force, cleanup_log
+            )
+            deleted_snapshots = snapshots_future.result()
+            deleted_app_plans = app_plans_future.result()
         
         # Step 3: Wait for snapshots to be deleted
         if deleted_snapshots > 0:
@@ -549,15 +471,7 @@ class ApplicationService:
             )
         
         # Step 4: Delete Kubernetes resources (StatefulSets, Deployments, Services, PVCs, ConfigMaps, Secrets)
-        try:
-            app = k8s_api.get_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applications',
-                name=name
-            )
-            
+        if app is not None:
             # Get application selector
             spec = app.get('spec', {})
             app_selector = spec.get('applicationSelector', {})
@@ -565,182 +479,32 @@ class ApplicationService:
             
             cleanup_log.append(f"Using selector: {label_selector}")
             
-            # Delete StatefulSets
-            if k8s_apps_api:
-                try:
-                    statefulsets = k8s_apps_api.list_namespaced_stateful_set(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for sts in statefulsets.items:
-                        k8s_apps_api.delete_namespaced_stateful_set(
-                            name=sts.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted StatefulSet: {sts.metadata.name}")
-                        print(f"✓ Deleted StatefulSet: {sts.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting StatefulSets: {e.reason}")
-            
-            # Delete Deployments
-            if k8s_apps_api:
-                try:
-                    deployments = k8s_apps_api.list_namespaced_deployment(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for deploy in deployments.items:
-                        k8s_apps_api.delete_namespaced_deployment(
-                            name=deploy.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted Deployment: {deploy.metadata.name}")
-                        print(f"✓ Deleted Deployment: {deploy.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting Deployments: {e.reason}")
-            
-            # Delete Services
-            if k8s_core_api:
-                try:
-                    services = k8s_core_api.list_namespaced_service(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for svc in services.items:
-                        k8s_core_api.delete_namespaced_service(
-                            name=svc.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted Service: {svc.metadata.name}")
-                        print(f"✓ Deleted Service: {svc.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting Services: {e.reason}")
-            
-            # Delete ConfigMaps
-            if k8s_core_api:
-                try:
-                    configmaps = k8s_core_api.list_namespaced_config_map(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for cm in configmaps.items:
-                        k8s_core_api.delete_namespaced_config_map(
-                            name=cm.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted ConfigMap: {cm.metadata.name}")
-                        print(f"✓ Deleted ConfigMap: {cm.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting ConfigMaps: {e.reason}")
-            
-            # Delete Secrets
-            if k8s_core_api:
-                try:
-                    secrets = k8s_core_api.list_namespaced_secret(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for secret in secrets.items:
-                        k8s_core_api.delete_namespaced_secret(
-                            name=secret.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted Secret: {secret.metadata.name}")
-                        print(f"✓ Deleted Secret: {secret.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting Secrets: {e.reason}")
-            
-            # Delete PVCs
-            if k8s_core_api:
-                try:
-                    pvcs = k8s_core_api.list_namespaced_persistent_volume_claim(
-                        namespace=namespace,
-                        label_selector=label_selector
-                    )
-                    for pvc in pvcs.items:
-                        # Remove finalizers if force delete
-                        if force and pvc.metadata.finalizers:
-                            try:
-                                k8s_core_api.patch_namespaced_persistent_volume_claim(
-                                    name=pvc.metadata.name,
-                                    namespace=namespace,
-                                    body={'metadata': {'finalizers': []}}
-                                )
-                                cleanup_log.append(f"✓ Removed finalizers from PVC: {pvc.metadata.name}")
-                            except ApiException as e:
-                                if e.status != 404:
-                                    cleanup_log.append(f"Warning: Could not remove finalizers from PVC {pvc.metadata.name}: {e.reason}")
-                        
-                        k8s_core_api.delete_namespaced_persistent_volume_claim(
-                            name=pvc.metadata.name,
-                            namespace=namespace
-                        )
-                        cleanup_log.append(f"✓ Deleted PVC: {pvc.metadata.name}")
-                        print(f"✓ Deleted PVC: {pvc.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting PVCs: {e.reason}")
+            # Delete StatefulSets, Deployments, Services, ConfigMaps, Secrets and PVCs
+            ApplicationService._delete_workload_resources(namespace, label_selector, force, cleanup_log)
             
-            # Delete PVs (if they have the label selector)
+            # Delete PVs (if they have the label selector) after their claims
             if k8s_core_api:
-                try:
-                    pvs = k8s_core_api.list_persistent_volume(
-                        label_selector=label_selector
-                    )
-                    for pv in pvs.items:
-                        # Remove finalizers if force delete
-                        if force and pv.metadata.finalizers:
-                            try:
-                                k8s_core_api.patch_persistent_volume(
-                                    name=pv.metadata.name,
-                                    body={'metadata': {'finalizers': []}}
-                                )
-                                cleanup_log.append(f"✓ Removed finalizers from PV: {pv.metadata.name}")
-                            except ApiException as e:
-                                if e.status != 404:
-                                    cleanup_log.append(f"Warning: Could not remove finalizers from PV {pv.metadata.name}: {e.reason}")
-                        
-                        k8s_core_api.delete_persistent_volume(
-                            name=pv.metadata.name
-                        )
-                        cleanup_log.append(f"✓ Deleted PV: {pv.metadata.name}")
-                        print(f"✓ Deleted PV: {pv.metadata.name}")
-                except ApiException as e:
-                    if e.status != 404:
-                        cleanup_log.append(f"Warning: Error deleting PVs: {e.reason}")
-                        
-        except ApiException as e:
-            if e.status != 404:
-                cleanup_log.append(f"Warning: Could not process application resources: {e.reason}")
+                ApplicationService._delete_selected(
+                    'PV', k8s_core_api.list_persistent_volume, k8s_core_api.delete_persistent_volume,
+                    None, label_selector, cleanup_log,
+                    patch_function=k8s_core_api.patch_persistent_volume if force else None,
+                    delete_collection_function=k8s_core_api.delete_collection_persistent_volume
+                )
         
         # Step 5: Delete the Application CRD
         try:
-            if force:
+            if force and app is not None and app.get('metadata', {}).get('finalizers'):
                 # Remove finalizers first
                 try:
-                    app = k8s_api.get_namespaced_custom_object(
+                    k8s_api.patch_namespaced_custom_object(
                         group=Config.NDK_API_GROUP,
                         version=Config.NDK_API_VERSION,
                         namespace=namespace,
                         plural='applications',
-                        name=name
+                        name=name,
+                        body={'metadata': {'finalizers': []}}
                     )
-                    
-                    if app.get('metadata', {}).get('finalizers'):
-                        k8s_api.patch_namespaced_custom_object(
-                            group=Config.NDK_API_GROUP,
-                            version=Config.NDK_API_VERSION,
-                            namespace=namespace,
-                            plural='applications',
-                            name=name,
-                            body={'metadata': {'finalizers': []}}
-                        )
-                        cleanup_log.append("✓ Removed finalizers from Application")
+                    cleanup_log.append("✓ Removed finalizers from Application")
                 except ApiException as e:
                     if e.status != 404:
                         cleanup_log.append(f"Warning: Could not remove finalizers: {e.reason}")
@@ -753,10 +517,10 @@ class ApplicationService:
                 name=name
             )
             cleanup_log.append(f"✓ Deleted Application: {name}")
-            print(f"✓ Deleted Application: {namespace}/{name}")
+            logger.info("✓ Deleted Application: %s/%s", namespace, name)
         except ApiException as e:
             if e.status == 404:
-                print(f"✓ Application {name} was already deleted")
+                logger.info("✓ Application %s was already deleted", name)
                 cleanup_log.append(f"Application {name} was already deleted")
             else:
                 raise
@@ -788,22 +552,21 @@ class ApplicationService:
         # Get current labels
         current_labels = app.get('metadata', {}).get('labels', {})
         
-        print(f"[DEBUG] Current labels: {current_labels}")
-        print(f"[DEBUG] New labels: {new_labels}")
-        print(f"[DEBUG] Labels to remove: {labels_to_remove}")
+        logger.debug("Current labels: %s", current_labels)
+        logger.debug("New labels: %s", new_labels)
+        logger.debug("Labels to remove: %s", labels_to_remove)
         
         # Start with only system labels from current state
-        system_prefixes = ['app.kubernetes.io/', 'kubernetes.io/', 'k8s.io/', 'helm.sh/', 'kubectl.kubernetes.io/']
         updated_labels = {
             k: v for k, v in current_labels.items()
-            if any(k.startswith(prefix) for prefix in system_prefixes)
+            if k.startswith(PRESERVED_LABEL_PREFIXES)
         }
-        print(f"[DEBUG] Starting with system labels only: {updated_labels}")
+        logger.debug("Starting with system labels only: %s", updated_labels)
         
         # Add new labels (user labels from frontend)
         if new_labels:
             updated_labels.update(new_labels)
-            print(f"[DEBUG] After adding new labels: {updated_labels}")
+            logger.debug("After adding new labels: %s", updated_labels)
         
         # Note: To remove labels in Kubernetes, we must explicitly set them to null
         # Build the patch with removed labels set to null
@@ -813,7 +576,7 @@ class ApplicationService:
         if labels_to_remove:
             for label_key in labels_to_remove:
                 patch_labels[label_key] = None
-            print(f"[DEBUG] Setting labels to null for removal: {labels_to_remove}")
+            logger.debug("Setting labels to null for removal: %s", labels_to_remove)
         
         # Update the application with new labels
         patch = {
@@ -822,7 +585,7 @@ class ApplicationService:
             }
         }
         
-        print(f"[DEBUG] Patching Kubernetes with: {patch}")
+        logger.debug("Patching Kubernetes with: %s", patch)
         
         try:
             result = k8s_api.patch_namespaced_custom_object(
@@ -833,10 +596,10 @@ class ApplicationService:
                 name=name,
                 body=patch
             )
-            print(f"[DEBUG] Kubernetes patch succeeded!")
-            print(f"[DEBUG] Result labels: {result.get('metadata', {}).get('labels', {})}")
+            logger.debug("Kubernetes patch succeeded!")
+            logger.debug("Result labels: %s", result.get('metadata', {}).get('labels', {}))
         except Exception as e:
-            print(f"[ERROR] Kubernetes patch failed: {e}")
+            logger.error("Kubernetes patch failed: %s", e)
             raise
         
         return updated_labels
@@ -847,13 +610,7 @@ class ApplicationService:
         if not k8s_api:
             raise Exception('Kubernetes API not available')
         
-        app = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='applications',
-            name=name
-        )
+        app = get_custom_object('applications', namespace, name)
         
         return {
             'metadata': app.get('metadata', {}),
@@ -868,13 +625,7 @@ class ApplicationService:
             raise Exception('Kubernetes API not available')
         
         # Get the application to retrieve its selector
-        app = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='applications',
-            name=name
-        )
+        app = get_custom_object('applications', namespace, name)
         
         # Get the application selector
         spec = app.get('spec', {})
@@ -883,28 +634,25 @@ class ApplicationService:
         # Build label selector
         label_selector = ApplicationService._build_label_selector(app_selector, name)
         
-        print(f"Fetching pods for {namespace}/{name} with selector: {label_selector}")
+        logger.debug("Fetching pods for %s/%s with selector: %s", namespace, name, label_selector)
         
-        # Get pods matching the selector
-        pods = k8s_core_api.list_namespaced_pod(
-            namespace=namespace,
-            label_selector=label_selector
-        )
+        # Get pods matching the selector (from the pod watch store when it is in sync)
+        pods = list_core_objects('pods', namespace, label_selector)
         
-        print(f"Found {len(pods.items)} pods for {namespace}/{name}")
+        logger.debug("Found %d pods for %s/%s", len(pods), namespace, name)
         
         pod_info = []
-        for pod in pods.items:
-            pod_name = pod.metadata.name
-            node_name = pod.spec.node_name or 'Pending'
-            phase = pod.status.phase
-            pod_ip = pod.status.pod_ip or 'N/A'
+        for pod in pods:
+            pod_spec = pod.get('spec', {})
+            pod_status = pod.get('status', {})
+            pod_name = pod.get('metadata', {}).get('name')
+            node_name = pod_spec.get('nodeName') or 'Pending'
+            phase = pod_status.get('phase')
+            pod_ip = pod_status.get('podIP') or 'N/A'
             
             # Get container statuses
-            ready_containers = 0
-            total_containers = len(pod.spec.containers)
-            if pod.status.container_statuses:
-                ready_containers = sum(1 for cs in pod.status.container_statuses if cs.ready)
+            total_containers = len(pod_spec.get('containers', []))
+            ready_containers = sum(1 for cs in pod_status.get('containerStatuses') or [] if cs.get('ready'))
             
             pod_info.append({
                 'name': pod_name,
@@ -927,52 +675,50 @@ class ApplicationService:
             raise Exception('Kubernetes API not available')
         
         # Get the application
-        app = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='applications',
-            name=name
-        )
+        app = get_custom_object('applications', namespace, name)
         
         # Get application selector
         spec = app.get('spec', {})
         app_selector = spec.get('applicationSelector', {})
         label_selector = ApplicationService._build_label_selector(app_selector, name)
         
-        # Get PVCs matching the selector
-        pvcs = k8s_core_api.list_namespaced_persistent_volume_claim(
-            namespace=namespace,
-            label_selector=label_selector
-        )
+        # Get PVCs matching the selector (from the PVC watch store when it is in sync)
+        pvcs = list_core_objects('persistentvolumeclaims', namespace, label_selector)
         
         pvc_info = []
         volume_groups = set()
         
-        for pvc in pvcs.items:
-            pvc_name = pvc.metadata.name
-            pv_name = pvc.spec.volume_name if pvc.spec.volume_name else 'Pending'
-            storage_class = pvc.spec.storage_class_name or 'default'
-            capacity = pvc.status.capacity.get('storage', 'Unknown') if pvc.status.capacity else 'Pending'
-            status = pvc.status.phase
+        # Look up every bound PV at once rather than reading them one by one
+        pv_names = [pvc.get('spec', {}).get('volumeName') for pvc in pvcs]
+        try:
+            pvs = get_persistent_volumes(pv_name for pv_name in pv_names if pv_name)
+        except ApiException as e:
+            logger.warning("Could not read PVs for %s/%s: %s", namespace, name, e)
+            pvs = {}
+        
+        for pvc in pvcs:
+            pvc_spec = pvc.get('spec', {})
+            pvc_status = pvc.get('status', {})
+            pvc_name = pvc.get('metadata', {}).get('name')
+            pv_name = pvc_spec.get('volumeName') or 'Pending'
+            storage_class = pvc_spec.get('storageClassName') or 'default'
+            capacity = pvc_status['capacity'].get('storage', 'Unknown') if pvc_status.get('capacity') else 'Pending'
+            status = pvc_status.get('phase')
             
             # Get volume group UUID from PV's CSI volume handle
             volume_group = 'N/A'
-            if pv_name != 'Pending':
-                try:
-                    pv = k8s_core_api.read_persistent_volume(name=pv_name)
+            pv = pvs.get(pv_name)
+            if pv is not None:
+                # Get Nutanix CSI specific details
+                csi = pv.get('spec', {}).get('csi') or {}
+                if csi.get('driver') == 'csi.nutanix.com':
+                    volume_handle = csi.get('volumeHandle')
                     
-                    # Get Nutanix CSI specific details
-                    if pv.spec.csi and pv.spec.csi.driver == 'csi.nutanix.com':
-                        volume_handle = pv.spec.csi.volume_handle
-                        
-                        # Extract VG UUID from volume handle (e.g., "NutanixVolumes-8682863c-...")
-                        if volume_handle and volume_handle.startswith('NutanixVolumes-'):
-                            vg_uuid = volume_handle.replace('NutanixVolumes-', '')
-                            volume_group = vg_uuid
-                            volume_groups.add(vg_uuid)
-                except ApiException as e:
-                    print(f"Could not read PV {pv_name}: {e}")
+                    # Extract VG UUID from volume handle (e.g., "NutanixVolumes-8682863c-...")
+                    if volume_handle and volume_handle.startswith('NutanixVolumes-'):
+                        vg_uuid = volume_handle.replace('NutanixVolumes-', '')
+                        volume_group = vg_uuid
+                        volume_groups.add(vg_uuid)
             
             pvc_info.append({
                 'name': pvc_name,
@@ -1070,10 +816,10 @@ class ApplicationService:
             for sts in statefulsets:
                 sts_name = sts.get('name')
                 try:
-                    sts_obj = k8s_apps_api.read_namespaced_stateful_set(sts_name, namespace)
+                    sts_obj = _read_raw(k8s_apps_api.read_namespaced_stateful_set, sts_name, namespace)
                     # Check if replicas are ready
-                    desired = sts_obj.spec.replicas or 0
-                    ready = sts_obj.status.ready_replicas or 0
+                    desired = sts_obj.get('spec', {}).get('replicas') or 0
+                    ready = sts_obj.get('status', {}).get('readyReplicas') or 0
                     if ready >= desired and desired > 0:
                         ready_workloads += 1
                 except ApiException:
@@ -1083,10 +829,10 @@ class ApplicationService:
             for deploy in deployments:
                 deploy_name = deploy.get('name')
                 try:
-                    deploy_obj = k8s_apps_api.read_namespaced_deployment(deploy_name, namespace)
+                    deploy_obj = _read_raw(k8s_apps_api.read_namespaced_deployment, deploy_name, namespace)
                     # Check if replicas are ready
-                    desired = deploy_obj.spec.replicas or 0
-                    ready = deploy_obj.status.ready_replicas or 0
+                    desired = deploy_obj.get('spec', {}).get('replicas') or 0
+                    ready = deploy_obj.get('status', {}).get('readyReplicas') or 0
                     if ready >= desired and desired > 0:
                         ready_workloads += 1
                 except ApiException:
@@ -1096,9 +842,9 @@ class ApplicationService:
             for pvc in pvcs:
                 pvc_name = pvc.get('name')
                 try:
-                    pvc_obj = k8s_core_api.read_namespaced_persistent_volume_claim(pvc_name, namespace)
+                    pvc_obj = _read_raw(k8s_core_api.read_namespaced_persistent_volume_claim, pvc_name, namespace)
                     # Check if PVC is bound
-                    if pvc_obj.status.phase == 'Bound':
+                    if pvc_obj.get('status', {}).get('phase') == 'Bound':
                         ready_pvcs += 1
                 except ApiException:
                     pass  # PVC not found or error, skip
@@ -1148,86 +894,232 @@ class ApplicationService:
             match_labels = app_selector.get('matchLabels', {})
             match_expressions = app_selector.get('matchExpressions', [])
         
-        if match_labels:
-            label_selector = ','.join([f"{k}={v}" for k, v in match_labels.items()])
-        elif match_expressions:
-            selector_parts = []
-            for expr in match_expressions:
-                key = expr.get('key')
-                operator = expr.get('operator', 'In')
-                values = expr.get('values', [])
-                
-                if operator == 'In' and values:
-                    selector_parts.append(f"{key} in ({','.join(values)})")
-                elif operator == 'NotIn' and values:
-                    selector_parts.append(f"{key} notin ({','.join(values)})")
-                elif operator == 'Exists':
-                    selector_parts.append(key)
-                elif operator == 'DoesNotExist':
-                    selector_parts.append(f"!{key}")
+        # matchLabels and matchExpressions are ANDed, so both go into the selector
+        selector_parts = [f"{k}={v}" for k, v in match_labels.items()]
+        for expr in match_expressions:
+            key = expr.get('key')
+            operator = expr.get('operator', 'In')
+            values = expr.get('values', [])
             
-            if selector_parts:
-                label_selector = ','.join(selector_parts)
+            if operator == 'In' and values:
+                selector_parts.append(f"{key} in ({','.join(values)})")
+            elif operator == 'NotIn' and values:
+                selector_parts.append(f"{key} notin ({','.join(values)})")
+            elif operator == 'Exists':
+                selector_parts.append(key)
+            elif operator == 'DoesNotExist':
+                selector_parts.append(f"!{key}")
+        
+        if selector_parts:
+            label_selector = ','.join(selector_parts)
         
         # If no selector found, try to find resources by app name
         if not label_selector:
             label_selector = f"app={app_name}"
-            print(f"No explicit selector found, trying app={app_name}")
+            logger.debug("No explicit selector found, trying app=%s", app_name)
         
         return label_selector
     
+    @staticmethod
+    def _delete_selected(kind, list_function, delete_function, namespace, label_selector, cleanup_log,
+                         patch_function=None, delete_collection_function=None):
+        """
+        Delete every object of one kind matching a label selector
+        
+        With a delete_collection_function the objects are removed with a single
+        DeleteCollection call; otherwise they are deleted one by one, concurrently.
+        
+        Args:
+            kind: Kind name used in the cleanup log (e.g. 'StatefulSet')
+            list_function: Client method listing the kind
+            delete_function: Client method deleting one object
+            namespace: Namespace to clean up, or None for cluster-scoped kinds
+            label_selector: Label selector for the application's objects
+            cleanup_log: List to append progress messages to
+            patch_function: Client method used to strip finalizers first (optional)
+            delete_collection_function: Client method deleting all objects matching
+                a label selector (optional)
+        """
+        scope = {'namespace': namespace} if namespace else {}
+        # Only names and finalizers are needed, so skip building client models
+        list_raw = _raw_list(list_function)
+        try:
+            labelled = {item['metadata']['name']: item
+                        for item in paged_list(list_raw, label_selector=label_selector, **scope)}
+        except ApiException as e:
+            if e.status != 404:
+                cleanup_log.append(f"Warning: Error deleting {kind}s: {e.reason}")
+            return
+        
+        def remove_finalizers(item):
+            item_name = item['metadata']['name']
+            try:
+                patch_function(name=item_name, body={'metadata': {'finalizers': []}}, **scope)
+                cleanup_log.append(f"✓ Removed finalizers from {kind}: {item_name}")
+            except ApiException as e:
+                if e.status != 404:
+                    cleanup_log.append(f"Warning: Could not remove finalizers from {kind} {item_name}: {e.reason}")
+        
+        def delete(item):
+            item_name = item['metadata']['name']
+            # Remove finalizers if force delete
+            if patch_function and item['metadata'].get('finalizers'):
+                remove_finalizers(item)
+            try:
+                delete_function(name=item_name, **scope)
+                cleanup_log.append(f"✓ Deleted {kind}: {item_name}")
+                logger.debug("✓ Deleted %s: %s", kind, item_name)
+            except ApiException as e:
+                if e.status != 404:
+                    cleanup_log.append(f"Warning: Error deleting {kind} {item_name}: {e.reason}")
+        
+        if labelled and delete_collection_function:
+            finalized = [item for item in labelled.values() if item['metadata'].get('finalizers')]
+            if patch_function and finalized:
+                with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(finalized))) as executor:
+                    list(executor.map(remove_finalizers, finalized))
+            try:
+                delete_collection_function(label_selector=label_selector, **scope)
+                for item_name in labelled:
+                    cleanup_log.append(f"✓ Deleted {kind}: {item_name}")
+                    logger.debug("✓ Deleted %s: %s", kind, item_name)
+            except ApiException as e:
+                if e.status != 404:
+                    cleanup_log.append(f"Warning: Error deleting {kind}s: {e.reason}")
+        elif labelled:
+            with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(labelled))) as executor:
+                list(executor.map(delete, labelled.values()))
+    
+    @staticmethod
+    def _delete_workload_resources(namespace, label_selector, force, cleanup_log):
+        """
+        Delete an application's StatefulSets, Deployments, Services, ConfigMaps, Secrets and PVCs
+        
+        The kinds are independent of each other, so they are cleaned up in parallel,
+        each with one DeleteCollection call for its labelled objects.
+        
+        Args:
+            namespace: Application namespace
+            label_selector: Label selector for the application's objects
+            force: Strip finalizers from PVCs before deleting them
+            cleanup_log: List to append progress messages to
+        """
+        kinds = []
+        if k8s_apps_api:
+            kinds += [
+                ('StatefulSet', k8s_apps_api.list_namespaced_stateful_set, k8s_apps_api.delete_namespaced_stateful_set,
+                 k8s_apps_api.delete_collection_namespaced_stateful_set, None),
+                ('Deployment', k8s_apps_api.list_namespaced_deployment, k8s_apps_api.delete_namespaced_deployment,
+                 k8s_apps_api.delete_collection_namespaced_deployment, None)
+            ]
+        if k8s_core_api:
+            kinds += [
+                ('Service', k8s_core_api.list_namespaced_service, k8s_core_api.delete_namespaced_service,
+                 k8s_core_api.delete_collection_namespaced_service, None),
+                ('ConfigMap', k8s_core_api.list_namespaced_config_map, k8s_core_api.delete_namespaced_config_map,
+                 k8s_core_api.delete_collection_namespaced_config_map, None),
+                ('Secret', k8s_core_api.list_namespaced_secret, k8s_core_api.delete_namespaced_secret,
+                 k8s_core_api.delete_collection_namespaced_secret, None),
+                ('PVC', k8s_core_api.list_namespaced_persistent_volume_claim,
+                 k8s_core_api.delete_namespaced_persistent_volume_claim,
+                 k8s_core_api.delete_collection_namespaced_persistent_volume_claim,
+                 k8s_core_api.patch_namespaced_persistent_volume_claim if force else None)
+            ]
+        if not kinds:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            futures = [
+                executor.submit(
+                    ApplicationService._delete_selected, kind, list_function, delete_function,
+                    namespace, label_selector, cleanup_log, patch_function, delete_collection_function
+                )
+                for kind, list_function, delete_function, delete_collection_function, patch_function in kinds
+            ]
+            for future in futures:
+                future.result()
+    
+    @staticmethod
+    def _delete_custom_objects(plural, kind, namespace, names, force, finalized, cleanup_log):
+        """
+        Delete NDK custom objects concurrently
+        
+        Args:
+            plural: Custom resource plural
+            kind: Kind name used in the cleanup log
+            namespace: Objects' namespace
+            names: Names of the objects to delete
+            force: Strip finalizers before deleting
+            finalized: Names of the objects that have finalizers
+            cleanup_log: List to append progress messages to
+            
+        Returns:
+            Number of objects deleted
+        """
+        def delete(object_name):
+            try:
+                # Remove finalizers if force delete
+                if force and object_name in finalized:
+                    k8s_api.patch_namespaced_custom_object(
+                        group=Config.NDK_API_GROUP,
+                        version=Config.NDK_API_VERSION,
+                        namespace=namespace,
+                        plural=plural,
+                        name=object_name,
+                        body={'metadata': {'finalizers': []}}
+                    )
+                
+                k8s_api.delete_namespaced_custom_object(
+                    group=Config.NDK_API_GROUP,
+                    version=Config.NDK_API_VERSION,
+                    namespace=namespace,
+                    plural=plural,
+                    name=object_name
+                )
+                cleanup_log.append(f"Deleted {kind}: {object_name}")
+                return True
+            except ApiException as e:
+                if e.status != 404:
+                    cleanup_log.append(f"Warning: Failed to delete {kind} {object_name}: {e.reason}")
+                return False
+        
+        if not names:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(names))) as executor:
+            return sum(executor.map(delete, names))
+    
     @staticmethod
     def _delete_application_snapshots(namespace, name, force, cleanup_log):
         """Delete all snapshots associated with an application"""
         try:
-            snapshots = k8s_api.list_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applicationsnapshots'
-            )
+            # applicationRef is not a selectable field, so filter the namespace's snapshots
+            # from the watch store rather than re-listing them from the API server
+            snapshots = list_custom_objects('applicationsnapshots', namespace=namespace)
             
-            deleted_snapshots = 0
+            names = []
+            finalized = set()
             for snapshot in snapshots.get('items', []):
                 snapshot_metadata = snapshot.get('metadata', {})
                 snapshot_spec = snapshot.get('spec', {})
-                snapshot_name = snapshot_metadata.get('name')
                 
                 # Check if this snapshot belongs to the application
                 app_ref = snapshot_spec.get('source', {}).get('applicationRef', {})
                 if app_ref.get('name') == name:
-                    try:
-                        # Remove finalizers if force delete
-                        if force and snapshot_metadata.get('finalizers'):
-                            k8s_api.patch_namespaced_custom_object(
-                                group=Config.NDK_API_GROUP,
-                                version=Config.NDK_API_VERSION,
-                                namespace=namespace,
-                                plural='applicationsnapshots',
-                                name=snapshot_name,
-                                body={'metadata': {'finalizers': []}}
-                            )
-                        
-                        k8s_api.delete_namespaced_custom_object(
-                            group=Config.NDK_API_GROUP,
-                            version=Config.NDK_API_VERSION,
-                            namespace=namespace,
-                            plural='applicationsnapshots',
-                            name=snapshot_name
-                        )
-                        deleted_snapshots += 1
-                        cleanup_log.append(f"Deleted snapshot: {snapshot_name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Failed to delete snapshot {snapshot_name}: {e.reason}")
+                    names.append(snapshot_metadata.get('name'))
+                    if snapshot_metadata.get('finalizers'):
+                        finalized.add(snapshot_metadata.get('name'))
+            
+            deleted_snapshots = ApplicationService._delete_custom_objects(
+                'applicationsnapshots', 'snapshot', namespace, names, force, finalized, cleanup_log
+            )
             
             if deleted_snapshots > 0:
-                print(f"✓ Deleted {deleted_snapshots} snapshots for application {name}")
+                logger.info("✓ Deleted %s snapshots for application %s", deleted_snapshots, name)
                 cleanup_log.append(f"✓ Deleted {deleted_snapshots} snapshots")
             
             return deleted_snapshots
         except ApiException as e:
-            print(f"Warning: Error listing snapshots: {e}")
+            logger.warning("Error listing snapshots: %s", e)
             cleanup_log.append(f"Warning: Could not list snapshots: {e.reason}")
             return 0
     
@@ -1235,69 +1127,53 @@ class ApplicationService:
     def _delete_app_protection_plans(namespace, name, force, cleanup_log):
         """Delete AppProtectionPlans associated with an application"""
         try:
-            app_plans = k8s_api.list_namespaced_custom_object(
+            app_plans = paged_list(
+                k8s_api.list_namespaced_custom_object,
                 group=Config.NDK_API_GROUP,
                 version=Config.NDK_API_VERSION,
                 namespace=namespace,
                 plural='appprotectionplans'
             )
             
-            deleted_plans = 0
-            for plan in app_plans.get('items', []):
+            names = []
+            finalized = set()
+            for plan in app_plans:
                 plan_metadata = plan.get('metadata', {})
                 plan_spec = plan.get('spec', {})
-                plan_name = plan_metadata.get('name')
                 
                 # Check if this plan belongs to the application
                 if plan_spec.get('applicationName') == name:
-                    try:
-                        if force and plan_metadata.get('finalizers'):
-                            k8s_api.patch_namespaced_custom_object(
-                                group=Config.NDK_API_GROUP,
-                                version=Config.NDK_API_VERSION,
-                                namespace=namespace,
-                                plural='appprotectionplans',
-                                name=plan_name,
-                                body={'metadata': {'finalizers': []}}
-                            )
-                        
-                        k8s_api.delete_namespaced_custom_object(
-                            group=Config.NDK_API_GROUP,
-                            version=Config.NDK_API_VERSION,
-                            namespace=namespace,
-                            plural='appprotectionplans',
-                            name=plan_name
-                        )
-                        deleted_plans += 1
-                        cleanup_log.append(f"Deleted AppProtectionPlan: {plan_name}")
-                    except ApiException as e:
-                        if e.status != 404:
-                            cleanup_log.append(f"Warning: Failed to delete AppProtectionPlan {plan_name}: {e.reason}")
+                    names.append(plan_metadata.get('name'))
+                    if plan_metadata.get('finalizers'):
+                        finalized.add(plan_metadata.get('name'))
+            
+            deleted_plans = ApplicationService._delete_custom_objects(
+                'appprotectionplans', 'AppProtectionPlan', namespace, names, force, finalized, cleanup_log
+            )
             
             if deleted_plans > 0:
-                print(f"✓ Deleted {deleted_plans} AppProtectionPlans for application {name}")
+                logger.info("✓ Deleted %s AppProtectionPlans for application %s", deleted_plans, name)
                 cleanup_log.append(f"✓ Deleted {deleted_plans} AppProtectionPlans")
             
             return deleted_plans
         except ApiException as e:
-            print(f"Warning: Error listing AppProtectionPlans: {e}")
+            logger.warning("Error listing AppProtectionPlans: %s", e)
             cleanup_log.append(f"Warning: Could not list AppProtectionPlans: {e.reason}")
             return 0
     
     @staticmethod
     def _wait_for_snapshot_deletion(namespace, name, cleanup_log, max_wait=30):
         """Wait for snapshots to be deleted"""
-        print(f"⏳ Waiting for snapshots to be deleted (max {max_wait}s)...")
+        logger.info("⏳ Waiting for snapshots to be deleted (max %ss)...", max_wait)
         cleanup_log.append(f"Waiting for snapshots to be deleted...")
         
-        for i in range(max_wait):
+        deadline = time.monotonic() + max_wait
+        next_report = 0
+        version = wait_for_change(None, 0)
+        while True:
             try:
-                snapshots = k8s_api.list_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=namespace,
-                    plural='applicationsnapshots'
-                )
+                # Served from the watch store, so polling doesn't re-list every second
+                snapshots = list_custom_objects('applicationsnapshots', namespace=namespace)
                 
                 remaining = sum(
                     1 for s in snapshots.get('items', [])
@@ -1305,16 +1181,21 @@ class ApplicationService:
                 )
                 
                 if remaining == 0:
-                    print(f"✓ All snapshots deleted")
+                    logger.info("✓ All snapshots deleted")
                     cleanup_log.append("✓ All snapshots deleted")
                     break
                 
-                if i % 5 == 0:
-                    print(f"  Still waiting... {remaining} snapshots remaining")
+                now = time.monotonic()
+                if now >= deadline:
+                    logger.warning("⚠ Timeout waiting for snapshots to be deleted")
+                    cleanup_log.append("Warning: Timeout waiting for snapshots")
+                    break
+                
+                if now >= next_report:
+                    logger.info("  Still waiting... %s snapshots remaining", remaining)
+                    next_report = now + 5
                 
-                time.sleep(1)
+                # Wake on the next watch event (or after a second if watches aren't running)
+                version = wait_for_change(version, min(1, deadline - now))
             except ApiException:
-                break
-        else:
-            print(f"⚠ Timeout waiting for snapshots to be deleted")
-            cleanup_log.append("Warning: Timeout waiting for snapshots")
\ No newline at end of file
+                break
\ No newline at end of file
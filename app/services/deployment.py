@@ -1,16 +1,76 @@
 """
 Deployment service - Business logic for deploying applications
 """
+import logging
 import secrets
-import string
-import base64
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from app.extensions import k8s_api, k8s_core_api, k8s_apps_api
 from config import Config
 from app.services.protection_plans import ProtectionPlanService
 
+logger = logging.getLogger(__name__)
+
+# Max concurrent create calls while deploying an application
+DEPLOY_WORKERS = 4
+
+# Kubernetes quantity: number followed by optional suffix (e, E, i, n, u, m, k, K, M, G, T, P)
+STORAGE_QUANTITY_PATTERN = re.compile(r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$')
+
+# NKP/Karbon worker node name: nkp-{cluster}-{id}-{POOL_NAME}-worker-{N}
+NKP_WORKER_NODE_PATTERN = re.compile(r'nkp-[^-]+-[^-]+-(.+?)-worker-\d+$')
+
+# Namespaces known to exist, warmed by one list call so deploys skip read_namespace
+_known_namespaces = None
+_known_namespaces_lock = threading.Lock()
+
+# Container environment per application type as (name, value) pairs;
+# a value of None is read from the 'password' key of the credentials Secret
+APP_ENV_TEMPLATES = {
+    'mysql': (
+        ('MYSQL_ROOT_PASSWORD', None),
+        ('MYSQL_REPLICATION_USER', 'repl'),
+        ('MYSQL_REPLICATION_PASSWORD', None),
+    ),
+    'postgresql': (
+        ('POSTGRES_PASSWORD', None),
+    ),
+    'mongodb': (
+        ('MONGO_INITDB_ROOT_USERNAME', 'admin'),
+        ('MONGO_INITDB_ROOT_PASSWORD', None),
+    ),
+    'redis': (
+        ('REDIS_PASSWORD', None),
+    ),
+    'elasticsearch': (
+        ('ELASTIC_PASSWORD', None),
+        ('discovery.type', 'single-node'),
+        ('xpack.security.enabled', 'true'),
+    ),
+    'cassandra': (
+        ('CASSANDRA_PASSWORD', None),
+    )
+}
+
+# Environment variable that receives the optional database name
+DATABASE_ENV_VARS = {
+    'mysql': 'MYSQL_DATABASE',
+    'postgresql': 'POSTGRES_DB'
+}
+
+# Data volume mount path per application type
+MOUNT_PATHS = {
+    'mysql': '/var/lib/mysql',
+    'postgresql': '/var/lib/postgresql/data',
+    'mongodb': '/data/db',
+    'redis': '/data',
+    'elasticsearch': '/usr/share/elasticsearch/data',
+    'cassandra': '/var/lib/cassandra'
+}
+
 
 class DeploymentService:
     """Service class for deploying applications with NDK capabilities"""
@@ -28,6 +88,9 @@ class DeploymentService:
         if not all([app_type, app_name, namespace, storage_size, docker_image]):
             raise ValueError('Missing required fields')
         
+        if app_type not in APP_ENV_TEMPLATES:
+            raise ValueError(f'Unsupported application type: {app_type}')
+        
         # Validate retention count if protection plan is enabled
         if create_protection_plan:
             try:
@@ -46,20 +109,10 @@ class DeploymentService:
         
         # Generate password if not provided
         if not password:
-            alphabet = string.ascii_letters + string.digits
-            password = ''.join(secrets.choice(alphabet) for i in range(16))
+            password = secrets.token_urlsafe(12)
         
         # Step 1: Create namespace if it doesn't exist
-        try:
-            k8s_core_api.read_namespace(namespace)
-        except ApiException as e:
-            if e.status == 404:
-                namespace_manifest = {
-                    'apiVersion': 'v1',
-                    'kind': 'Namespace',
-                    'metadata': {'name': namespace}
-                }
-                k8s_core_api.create_namespace(body=namespace_manifest)
+        DeploymentService._ensure_namespace(namespace)
         
         # Step 2: Create Secret for credentials
         secret_name = f"{app_name}-credentials"
@@ -67,9 +120,6 @@ class DeploymentService:
         if database_name:
             secret_data['database'] = database_name
         
-        # Encode secret data to base64
-        encoded_secret_data = {k: base64.b64encode(v.encode()).decode() for k, v in secret_data.items()}
-        
         # Build labels
         labels = {'app': app_name}
         if custom_labels:
@@ -84,38 +134,18 @@ class DeploymentService:
                 'labels': labels
             },
             'type': 'Opaque',
-            'data': encoded_secret_data
+            # The API server base64-encodes stringData into data
+            'stringData': secret_data
         }
         
-        try:
-            k8s_core_api.create_namespaced_secret(namespace=namespace, body=secret_manifest)
-        except ApiException as e:
-            if e.status != 409:  # Ignore if already exists
-                raise
-        
-        # Step 3: Create ConfigMap for MySQL replication if needed
-        if app_type == 'mysql' and replicas > 1:
-            DeploymentService._create_mysql_replication_configmap(app_name, namespace, custom_labels)
-        
-        # Step 4: Build environment variables based on app type
-        env_vars = DeploymentService._build_env_vars(app_type, secret_name, database_name, app_name)
-        
-        # Step 5: Build StatefulSet manifest
-        statefulset_manifest = DeploymentService._build_statefulset_manifest(
-            app_name, namespace, app_type, replicas, docker_image, port,
-            env_vars, storage_class, storage_size, custom_labels
-        )
-        
-        # Add nodeSelector if worker pool is specified
-        if worker_pool:
-            node_selector = DeploymentService._get_worker_pool_selector(worker_pool)
-            if node_selector:
-                statefulset_manifest['spec']['template']['spec']['nodeSelector'] = node_selector
-        
-        # Create StatefulSet
-        k8s_apps_api.create_namespaced_stateful_set(namespace=namespace, body=statefulset_manifest)
+        def _create_secret():
+            try:
+                k8s_core_api.create_namespaced_secret(namespace=namespace, body=secret_manifest)
+            except ApiException as e:
+                if e.status != 409:  # Ignore if already exists
+                    raise
         
-        # Step 6: Create Service
+        # Step 3: Build Service manifest
         # Re-use labels from Secret
         service_manifest = {
             'apiVersion': 'v1',
@@ -132,17 +162,57 @@ class DeploymentService:
             }
         }
         
-        k8s_core_api.create_namespaced_service(namespace=namespace, body=service_manifest)
+        # Step 4: Build environment variables based on app type
+        env_vars = DeploymentService._build_env_vars(app_type, secret_name, database_name, app_name)
         
-        # Step 7: Create NDK Application CR if requested
-        if create_ndk_app:
-            DeploymentService._create_ndk_application(app_name, namespace, custom_labels)
+        # Step 5: Build StatefulSet manifest
+        statefulset_manifest = DeploymentService._build_statefulset_manifest(
+            app_name, namespace, app_type, replicas, docker_image, port,
+            env_vars, storage_class, storage_size, custom_labels
+        )
+        
+        # Add nodeSelector if worker pool is specified
+        if worker_pool:
+            node_selector = DeploymentService._get_worker_pool_selector(worker_pool)
+            if node_selector:
+                statefulset_manifest['spec']['template']['spec']['nodeSelector'] = node_selector
+        
+        with ThreadPoolExecutor(max_workers=DEPLOY_WORKERS) as executor:
+            # Step 6: Create Secret, Service and MySQL replication ConfigMap (only need the namespace)
+            first_batch = [
+                _create_secret,
+                lambda: k8s_core_api.create_namespaced_service(namespace=namespace, body=service_manifest)
+            ]
+            if app_type == 'mysql' and replicas > 1:
+                first_batch.append(
+                    lambda: DeploymentService._create_mysql_replication_configmap(app_name, namespace, custom_labels)
+                )
+            try:
+                DeploymentService._run_concurrently(executor, first_batch)
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                # The namespace was deleted after it was cached: recreate it and retry once
+                DeploymentService._forget_namespace(namespace)
+                DeploymentService._ensure_namespace(namespace)
+                DeploymentService._run_concurrently(executor, first_batch)
             
+            # Step 7: Create StatefulSet (mounts the Secret/ConfigMap) and NDK Application CR if requested
+            second_batch = [
+                lambda: k8s_apps_api.create_namespaced_stateful_set(namespace=namespace, body=statefulset_manifest)
+            ]
+            if create_ndk_app:
+                second_batch.append(
+                    lambda: DeploymentService._create_ndk_application(app_name, namespace, custom_labels)
+                )
+            DeploymentService._run_concurrently(executor, second_batch)
+        
+        if create_ndk_app:
             # Reconcile label-based protection plans to pick up the new application
             try:
                 ProtectionPlanService.reconcile_label_based_apps()
             except Exception as e:
-                print(f"Warning: Failed to reconcile label-based protection plans during deployment: {e}")
+                logger.warning("Failed to reconcile label-based protection plans during deployment: %s", e)
         
         # Step 8: Create Protection Plan if requested
         if create_protection_plan and create_ndk_app:
@@ -161,48 +231,82 @@ class DeploymentService:
         }
     
     @staticmethod
-    def _build_env_vars(app_type, secret_name, database_name, app_name=None):
-        """Build environment variables based on application type"""
-        env_vars = []
+    def _ensure_namespace(namespace):
+        """
+        Create a namespace unless it is already known to exist
         
-        if app_type == 'mysql':
-            env_vars = [
-                {'name': 'MYSQL_ROOT_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-                {'name': 'MYSQL_REPLICATION_USER', 'value': 'repl'},
-                {'name': 'MYSQL_REPLICATION_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-            ]
-            if database_name:
-                env_vars.append({'name': 'MYSQL_DATABASE', 'value': database_name})
+        Args:
+            namespace: Namespace name
+        """
+        global _known_namespaces
+        with _known_namespaces_lock:
+            if _known_namespaces is None:
+                try:
+                    _known_namespaces = {ns.metadata.name for ns in k8s_core_api.list_namespace().items}
+                except ApiException:
+                    _known_namespaces = set()
+            if namespace in _known_namespaces:
+                return
         
-        elif app_type == 'postgresql':
-            env_vars = [
-                {'name': 'POSTGRES_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-            ]
-            if database_name:
-                env_vars.append({'name': 'POSTGRES_DB', 'value': database_name})
+        try:
+            k8s_core_api.read_namespace(namespace)
+        except ApiException as e:
+            if e.status != 404:
+                return
+            namespace_manifest = {
+                'apiVersion': 'v1',
+                'kind': 'Namespace',
+                'metadata': {'name': namespace}
+            }
+            k8s_core_api.create_namespace(body=namespace_manifest)
         
-        elif app_type == 'mongodb':
-            env_vars = [
-                {'name': 'MONGO_INITDB_ROOT_USERNAME', 'value': 'admin'},
-                {'name': 'MONGO_INITDB_ROOT_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-            ]
+        with _known_namespaces_lock:
+            _known_namespaces.add(namespace)
+    
+    @staticmethod
+    def _forget_namespace(namespace):
+        """
+        Drop a namespace from the known set so the next deploy checks it again
         
-        elif app_type == 'redis':
-            env_vars = [
-                {'name': 'REDIS_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-            ]
+        Args:
+            namespace: Namespace name
+        """
+        with _known_namespaces_lock:
+            if _known_namespaces is not None:
+                _known_namespaces.discard(namespace)
+    
+    @staticmethod
+    def _run_concurrently(executor, tasks):
+        """
+        Run independent API calls concurrently
         
-        elif app_type == 'elasticsearch':
-            env_vars = [
-                {'name': 'ELASTIC_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-                {'name': 'discovery.type', 'value': 'single-node'},
-                {'name': 'xpack.security.enabled', 'value': 'true'},
-            ]
+        Args:
+            executor: ThreadPoolExecutor to run the calls on
+            tasks: Callables taking no arguments
+            
+        Raises:
+            The first exception raised by any task
+        """
+        futures = [executor.submit(task) for task in tasks]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        for future in futures:
+            if future in done:
+                future.result()
+    
+    @staticmethod
+    def _build_env_vars(app_type, secret_name, database_name, app_name=None):
+        """Build environment variables based on application type"""
+        env_vars = [
+            {'name': env_name, 'value': value} if value is not None
+            else {'name': env_name, 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}}
+            for env_name, value in APP_ENV_TEMPLATES.get(app_type, ())
+        ]
         
-        elif app_type == 'cassandra':
-            env_vars = [
-                {'name': 'CASSANDRA_PASSWORD', 'valueFrom': {'secretKeyRef': {'name': secret_name, 'key': 'password'}}},
-            ]
+        database_env = DATABASE_ENV_VARS.get(app_type)
+        if database_env and database_name:
+            env_vars.append({'name': database_env, 'value': database_name})
         
         return env_vars
     
@@ -243,8 +347,7 @@ class DeploymentService:
                 break
         
         # Validate the format matches Kubernetes quantity regex
-        # Pattern: number followed by optional suffix (e, E, i, n, u, m, k, K, M, G, T, P)
-        if not re.match(r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$', storage_size):
+        if not STORAGE_QUANTITY_PATTERN.match(storage_size):
             raise ValueError(
                 f'Invalid storage size format: "{storage_size}". '
                 'Use Kubernetes quantity format (e.g., 10Gi, 50Mi, 100Gi)'
@@ -371,15 +474,7 @@ fi
                                     custom_labels=None):
         """Build StatefulSet manifest"""
         # Determine mount path based on app type
-        mount_paths = {
-            'mysql': '/var/lib/mysql',
-            'postgresql': '/var/lib/postgresql/data',
-            'mongodb': '/data/db',
-            'redis': '/data',
-            'elasticsearch': '/usr/share/elasticsearch/data',
-            'cassandra': '/var/lib/cassandra'
-        }
-        mount_path = mount_paths.get(app_type, '/data')
+        mount_path = MOUNT_PATHS.get(app_type, '/data')
         
         # Base container configuration
         container_spec = {
@@ -598,7 +693,7 @@ fi
             
             # Check node name-based matching (for NKP/Karbon clusters)
             if not node_matches:
-                match = re.search(r'nkp-[^-]+-[^-]+-(.+?)-worker-\d+$', node_name)
+                match = NKP_WORKER_NODE_PATTERN.search(node_name)
                 if match and match.group(1) == worker_pool:
                     # Found a node with this pool name - use its nodepool label if available
                     if 'nodepool' in labels:
@@ -634,7 +729,7 @@ fi
             metadata['labels'].update(custom_labels)
         
         ndk_app_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'Application',
             'metadata': metadata,
             'spec': {
@@ -698,7 +793,7 @@ fi
         
         # Step 2: Create ProtectionPlan
         protection_plan_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'ProtectionPlan',
             'metadata': {
                 'name': protection_plan_name,
@@ -727,7 +822,7 @@ fi
         
         # Step 3: Create AppProtectionPlan
         app_protection_plan_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'AppProtectionPlan',
             'metadata': {
                 'name': app_protection_plan_name,
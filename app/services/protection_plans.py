@@ -1,10 +1,18 @@
 """
 Protection Plans service - Business logic for NDK Protection Plans
 """
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes.client.rest import ApiException
 from app.extensions import k8s_api, with_auth_retry
+from app.utils.watch import list_custom_objects, get_custom_object, list_all_plan_snapshots
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent per-plan lookups in list_protection_plans
+PLAN_FETCH_WORKERS = 16
+
 
 class ProtectionPlanService:
     """Service class for managing NDK Protection Plans"""
@@ -17,11 +25,7 @@ class ProtectionPlanService:
         
         @with_auth_retry
         def _fetch_protection_plans():
-            return k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='protectionplans'
-            )
+            return list_custom_objects('protectionplans')
         
         try:
             result = _fetch_protection_plans()
@@ -32,111 +36,172 @@ class ProtectionPlanService:
             try:
                 ProtectionPlanService.reconcile_label_based_apps()
             except Exception as e:
-                print(f"Warning: Failed to reconcile label-based protection plans: {e}")
+                logger.warning("Failed to reconcile label-based protection plans: %s", e)
 
-            for item in result.get('items', []):
-                metadata = item.get('metadata', {})
-                spec = item.get('spec', {})
-                status = item.get('status', {})
-                
-                # Extract retention from annotations (time-based) or retentionPolicy (count-based)
-                annotations = metadata.get('annotations', {})
-                retention_duration = annotations.get('ndk-dashboard/retention-duration')
-                
-                if retention_duration:
-                    retention = retention_duration
-                else:
-                    retention_policy = spec.get('retentionPolicy', {})
-                    retention_count = retention_policy.get('retentionCount')
-                    retention = retention_count if retention_count else 'Not set'
-                
-                # Extract schedule from JobScheduler reference
-                schedule = 'Not set'
-                schedule_name = spec.get('scheduleName')
-                if schedule_name:
-                    try:
-                        # Fetch the JobScheduler resource
-                        scheduler = k8s_api.get_namespaced_custom_object(
-                            group='scheduler.nutanix.com',
-                            version='v1alpha1',
-                            namespace=metadata.get('namespace', 'default'),
-                            plural='jobschedulers',
-                            name=schedule_name
-                        )
-                        schedule = scheduler.get('spec', {}).get('cronSchedule', schedule_name)
-                    except:
-                        # If we can't fetch the scheduler, just show the name
-                        schedule = schedule_name
-                
-                # Get last execution time from most recent snapshot
-                last_execution = 'Never'
-                plan_name = metadata.get('name', 'Unknown')
-                plan_namespace = metadata.get('namespace', 'default')
-                try:
-                    # Fetch snapshots with label selector for this protection plan
-                    # NDK uses the full domain prefix for protection plan labels
-                    snapshots = k8s_api.list_namespaced_custom_object(
-                        group=Config.NDK_API_GROUP,
-                        version=Config.NDK_API_VERSION,
-                        namespace=plan_namespace,
-                        plural='applicationsnapshots',
-                        label_selector=f'dataservices.nutanix.com/protection-plan={plan_name}'
-                    )
-                    
-                    # Find the most recent snapshot creation time
-                    latest_time = None
-                    for snap in snapshots.get('items', []):
-                        snap_status = snap.get('status', {})
-                        creation_time = snap_status.get('creationTime')
-                        if creation_time:
-                            if latest_time is None or creation_time > latest_time:
-                                latest_time = creation_time
-                    
-                    if latest_time:
-                        last_execution = latest_time
-                except:
-                    # If we can't fetch snapshots, keep 'Never'
-                    pass
-                
-                # Check if the plan is stuck in deletion (has deletionTimestamp)
-                deletion_timestamp = metadata.get('deletionTimestamp')
-                finalizers = metadata.get('finalizers', [])
-                is_deleting = deletion_timestamp is not None
-                
-                # Extract selection mode, label selector, and timezone from annotations
-                annotations = metadata.get('annotations', {})
-                selection_mode = annotations.get('ndk-dashboard/selection-mode', 'by-name')
-                label_selector_key = annotations.get('ndk-dashboard/label-selector-key')
-                label_selector_value = annotations.get('ndk-dashboard/label-selector-value')
-                timezone = annotations.get('ndk-dashboard/timezone', 'UTC')  # Default to UTC if not set
-                
-                protected_apps = ProtectionPlanService._get_protected_applications(
-                    plan_name, plan_namespace, selection_mode, label_selector_key, label_selector_value
-                )
-                
-                plans.append({
-                    'name': plan_name,
-                    'namespace': plan_namespace,
-                    'created': metadata.get('creationTimestamp', ''),
-                    'schedule': schedule,
-                    'retention': retention,
-                    'applications': protected_apps,
-                    'suspend': spec.get('suspend', False),
-                    'state': status.get('state', 'Unknown'),
-                    'lastExecution': last_execution,
-                    'isDeleting': is_deleting,
-                    'hasFinalizers': len(finalizers) > 0,
-                    'selectionMode': selection_mode,
-                    'labelSelectorKey': label_selector_key,
-                    'labelSelectorValue': label_selector_value,
-                    'timezone': timezone  # Include timezone for display
-                })
+            # Each plan may still need API round-trips for its applications; overlap them
+            items = result.get('items', [])
+            if items:
+                last_executions = ProtectionPlanService._get_last_executions()
+                schedules = ProtectionPlanService._get_schedules(items)
+                with ThreadPoolExecutor(max_workers=min(PLAN_FETCH_WORKERS, len(items))) as executor:
+                    plans = list(executor.map(
+                        lambda item: ProtectionPlanService._enrich_plan(item, last_executions, schedules),
+                        items
+                    ))
             
             return plans
         except ApiException as e:
-            print(f"Error fetching protection plans: {e}")
+            logger.error("Error fetching protection plans: %s", e)
             return []
     
+    @staticmethod
+    def _get_last_executions():
+        """
+        Get the most recent snapshot creation time of every protection plan
+        
+        Uses a single cluster-wide list of plan-owned snapshots instead of one
+        list call per plan.
+        
+        Returns:
+            Dict mapping (namespace, plan name) to the latest creationTime
+        """
+        last_executions = {}
+        try:
+            # Served from the snapshot watch store's plan index when it is in sync
+            snapshots = list_all_plan_snapshots()
+        except ApiException as e:
+            # Without snapshots every plan just shows 'Never'
+            logger.warning("Failed to fetch protection plan snapshots: %s", e)
+            return last_executions
+        
+        for snap in snapshots:
+            snap_metadata = snap.get('metadata', {})
+            plan_name = snap_metadata.get('labels', {}).get('dataservices.nutanix.com/protection-plan')
+            creation_time = snap.get('status', {}).get('creationTime')
+            if not plan_name or not creation_time:
+                continue
+            key = (snap_metadata.get('namespace'), plan_name)
+            if key not in last_executions or creation_time > last_executions[key]:
+                last_executions[key] = creation_time
+        
+        return last_executions
+    
+    @staticmethod
+    def _get_schedules(items):
+        """
+        Get the cron schedules of the JobSchedulers that Protection Plans reference
+        
+        Each scheduler is fetched once, even when several plans share it, and the
+        lookups run concurrently.
+        
+        Args:
+            items: ProtectionPlan custom objects
+            
+        Returns:
+            Dict mapping (namespace, scheduler name) to its cronSchedule; schedulers
+            that can't be fetched are left out
+        """
+        keys = {
+            (item.get('metadata', {}).get('namespace', 'default'), item.get('spec', {}).get('scheduleName'))
+            for item in items
+        }
+        keys = [key for key in keys if key[1]]
+        if not keys:
+            return {}
+        
+        def fetch(key):
+            namespace, schedule_name = key
+            try:
+                scheduler = k8s_api.get_namespaced_custom_object(
+                    group='scheduler.nutanix.com',
+                    version='v1alpha1',
+                    namespace=namespace,
+                    plural='jobschedulers',
+                    name=schedule_name
+                )
+                return key, scheduler.get('spec', {}).get('cronSchedule', schedule_name)
+            except Exception:
+                return key, None
+        
+        with ThreadPoolExecutor(max_workers=min(PLAN_FETCH_WORKERS, len(keys))) as executor:
+            return {key: cron for key, cron in executor.map(fetch, keys) if cron is not None}
+    
+    @staticmethod
+    def _enrich_plan(item, last_executions, schedules):
+        """
+        Build the dashboard view of a single Protection Plan
+        
+        Resolves the protected applications, which may cost an API round-trip.
+        
+        Args:
+            item: ProtectionPlan custom object
+            last_executions: Latest snapshot time per (namespace, plan name)
+            schedules: Cron schedule per (namespace, scheduler name)
+            
+        Returns:
+            Plan dict as returned by list_protection_plans
+        """
+        metadata = item.get('metadata', {})
+        spec = item.get('spec', {})
+        status = item.get('status', {})
+        
+        # Extract retention from annotations (time-based) or retentionPolicy (count-based)
+        annotations = metadata.get('annotations', {})
+        retention_duration = annotations.get('ndk-dashboard/retention-duration')
+        
+        if retention_duration:
+            retention = retention_duration
+        else:
+            retention_policy = spec.get('retentionPolicy', {})
+            retention_count = retention_policy.get('retentionCount')
+            retention = retention_count if retention_count else 'Not set'
+        
+        # Extract schedule from JobScheduler reference
+        schedule = 'Not set'
+        schedule_name = spec.get('scheduleName')
+        if schedule_name:
+            # If we couldn't fetch the scheduler, just show the name
+            schedule = schedules.get((metadata.get('namespace', 'default'), schedule_name), schedule_name)
+        
+        # Get last execution time from most recent snapshot
+        plan_name = metadata.get('name', 'Unknown')
+        plan_namespace = metadata.get('namespace', 'default')
+        last_execution = last_executions.get((plan_namespace, plan_name), 'Never')
+        
+        # Check if the plan is stuck in deletion (has deletionTimestamp)
+        deletion_timestamp = metadata.get('deletionTimestamp')
+        finalizers = metadata.get('finalizers', [])
+        is_deleting = deletion_timestamp is not None
+        
+        # Extract selection mode, label selector, and timezone from annotations
+        annotations = metadata.get('annotations', {})
+        selection_mode = annotations.get('ndk-dashboard/selection-mode', 'by-name')
+        label_selector_key = annotations.get('ndk-dashboard/label-selector-key')
+        label_selector_value = annotations.get('ndk-dashboard/label-selector-value')
+        timezone = annotations.get('ndk-dashboard/timezone', 'UTC')  # Default to UTC if not set
+        
+        protected_apps = ProtectionPlanService._get_protected_applications(
+            plan_name, plan_namespace, selection_mode, label_selector_key, label_selector_value
+        )
+        
+        return {
+            'name': plan_name,
+            'namespace': plan_namespace,
+            'created': metadata.get('creationTimestamp', ''),
+            'schedule': schedule,
+            'retention': retention,
+            'applications': protected_apps,
+            'suspend': spec.get('suspend', False),
+            'state': status.get('state', 'Unknown'),
+            'lastExecution': last_execution,
+            'isDeleting': is_deleting,
+            'hasFinalizers': len(finalizers) > 0,
+            'selectionMode': selection_mode,
+            'labelSelectorKey': label_selector_key,
+            'labelSelectorValue': label_selector_value,
+            'timezone': timezone  # Include timezone for display
+        }
+
     @staticmethod
     def _get_protected_applications(plan_name, plan_namespace, selection_mode, label_selector_key, label_selector_value):
         """Get applications protected by a protection plan based on selection mode"""
@@ -149,12 +214,7 @@ class ProtectionPlanService:
         try:
             if selection_mode == 'by-label':
                 if label_selector_key and label_selector_value:
-                    applications = k8s_api.list_namespaced_custom_object(
-                        group=Config.NDK_API_GROUP,
-                        version=Config.NDK_API_VERSION,
-                        namespace=plan_namespace,
-                        plural='applications'
-                    )
+                    applications = list_custom_objects('applications', namespace=plan_namespace)
                     
                     for app in applications.get('items', []):
                         app_metadata = app.get('metadata', {})
@@ -171,12 +231,7 @@ class ProtectionPlanService:
                                     'namespace': app_namespace
                                 })
             else:
-                app_protection_plans = k8s_api.list_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=plan_namespace,
-                    plural='appprotectionplans'
-                )
+                app_protection_plans = list_custom_objects('appprotectionplans', namespace=plan_namespace)
                 
                 for app_plan in app_protection_plans.get('items', []):
                     app_plan_spec = app_plan.get('spec', {})
@@ -207,13 +262,7 @@ class ProtectionPlanService:
         if not k8s_api:
             raise Exception('Kubernetes API not available')
         
-        result = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='protectionplans',
-            name=name
-        )
+        result = get_custom_object('protectionplans', namespace, name)
         
         metadata = result.get('metadata', {})
         spec = result.get('spec', {})
@@ -266,6 +315,7 @@ class ProtectionPlanService:
             raise Exception('Kubernetes API not available')
         
         # First, get the protection plan to find the associated scheduler
+        deletion_completed = False
         try:
             plan = k8s_api.get_namespaced_custom_object(
                 group=Config.NDK_API_GROUP,
@@ -275,6 +325,7 @@ class ProtectionPlanService:
                 name=name
             )
             schedule_name = plan.get('spec', {}).get('scheduleName')
+            plan_deleting = plan.get('metadata', {}).get('deletionTimestamp') is not None
             
             # Delete the associated JobScheduler if it exists
             if schedule_name:
@@ -291,12 +342,7 @@ class ProtectionPlanService:
             
             # Delete associated AppProtectionPlans
             try:
-                app_plans = k8s_api.list_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=namespace,
-                    plural='appprotectionplans'
-                )
+                app_plans = list_custom_objects('appprotectionplans', namespace=namespace)
                 
                 for app_plan in app_plans.get('items', []):
                     plan_spec = app_plan.get('spec', {})
@@ -329,12 +375,17 @@ class ProtectionPlanService:
                         name=name,
                         body={'metadata': {'finalizers': []}}
                     )
+                    # A plan already marked for deletion is removed as soon as its finalizers are cleared
+                    deletion_completed = plan_deleting
                 except:
                     pass  # Might already be deleted
         except ApiException as e:
             if e.status != 404:
                 raise
         
+        if deletion_completed:
+            return f'Protection plan {name} deleted successfully'
+        
         # Delete the protection plan
         k8s_api.delete_namespaced_custom_object(
             group=Config.NDK_API_GROUP,
@@ -406,9 +457,8 @@ class ProtectionPlanService:
             annotations['ndk-dashboard/label-selector-key'] = label_selector_key
             annotations['ndk-dashboard/label-selector-value'] = label_selector_value
         
-        import sys
-        print(f"DEBUG CREATE: selection_mode={selection_mode}, label_key={label_selector_key}, label_value={label_selector_value}", file=sys.stderr, flush=True)
-        print(f"DEBUG CREATE: annotations={annotations}", file=sys.stderr, flush=True)
+        logger.debug("selection_mode=%s, label_key=%s, label_value=%s", selection_mode, label_selector_key, label_selector_value)
+        logger.debug("annotations=%s", annotations)
         
         # Determine which applications to protect BEFORE creating the ProtectionPlan
         apps_to_protect = []
@@ -433,13 +483,13 @@ class ProtectionPlanService:
                         app_name = ndk_app.get('metadata', {}).get('name')
                         if app_name:
                             apps_to_protect.append(app_name)
-                            print(f"Found matching application: {app_name} with {label_selector_key}={label_selector_value}", file=sys.stderr, flush=True)
+                            logger.info("Found matching application: %s with %s=%s", app_name, label_selector_key, label_selector_value)
             except ApiException as e:
-                print(f"Warning: Failed to query NDK Applications: {e.reason}", file=sys.stderr, flush=True)
+                logger.warning("Failed to query NDK Applications: %s", e.reason)
         
         # Create ProtectionPlan with the populated applications list
         plan_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'ProtectionPlan',
             'metadata': {
                 'name': name,
@@ -476,7 +526,7 @@ class ProtectionPlanService:
             
             app_protection_plan_name = f"{app_name}-{name}"
             app_protection_manifest = {
-                'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+                'apiVersion': Config.NDK_API_GROUP_VERSION,
                 'kind': 'AppProtectionPlan',
                 'metadata': {
                     'name': app_protection_plan_name,
@@ -496,11 +546,11 @@ class ProtectionPlanService:
                     plural='appprotectionplans',
                     body=app_protection_manifest
                 )
-                print(f"Created AppProtectionPlan: {app_protection_plan_name} in namespace {app_namespace}", file=sys.stderr, flush=True)
+                logger.info("Created AppProtectionPlan: %s in namespace %s", app_protection_plan_name, app_namespace)
             except ApiException as e:
                 # If it already exists, that's okay
                 if e.status != 409:
-                    print(f"Warning: Failed to create AppProtectionPlan for {app_name}: {e.reason}", file=sys.stderr, flush=True)
+                    logger.warning("Failed to create AppProtectionPlan for %s: %s", app_name, e.reason)
         
         return {
             'name': name,
@@ -518,11 +568,7 @@ class ProtectionPlanService:
 
         try:
             # Get all protection plans
-            plans_result = k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='protectionplans'
-            )
+            plans_result = list_custom_objects('protectionplans')
             
             for plan in plans_result.get('items', []):
                 metadata = plan.get('metadata', {})
@@ -542,20 +588,10 @@ class ProtectionPlanService:
                 namespace = metadata.get('namespace')
                 
                 # Find all applications in this namespace
-                apps_result = k8s_api.list_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=namespace,
-                    plural='applications'
-                )
+                apps_result = list_custom_objects('applications', namespace=namespace)
                 
                 # Find all existing AppProtectionPlans for this plan
-                existing_app_plans_result = k8s_api.list_namespaced_custom_object(
-                    group=Config.NDK_API_GROUP,
-                    version=Config.NDK_API_VERSION,
-                    namespace=namespace,
-                    plural='appprotectionplans'
-                )
+                existing_app_plans_result = list_custom_objects('appprotectionplans', namespace=namespace)
                 
                 existing_protected_apps = set()
                 for app_plan in existing_app_plans_result.get('items', []):
@@ -574,7 +610,7 @@ class ProtectionPlanService:
                             # Need to create AppProtectionPlan
                             app_protection_plan_name = f"{app_name}-{plan_name}"
                             app_protection_manifest = {
-                                'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+                                'apiVersion': Config.NDK_API_GROUP_VERSION,
                                 'kind': 'AppProtectionPlan',
                                 'metadata': {
                                     'name': app_protection_plan_name,
@@ -594,9 +630,9 @@ class ProtectionPlanService:
                                     plural='appprotectionplans',
                                     body=app_protection_manifest
                                 )
-                                print(f"Successfully reconciled: Created AppProtectionPlan {app_protection_plan_name} for {app_name}")
+                                logger.info("Successfully reconciled: Created AppProtectionPlan %s for %s", app_protection_plan_name, app_name)
                             except ApiException as e:
                                 if e.status != 409:
-                                    print(f"Error creating reconciled AppProtectionPlan for {app_name}: {e}")
+                                    logger.error("Error creating reconciled AppProtectionPlan for %s: %s", app_name, e)
         except Exception as e:
-            print(f"Error in reconcile_label_based_apps: {e}")
+            logger.error("Error in reconcile_label_based_apps: %s", e)
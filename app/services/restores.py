@@ -1,10 +1,14 @@
 """
 Restore service - Manage ApplicationSnapshotRestore resources
 """
+import logging
 from kubernetes.client.rest import ApiException
 from app.extensions import k8s_api, with_auth_retry
+from app.utils.watch import list_custom_objects
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 
 def list_restore_jobs(namespace=None):
     """
@@ -21,19 +25,8 @@ def list_restore_jobs(namespace=None):
     
     @with_auth_retry
     def _fetch():
-        if namespace:
-            return k8s_api.list_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applicationsnapshotrestores'
-            )
-        else:
-            return k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='applicationsnapshotrestores'
-            )
+        # Served from the watch store when it is in sync
+        return list_custom_objects('applicationsnapshotrestores', namespace=namespace)
     
     try:
         result = _fetch()
@@ -67,7 +60,7 @@ def list_restore_jobs(namespace=None):
         
         return restore_jobs
     except ApiException as e:
-        print(f"Error fetching restore jobs: {e}")
+        logger.error("Error fetching restore jobs: %s", e)
         return []
 
 
@@ -1,15 +1,23 @@
 """
 Snapshot service - Business logic for NDK Application Snapshots
 """
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes.client.rest import ApiException
 from app.extensions import k8s_api, k8s_core_api, with_auth_retry
+from app.utils.errors import api_error_message
+from app.utils.watch import list_custom_objects, get_custom_object, custom_object_known, wait_for_change
 from config import Config
 import logging
-import sys
+import time
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent create calls in bulk_create_snapshots
+BULK_SNAPSHOT_WORKERS = 32
+
+# Max seconds to wait for NDK to report conditions on a new restore
+RESTORE_STATUS_WAIT = 2
+
 
 class SnapshotService:
     """Service class for managing NDK Application Snapshots"""
@@ -22,72 +30,63 @@ class SnapshotService:
         
         @with_auth_retry
         def _fetch_snapshots():
-            return k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='applicationsnapshots'
-            )
+            return list_custom_objects('applicationsnapshots')
         
         try:
             result = _fetch_snapshots()
             
             snapshots = []
+            append = snapshots.append
             for item in result.get('items', []):
                 metadata = item.get('metadata', {})
                 spec = item.get('spec', {})
                 status = item.get('status', {})
+                metadata_get = metadata.get
+                status_get = status.get
                 
                 # Extract application name from source
-                source = spec.get('source', {})
-                app_ref = source.get('applicationRef', {})
-                app_name = app_ref.get('name', 'Unknown')
+                app_name = spec.get('source', {}).get('applicationRef', {}).get('name', 'Unknown')
                 
                 # Extract protection plan from labels
-                labels = metadata.get('labels', {})
                 # NDK uses the full domain prefix for protection plan labels
-                protection_plan = labels.get('dataservices.nutanix.com/protection-plan', None)
+                protection_plan = metadata_get('labels', {}).get('dataservices.nutanix.com/protection-plan')
                 
                 # Get creation time for grouping snapshots from same execution
-                creation_time = status.get('creationTime', metadata.get('creationTimestamp', ''))
+                created = metadata_get('creationTimestamp', '')
+                creation_time = status_get('creationTime', created)
                 
                 # Determine state - check for deletion first
-                if metadata.get('deletionTimestamp'):
+                if metadata_get('deletionTimestamp'):
                     state = 'Deleting'
+                elif status_get('readyToUse', False):
+                    state = 'Ready'
+                elif status:
+                    # Check for error conditions in status conditions array
+                    has_error = any(
+                        cond.get('type') == 'Failed' or 
+                        cond.get('reason', '').endswith('Failed')
+                        for cond in status_get('conditions', [])
+                    )
+                    state = 'Failed' if has_error else 'Creating'
                 else:
-                    ready_to_use = status.get('readyToUse', False)
-                    if ready_to_use:
-                        state = 'Ready'
-                    elif status:
-                        # Check for error conditions in status conditions array
-                        conditions = status.get('conditions', [])
-                        has_error = any(
-                            cond.get('type') == 'Failed' or 
-                            cond.get('reason', '').endswith('Failed')
-                            for cond in conditions
-                        )
-                        if has_error:
-                            state = 'Failed'
-                        else:
-                            state = 'Creating'
-                    else:
-                        state = 'Unknown'
+                    state = 'Unknown'
                 
-                snapshots.append({
-                    'name': metadata.get('name', 'Unknown'),
-                    'namespace': metadata.get('namespace', 'default'),
-                    'created': metadata.get('creationTimestamp', ''),
+                append({
+                    'name': metadata_get('name', 'Unknown'),
+                    'namespace': metadata_get('namespace', 'default'),
+                    'created': created,
                     'creationTime': creation_time,
                     'application': app_name,
                     'expiresAfter': spec.get('expiresAfter', 'Not set'),
                     'state': state,
-                    'consistencyType': status.get('consistencyType', 'Unknown'),
-                    'expirationTime': status.get('expirationTime', 'Not set'),
+                    'consistencyType': status_get('consistencyType', 'Unknown'),
+                    'expirationTime': status_get('expirationTime', 'Not set'),
                     'protectionPlan': protection_plan
                 })
             
             return snapshots
         except ApiException as e:
-            print(f"Error fetching snapshots: {e}")
+            logger.error("Error fetching snapshots: %s", e)
             return []
     
     @staticmethod
@@ -100,12 +99,12 @@ class SnapshotService:
             raise ValueError('Application name and namespace are required')
         
         # Generate snapshot name with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        timestamp = time.strftime('%Y%m%d-%H%M%S', time.gmtime())
         snapshot_name = f"{app_name}-snapshot-{timestamp}"
         
         # Create snapshot manifest
         snapshot_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'ApplicationSnapshot',
             'metadata': {
                 'name': snapshot_name,
@@ -166,16 +165,8 @@ class SnapshotService:
         if not k8s_api:
             raise Exception('Kubernetes API not available')
         
-        import time
-        
         # Get the snapshot to find the application name
-        snapshot = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='applicationsnapshots',
-            name=name
-        )
+        snapshot = get_custom_object('applicationsnapshots', namespace, name)
         
         # Extract application name from snapshot
         spec = snapshot.get('spec', {})
@@ -192,83 +183,64 @@ class SnapshotService:
         # Create target namespace if it doesn't exist
         try:
             k8s_core_api.read_namespace(restore_namespace)
-            logger.info(f"✓ Target namespace '{restore_namespace}' exists")
-            sys.stdout.flush()
+            logger.info("✓ Target namespace '%s' exists", restore_namespace)
         except ApiException as e:
             if e.status == 404:
-                logger.info(f"⚠ Target namespace '{restore_namespace}' not found, creating it...")
-                sys.stdout.flush()
+                logger.info("⚠ Target namespace '%s' not found, creating it...", restore_namespace)
                 namespace_manifest = {
                     'apiVersion': 'v1',
                     'kind': 'Namespace',
                     'metadata': {'name': restore_namespace}
                 }
                 k8s_core_api.create_namespace(body=namespace_manifest)
-                logger.info(f"✓ Created namespace '{restore_namespace}'")
-                sys.stdout.flush()
+                logger.info("✓ Created namespace '%s'", restore_namespace)
             else:
                 raise
         
         # For cross-namespace restores, create a ReferenceGrant to allow access
         if restore_namespace != namespace:
-            logger.info(f"🔐 Cross-namespace restore detected, ensuring ReferenceGrant exists...")
-            sys.stdout.flush()
+            logger.info("🔐 Cross-namespace restore detected, ensuring ReferenceGrant exists...")
             
             reference_grant_name = f"allow-restore-from-{restore_namespace}"
             
-            # Check if ReferenceGrant already exists
+            # Create the ReferenceGrant; 409 means it already exists
+            reference_grant_manifest = {
+                'apiVersion': 'gateway.networking.k8s.io/v1beta1',
+                'kind': 'ReferenceGrant',
+                'metadata': {
+                    'name': reference_grant_name,
+                    'namespace': namespace  # SOURCE namespace where snapshot exists
+                },
+                'spec': {
+                    'from': [{
+                        'group': 'dataservices.nutanix.com',
+                        'kind': 'ApplicationSnapshotRestore',
+                        'namespace': restore_namespace  # TARGET namespace
+                    }],
+                    'to': [{
+                        'group': 'dataservices.nutanix.com',
+                        'kind': 'ApplicationSnapshot'
+                    }]
+                }
+            }
+            
             try:
-                k8s_api.get_namespaced_custom_object(
+                k8s_api.create_namespaced_custom_object(
                     group='gateway.networking.k8s.io',
                     version='v1beta1',
-                    namespace=namespace,  # Grant is created in the SOURCE namespace
+                    namespace=namespace,
                     plural='referencegrants',
-                    name=reference_grant_name
+                    body=reference_grant_manifest
                 )
-                logger.info(f"✓ ReferenceGrant '{reference_grant_name}' already exists")
-                sys.stdout.flush()
+                logger.info("✓ Created ReferenceGrant '%s' in namespace '%s'", reference_grant_name, namespace)
             except ApiException as e:
-                if e.status == 404:
-                    # Create the ReferenceGrant
-                    logger.info(f"⚠ ReferenceGrant not found, creating it...")
-                    sys.stdout.flush()
-                    
-                    reference_grant_manifest = {
-                        'apiVersion': 'gateway.networking.k8s.io/v1beta1',
-                        'kind': 'ReferenceGrant',
-                        'metadata': {
-                            'name': reference_grant_name,
-                            'namespace': namespace  # SOURCE namespace where snapshot exists
-                        },
-                        'spec': {
-                            'from': [{
-                                'group': 'dataservices.nutanix.com',
-                                'kind': 'ApplicationSnapshotRestore',
-                                'namespace': restore_namespace  # TARGET namespace
-                            }],
-                            'to': [{
-                                'group': 'dataservices.nutanix.com',
-                                'kind': 'ApplicationSnapshot'
-                            }]
-                        }
-                    }
-                    
-                    k8s_api.create_namespaced_custom_object(
-                        group='gateway.networking.k8s.io',
-                        version='v1beta1',
-                        namespace=namespace,
-                        plural='referencegrants',
-                        body=reference_grant_manifest
-                    )
-                    logger.info(f"✓ Created ReferenceGrant '{reference_grant_name}' in namespace '{namespace}'")
-                    sys.stdout.flush()
-                else:
+                if e.status != 409:
                     raise
+                logger.info("✓ ReferenceGrant '%s' already exists", reference_grant_name)
         
         # For cross-namespace restores, copy ConfigMaps and Secrets
         if restore_namespace != namespace:
-            logger.info(f"📦 Copying ConfigMaps and Secrets from '{namespace}' to '{restore_namespace}'...")
-            sys.stdout.flush()
+            logger.info("📦 Copying ConfigMaps and Secrets from '%s' to '%s'...", namespace, restore_namespace)
             
             # Get all ConfigMaps from source namespace
             try:
@@ -280,42 +252,36 @@ class SnapshotService:
                     if cm_name.startswith('kube-') or cm_name.startswith('istio-'):
                         continue
                     
-                    # Check if ConfigMap already exists in target namespace
+                    # Copy the ConfigMap and add application label for proper cleanup
+                    labels = cm.metadata.labels.copy() if cm.metadata.labels else {}
+                    # Add the application label so it can be found by label selector during deletion
+                    # Use original_app_name to match the Application CRD selector (NDK restores with original names)
+                    labels['app'] = original_app_name
+                    
+                    new_cm = {
+                        'apiVersion': 'v1',
+                        'kind': 'ConfigMap',
+                        'metadata': {
+                            'name': cm_name,
+                            'namespace': restore_namespace,
+                            'labels': labels
+                        },
+                        'data': cm.data or {}
+                    }
+                    # Create directly; 409 means it already exists in the target namespace
                     try:
-                        k8s_core_api.read_namespaced_config_map(cm_name, restore_namespace)
-                        logger.info(f"  ✓ ConfigMap '{cm_name}' already exists in target namespace")
-                        sys.stdout.flush()
+                        k8s_core_api.create_namespaced_config_map(restore_namespace, new_cm)
+                        copied_cm_count += 1
+                        logger.info("  ✓ Copied ConfigMap '%s'", cm_name)
                     except ApiException as e:
-                        if e.status == 404:
-                            # Copy the ConfigMap and add application label for proper cleanup
-                            labels = cm.metadata.labels.copy() if cm.metadata.labels else {}
-                            # Add the application label so it can be found by label selector during deletion
-                            # Use original_app_name to match the Application CRD selector (NDK restores with original names)
-                            labels['app'] = original_app_name
-                            
-                            new_cm = {
-                                'apiVersion': 'v1',
-                                'kind': 'ConfigMap',
-                                'metadata': {
-                                    'name': cm_name,
-                                    'namespace': restore_namespace,
-                                    'labels': labels
-                                },
-                                'data': cm.data or {}
-                            }
-                            k8s_core_api.create_namespaced_config_map(restore_namespace, new_cm)
-                            copied_cm_count += 1
-                            logger.info(f"  ✓ Copied ConfigMap '{cm_name}'")
-                            sys.stdout.flush()
-                        else:
+                        if e.status != 409:
                             raise
+                        logger.info("  ✓ ConfigMap '%s' already exists in target namespace", cm_name)
                 
                 if copied_cm_count > 0:
-                    logger.info(f"✓ Copied {copied_cm_count} ConfigMap(s)")
-                    sys.stdout.flush()
+                    logger.info("✓ Copied %s ConfigMap(s)", copied_cm_count)
             except ApiException as e:
-                logger.warning(f"⚠ Error copying ConfigMaps: {e}")
-                sys.stdout.flush()
+                logger.warning("⚠ Error copying ConfigMaps: %s", e)
             
             # Get all Secrets from source namespace
             try:
@@ -329,52 +295,46 @@ class SnapshotService:
                         secret.type == 'kubernetes.io/service-account-token'):
                         continue
                     
-                    # Check if Secret already exists in target namespace
+                    # Copy the Secret and add application label for proper cleanup
+                    labels = secret.metadata.labels.copy() if secret.metadata.labels else {}
+                    # Add the application label so it can be found by label selector during deletion
+                    # Use original_app_name to match the Application CRD selector (NDK restores with original names)
+                    labels['app'] = original_app_name
+                    
+                    new_secret = {
+                        'apiVersion': 'v1',
+                        'kind': 'Secret',
+                        'metadata': {
+                            'name': secret_name,
+                            'namespace': restore_namespace,
+                            'labels': labels
+                        },
+                        'type': secret.type,
+                        'data': secret.data or {}
+                    }
+                    # Create directly; 409 means it already exists in the target namespace
                     try:
-                        k8s_core_api.read_namespaced_secret(secret_name, restore_namespace)
-                        logger.info(f"  ✓ Secret '{secret_name}' already exists in target namespace")
-                        sys.stdout.flush()
+                        k8s_core_api.create_namespaced_secret(restore_namespace, new_secret)
+                        copied_secret_count += 1
+                        logger.info("  ✓ Copied Secret '%s'", secret_name)
                     except ApiException as e:
-                        if e.status == 404:
-                            # Copy the Secret and add application label for proper cleanup
-                            labels = secret.metadata.labels.copy() if secret.metadata.labels else {}
-                            # Add the application label so it can be found by label selector during deletion
-                            # Use original_app_name to match the Application CRD selector (NDK restores with original names)
-                            labels['app'] = original_app_name
-                            
-                            new_secret = {
-                                'apiVersion': 'v1',
-                                'kind': 'Secret',
-                                'metadata': {
-                                    'name': secret_name,
-                                    'namespace': restore_namespace,
-                                    'labels': labels
-                                },
-                                'type': secret.type,
-                                'data': secret.data or {}
-                            }
-                            k8s_core_api.create_namespaced_secret(restore_namespace, new_secret)
-                            copied_secret_count += 1
-                            logger.info(f"  ✓ Copied Secret '{secret_name}'")
-                            sys.stdout.flush()
-                        else:
+                        if e.status != 409:
                             raise
+                        logger.info("  ✓ Secret '%s' already exists in target namespace", secret_name)
                 
                 if copied_secret_count > 0:
-                    logger.info(f"✓ Copied {copied_secret_count} Secret(s)")
-                    sys.stdout.flush()
+                    logger.info("✓ Copied %s Secret(s)", copied_secret_count)
             except ApiException as e:
-                logger.warning(f"⚠ Error copying Secrets: {e}")
-                sys.stdout.flush()
+                logger.warning("⚠ Error copying Secrets: %s", e)
         
         # Generate a unique name for the restore operation
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        timestamp = time.strftime('%Y%m%d-%H%M%S', time.gmtime())
         restore_name = f"{restored_app_name}-restore-{timestamp}"
         
         # Create ApplicationSnapshotRestore manifest (NDK 1.3.0+)
         # The restore CRD is created in the TARGET namespace where resources will be restored
         restore_manifest = {
-            'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
             'kind': 'ApplicationSnapshotRestore',
             'metadata': {
                 'name': restore_name,
@@ -387,11 +347,10 @@ class SnapshotService:
         }
         
         # Log the restore manifest for debugging
-        logger.info(f"📝 Creating restore with manifest:")
-        logger.info(f"   Snapshot: {namespace}/{name}")
-        logger.info(f"   Target Namespace: {restore_namespace}")
-        logger.info(f"   Restore Name: {restore_name}")
-        sys.stdout.flush()
+        logger.info("📝 Creating restore with manifest:")
+        logger.info("   Snapshot: %s/%s", namespace, name)
+        logger.info("   Target Namespace: %s", restore_namespace)
+        logger.info("   Restore Name: %s", restore_name)
         
         # Create the restore operation
         result = k8s_api.create_namespaced_custom_object(
@@ -402,22 +361,11 @@ class SnapshotService:
             body=restore_manifest
         )
         
-        logger.info(f"✓ Restore operation {restore_name} initiated")
-        sys.stdout.flush()
-        
-        # Wait a moment for NDK to process and check for immediate errors
-        import time
-        time.sleep(2)
+        logger.info("✓ Restore operation %s initiated", restore_name)
         
         # Check the restore status for immediate errors
         try:
-            restore_status = k8s_api.get_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=restore_namespace,
-                plural='applicationsnapshotrestores',
-                name=restore_name
-            )
+            restore_status = SnapshotService._wait_for_restore_status(restore_namespace, restore_name)
             
             status = restore_status.get('status', {})
             conditions = status.get('conditions', [])
@@ -447,19 +395,16 @@ class SnapshotService:
                     )
                     
                     if is_in_progress:
-                        logger.info(f"⏳ Restore in progress - {error_type}: {error_reason}")
-                        logger.info(f"   Message: {error_msg}")
-                        sys.stdout.flush()
+                        logger.info("⏳ Restore in progress - %s: %s", error_type, error_reason)
+                        logger.info("   Message: %s", error_msg)
                         continue
                     
                     # This is an actual failure
-                    logger.error(f"❌ Restore failed - Type: {error_type}, Reason: {error_reason}")
-                    logger.error(f"   Message: {error_msg}")
-                    sys.stdout.flush()
+                    logger.error("❌ Restore failed - Type: %s, Reason: %s", error_type, error_reason)
+                    logger.error("   Message: %s", error_msg)
                     raise Exception(f"Restore failed: {error_msg}")
             
-            logger.info(f"✓ Restore initiated successfully, phase: {status.get('phase', 'Unknown')}")
-            sys.stdout.flush()
+            logger.info("✓ Restore initiated successfully, phase: %s", status.get('phase', 'Unknown'))
             
         except ApiException as e:
             if e.status != 404:  # Ignore if status not yet available
@@ -467,18 +412,11 @@ class SnapshotService:
         
         # NDK does NOT automatically create the Application CRD for restores
         # We need to create it manually so the restored app appears in the dashboard
-        logger.info(f"📋 Creating NDK Application CRD for restored application...")
-        sys.stdout.flush()
+        logger.info("📋 Creating NDK Application CRD for restored application...")
         
         # Get the original Application CRD from source namespace to copy its selector
         try:
-            source_app = k8s_api.get_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=namespace,
-                plural='applications',
-                name=original_app_name
-            )
+            source_app = get_custom_object('applications', namespace, original_app_name)
             
             # Extract the application selector from the source
             source_spec = source_app.get('spec', {})
@@ -490,13 +428,12 @@ class SnapshotService:
                 }]
             })
             
-            logger.info(f"  ✓ Found source Application CRD with selector: {app_selector}")
-            sys.stdout.flush()
+            logger.info("  ✓ Found source Application CRD with selector: %s", app_selector)
             
         except ApiException as e:
             if e.status == 404:
                 # Source Application CRD doesn't exist, use default selector
-                logger.warning(f"  ⚠ Source Application CRD not found, using default selector")
+                logger.warning("  ⚠ Source Application CRD not found, using default selector")
                 app_selector = {
                     'resourceLabelSelectors': [{
                         'labelSelector': {
@@ -504,43 +441,33 @@ class SnapshotService:
                         }
                     }]
                 }
-                sys.stdout.flush()
             else:
                 raise
         
-        # Check if Application CRD already exists in target namespace
-        # Use restored_app_name (which could be different if cloning) for the CRD name
-        try:
-            k8s_api.get_namespaced_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                namespace=restore_namespace,
-                plural='applications',
-                name=restored_app_name
-            )
-            logger.info(f"  ✓ Application CRD '{restored_app_name}' already exists in target namespace")
-            sys.stdout.flush()
-        except ApiException as e:
-            if e.status == 404:
-                # Create the Application CRD in target namespace
-                # Use restored_app_name for the CRD name (supports cloning with new name)
-                # But keep the selector pointing to original_app_name (NDK restores with original names)
-                app_manifest = {
-                    'apiVersion': f'{Config.NDK_API_GROUP}/{Config.NDK_API_VERSION}',
-                    'kind': 'Application',
-                    'metadata': {
-                        'name': restored_app_name,
-                        'namespace': restore_namespace,
-                        'labels': {
-                            'app.kubernetes.io/managed-by': 'ndk-dashboard',
-                            'restored-from': namespace
-                        }
-                    },
-                    'spec': {
-                        'applicationSelector': app_selector
-                    }
+        # Create the Application CRD in target namespace; 409 means it already exists
+        # Use restored_app_name for the CRD name (supports cloning with new name)
+        # But keep the selector pointing to original_app_name (NDK restores with original names)
+        app_manifest = {
+            'apiVersion': Config.NDK_API_GROUP_VERSION,
+            'kind': 'Application',
+            'metadata': {
+                'name': restored_app_name,
+                'namespace': restore_namespace,
+                'labels': {
+                    'app.kubernetes.io/managed-by': 'ndk-dashboard',
+                    'restored-from': namespace
                 }
-                
+            },
+            'spec': {
+                'applicationSelector': app_selector
+            }
+        }
+        
+        # Re-restores usually find it in the watch store, which saves a rejected POST
+        if custom_object_known('applications', restore_namespace, restored_app_name):
+            logger.info("  ✓ Application CRD '%s' already exists in target namespace", restored_app_name)
+        else:
+            try:
                 k8s_api.create_namespaced_custom_object(
                     group=Config.NDK_API_GROUP,
                     version=Config.NDK_API_VERSION,
@@ -548,10 +475,11 @@ class SnapshotService:
                     plural='applications',
                     body=app_manifest
                 )
-                logger.info(f"  ✓ Created Application CRD '{restored_app_name}' in namespace '{restore_namespace}'")
-                sys.stdout.flush()
-            else:
-                raise
+                logger.info("  ✓ Created Application CRD '%s' in namespace '%s'", restored_app_name, restore_namespace)
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+                logger.info("  ✓ Application CRD '%s' already exists in target namespace", restored_app_name)
         
         # Return info about the restored/cloned application
         return {
@@ -563,6 +491,44 @@ class SnapshotService:
             'is_clone': new_app_name is not None and new_app_name != original_app_name
         }
     
+    @staticmethod
+    def _wait_for_restore_status(namespace, restore_name, timeout=RESTORE_STATUS_WAIT):
+        """
+        Get a new restore once NDK has reported conditions on it
+        
+        Wakes on watch events instead of sleeping, so it usually returns as soon as
+        NDK picks the restore up.
+        
+        Args:
+            namespace: Restore namespace
+            restore_name: Name of the ApplicationSnapshotRestore
+            timeout: Max seconds to wait for conditions
+            
+        Returns:
+            The restore object, with or without conditions
+            
+        Raises:
+            ApiException: 404 if the restore still can't be found after the timeout
+        """
+        deadline = time.monotonic() + timeout
+        version = wait_for_change(None, 0)
+        while True:
+            try:
+                restore = get_custom_object('applicationsnapshotrestores', namespace, restore_name)
+                if restore.get('status', {}).get('conditions'):
+                    return restore
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                restore = None
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if restore is None:
+                    raise ApiException(status=404, reason='Not Found')
+                return restore
+            version = wait_for_change(version, remaining)
+    
     @staticmethod
     def bulk_create_snapshots(applications, expires_after='720h'):
         """Create snapshots for multiple applications"""
@@ -574,6 +540,7 @@ class SnapshotService:
             'failed': []
         }
         
+        valid_apps = []
         for app in applications:
             app_name = app.get('name')
             app_namespace = app.get('namespace')
@@ -586,21 +553,40 @@ class SnapshotService:
                 })
                 continue
             
-            try:
-                snapshot_info = SnapshotService.create_snapshot(
-                    app_name, app_namespace, expires_after
-                )
-                results['success'].append({
-                    'application': app_name,
-                    'namespace': app_namespace,
-                    'snapshot': snapshot_info['name']
-                })
-            except Exception as e:
-                results['failed'].append({
-                    'application': app_name,
-                    'namespace': app_namespace,
-                    'error': str(e)
-                })
+            valid_apps.append((app_name, app_namespace))
+        
+        if not valid_apps:
+            return results
+        
+        # Creates are independent, so issue them concurrently and collect results here
+        with ThreadPoolExecutor(max_workers=min(BULK_SNAPSHOT_WORKERS, len(valid_apps))) as executor:
+            futures = [
+                (executor.submit(SnapshotService.create_snapshot, app_name, app_namespace, expires_after),
+                 app_name, app_namespace)
+                for app_name, app_namespace in valid_apps
+            ]
+            
+            for future, app_name, app_namespace in futures:
+                try:
+                    snapshot_info = future.result()
+                    results['success'].append({
+                        'application': app_name,
+                        'namespace': app_namespace,
+                        'snapshot': snapshot_info['name']
+                    })
+                except ApiException as e:
+                    # The API server's message, not the whole response dump str(e) gives
+                    results['failed'].append({
+                        'application': app_name,
+                        'namespace': app_namespace,
+                        'error': api_error_message(e)
+                    })
+                except Exception as e:
+                    results['failed'].append({
+                        'application': app_name,
+                        'namespace': app_namespace,
+                        'error': str(e)
+                    })
         
         return results
     
@@ -611,13 +597,7 @@ class SnapshotService:
             raise Exception('Kubernetes API not available')
         
         # Get the ApplicationSnapshotRestore CRD
-        restore_crd = k8s_api.get_namespaced_custom_object(
-            group=Config.NDK_API_GROUP,
-            version=Config.NDK_API_VERSION,
-            namespace=namespace,
-            plural='applicationsnapshotrestores',
-            name=restore_name
-        )
+        restore_crd = get_custom_object('applicationsnapshotrestores', namespace, restore_name)
         
         status = restore_crd.get('status', {})
         conditions = status.get('conditions', [])
@@ -634,14 +614,13 @@ class SnapshotService:
                 })
         
         # Log detailed status for debugging
-        logger.info(f"📊 Restore Status for {restore_name}:")
-        logger.info(f"   Phase: {status.get('phase', 'Unknown')}")
-        logger.info(f"   Conditions: {len(conditions)}")
+        logger.info("📊 Restore Status for %s:", restore_name)
+        logger.info("   Phase: %s", status.get('phase', 'Unknown'))
+        logger.info("   Conditions: %s", len(conditions))
         if error_details:
-            logger.error(f"   ❌ Errors found:")
+            logger.error("   ❌ Errors found:")
             for error in error_details:
-                logger.error(f"      - {error['type']}: {error['message']}")
-        sys.stdout.flush()
+                logger.error("      - %s: %s", error['type'], error['message'])
         
         return {
             'name': restore_name,
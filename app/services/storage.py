@@ -1,10 +1,18 @@
 """
 Storage service - Business logic for NDK Storage Clusters
 """
+import logging
 import base64
+import time
 from kubernetes.client.rest import ApiException
 from app.extensions import k8s_api, k8s_core_api, with_auth_retry
-from config import Config
+from app.utils.watch import list_custom_objects
+
+logger = logging.getLogger(__name__)
+
+# Prism Central endpoint decoded from the NDK secret, refreshed every PC_ENDPOINT_TTL seconds
+PC_ENDPOINT_TTL = 3600
+_pc_endpoint_cache = {'value': None, 'timestamp': None}
 
 
 class StorageService:
@@ -16,34 +24,12 @@ class StorageService:
         if not k8s_api:
             return []
         
-        # Try to get Prism Central endpoint from secret
-        pc_endpoint = 'Unknown'
-        
-        @with_auth_retry
-        def _fetch_pc_secret():
-            return k8s_core_api.read_namespaced_secret(
-                name='ntnx-pc-secret',
-                namespace='ndk-operator'
-            )
-        
-        try:
-            if k8s_core_api:
-                secret = _fetch_pc_secret()
-                if secret.data and 'key' in secret.data:
-                    key_data = base64.b64decode(secret.data['key']).decode('utf-8')
-                    parts = key_data.split(':')
-                    if len(parts) >= 2:
-                        pc_endpoint = f"{parts[0]}:{parts[1]}"
-        except Exception as e:
-            print(f"Warning: Could not read PC secret: {e}")
+        # Prism Central endpoint from the NDK secret (rarely changes, cached separately)
+        pc_endpoint = StorageService._get_pc_endpoint()
         
         @with_auth_retry
         def _fetch_storage_clusters():
-            return k8s_api.list_cluster_custom_object(
-                group=Config.NDK_API_GROUP,
-                version=Config.NDK_API_VERSION,
-                plural='storageclusters'
-            )
+            return list_custom_objects('storageclusters')
         
         try:
             result = _fetch_storage_clusters()
@@ -70,5 +56,46 @@ class StorageService:
             
             return clusters
         except ApiException as e:
-            print(f"Error fetching storage clusters: {e}")
-            return []
\ No newline at end of file
+            logger.error("Error fetching storage clusters: %s", e)
+            return []
+    
+    @staticmethod
+    def _get_pc_endpoint():
+        """
+        Get the Prism Central endpoint from the NDK operator secret
+        
+        The decoded value is cached for PC_ENDPOINT_TTL seconds. Failed reads
+        are not cached so they are retried on the next call.
+        
+        Returns:
+            "host:port" string, or 'Unknown' if it cannot be determined
+        """
+        now = time.monotonic()
+        if _pc_endpoint_cache['value'] is not None and now - _pc_endpoint_cache['timestamp'] < PC_ENDPOINT_TTL:
+            return _pc_endpoint_cache['value']
+        
+        if not k8s_core_api:
+            return 'Unknown'
+        
+        @with_auth_retry
+        def _fetch_pc_secret():
+            return k8s_core_api.read_namespaced_secret(
+                name='ntnx-pc-secret',
+                namespace='ndk-operator'
+            )
+        
+        pc_endpoint = 'Unknown'
+        try:
+            secret = _fetch_pc_secret()
+            if secret.data and 'key' in secret.data:
+                key_data = base64.b64decode(secret.data['key']).decode('utf-8')
+                parts = key_data.split(':')
+                if len(parts) >= 2:
+                    pc_endpoint = f"{parts[0]}:{parts[1]}"
+        except Exception as e:
+            logger.warning("Could not read PC secret: %s", e)
+            return pc_endpoint
+        
+        _pc_endpoint_cache['value'] = pc_endpoint
+        _pc_endpoint_cache['timestamp'] = now
+        return pc_endpoint
\ No newline at end of file
@@ -4,11 +4,16 @@ Utility functions for NDK Dashboard
 from .cache import get_cached_or_fetch, invalidate_cache
 from .labels import filter_system_labels, filter_system_label_prefixes
 from .decorators import login_required
+from .errors import api_error_message, api_error_response
+from .pagination import paged_list
 
 __all__ = [
     'get_cached_or_fetch',
     'invalidate_cache',
     'filter_system_labels',
     'filter_system_label_prefixes',
-    'login_required'
+    'login_required',
+    'api_error_message',
+    'api_error_response',
+    'paged_list'
 ]
\ No newline at end of file
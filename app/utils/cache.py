@@ -1,48 +1,251 @@
 """
 Cache management utilities
 """
-from datetime import datetime
+import logging
+import os
+import threading
+import time
 from config import Config
-from app.extensions import cache
+from app import extensions
+from app.extensions import cache, INVALID_CACHE_ENTRY
+
+logger = logging.getLogger(__name__)
+
+# One lock per cache key so concurrent misses on the same key trigger a single fetch
+_locks = {}
+_locks_guard = threading.Lock()
+
+# Fetch functions and last read time per cache key, used by the background refresher
+_fetchers = {}
+_last_access = {}
+# Process that started the refresher; a forked worker doesn't inherit the thread
+_refresher_pid = None
+
+# Bumped whenever a key is invalidated, so a fetch that raced an invalidation isn't stored as fresh
+_generations = {}
+_generations_guard = threading.Lock()
+
+# Keys with a background refresh in flight after mark_stale
+_refreshing = set()
+
+# Keys nobody has read for this many TTLs are left to expire instead of being refreshed
+REFRESH_IDLE_TTLS = 10
+
+
+def _get_lock(cache_key):
+    """Return the lock guarding a cache key, creating it on first use"""
+    lock = _locks.get(cache_key)
+    if lock is None:
+        with _locks_guard:
+            lock = _locks.setdefault(cache_key, threading.Lock())
+    return lock
+
+
+def _is_fresh(cached, now):
+    """Check whether a (data, timestamp) cache entry holds data younger than the TTL"""
+    data, timestamp = cached
+    if data is None or timestamp is None:
+        return False
+    return now - timestamp < Config.CACHE_TTL
+
+
+def _shared_get(cache_key):
+    """Read a key from the shared cache, or None if unset or unavailable"""
+    if extensions.shared_cache is None:
+        return None
+    try:
+        return extensions.shared_cache.get(cache_key)
+    except Exception as e:
+        logger.warning("Shared cache read failed for %s: %s", cache_key, e)
+        return None
+
+
+def _shared_set(cache_key, data):
+    """Write a key to the shared cache (expires after the TTL)"""
+    if extensions.shared_cache is None:
+        return
+    try:
+        extensions.shared_cache.set(cache_key, data)
+    except Exception as e:
+        logger.warning("Shared cache write failed for %s: %s", cache_key, e)
+
+
+def _shared_delete(cache_keys):
+    """Remove keys from the shared cache"""
+    if extensions.shared_cache is None or not cache_keys:
+        return
+    try:
+        extensions.shared_cache.delete_many(*cache_keys)
+    except Exception as e:
+        logger.warning("Shared cache delete failed: %s", e)
+
+
+def _store(cache_key, data, generation, now):
+    """
+    Cache fetched data, unless the key was invalidated while it was being fetched
+
+    After mark_stale the data is kept as stale (it is no older than what the entry
+    held); after invalidate_cache it is dropped so the next reader fetches again.
+    """
+    with _generations_guard:
+        current = _generations.get(cache_key, 0) == generation
+        if current:
+            cache[cache_key] = (data, now)
+        elif cache.get(cache_key, INVALID_CACHE_ENTRY)[0] is not None:
+            cache[cache_key] = (data, None)
+    if current:
+        _shared_set(cache_key, data)
 
 
 def get_cached_or_fetch(cache_key, fetch_function):
     """
     Get data from cache or fetch if expired
-    
+
+    Only one thread fetches a given key at a time; threads that miss while a
+    fetch is in flight wait for it and then reuse its result. When a shared
+    cache is configured, other workers' results are reused before fetching.
+    Entries marked stale are served as they are while one background thread
+    re-fetches them.
+
     Args:
         cache_key: Key to identify cached data
         fetch_function: Function to call if cache is expired
-        
+
     Returns:
         Cached or freshly fetched data
     """
-    now = datetime.now()
-    cached = cache.get(cache_key)
-    
-    if cached and cached['data'] is not None and cached['timestamp'] is not None:
-        age = (now - cached['timestamp']).total_seconds()
-        if age < Config.CACHE_TTL:
-            return cached['data']
-    
-    # Fetch fresh data
-    try:
-        data = fetch_function()
-        cache[cache_key] = {'data': data, 'timestamp': now}
-        return data
-    except Exception as e:
-        print(f"Error fetching {cache_key}: {e}")
-        # Return cached data even if expired, or empty list
-        return cached['data'] if cached and cached['data'] is not None else []
+    now = time.monotonic()
+    _fetchers[cache_key] = fetch_function
+    _last_access[cache_key] = now
+
+    cached = cache.get(cache_key, INVALID_CACHE_ENTRY)
+    if _is_fresh(cached, now):
+        return cached[0]
+    if cached[0] is not None and cached[1] is None:
+        _refresh_in_background(cache_key, fetch_function)
+        return cached[0]
+
+    with _get_lock(cache_key):
+        # Re-check: another thread may have refreshed the entry while we waited
+        now = time.monotonic()
+        cached = cache.get(cache_key, INVALID_CACHE_ENTRY)
+        if _is_fresh(cached, now):
+            return cached[0]
+
+        # Another worker may already have fetched it
+        data = _shared_get(cache_key)
+        if data is not None:
+            cache[cache_key] = (data, now)
+            return data
+
+        # Fetch fresh data
+        generation = _generations.get(cache_key, 0)
+        try:
+            data = fetch_function()
+            # Replace the whole entry so readers never see a half-updated one
+            _store(cache_key, data, generation, now)
+            return data
+        except Exception as e:
+            logger.error("Error fetching %s: %s", cache_key, e)
+            # Return cached data even if expired, or empty list
+            return cached[0] if cached[0] is not None else []
+
+
+def _with_derived_keys(cache_keys):
+    """Expand cache keys with their derived views (e.g. 'snapshots:resources')"""
+    expanded = []
+    for key in cache_keys:
+        expanded.append(key)
+        expanded.extend(k for k in list(cache) if k.startswith(f"{key}:"))
+    return expanded
 
 
 def invalidate_cache(*cache_keys):
     """
     Invalidate one or more cache entries
-    
+
+    The next reader fetches fresh data, so use this after the dashboard's own
+    writes to let the user see their change right away.
+
     Args:
         *cache_keys: Variable number of cache keys to invalidate
     """
-    for key in cache_keys:
-        if key in cache:
-            cache[key] = {'data': None, 'timestamp': None}
\ No newline at end of file
+    invalidated = _with_derived_keys(cache_keys)
+    with _generations_guard:
+        for key in invalidated:
+            _generations[key] = _generations.get(key, 0) + 1
+            cache[key] = INVALID_CACHE_ENTRY
+    _shared_delete(invalidated)
+
+
+def mark_stale(*cache_keys):
+    """
+    Mark one or more cache entries out of date without dropping their data
+
+    Readers keep getting the old data while one background thread re-fetches
+    it, so a burst of changes doesn't make every reader wait on a rebuild.
+    Entries with no data behave as if invalidated.
+
+    Args:
+        *cache_keys: Variable number of cache keys to mark stale
+    """
+    stale = _with_derived_keys(cache_keys)
+    with _generations_guard:
+        for key in stale:
+            _generations[key] = _generations.get(key, 0) + 1
+            cache[key] = (cache.get(key, INVALID_CACHE_ENTRY)[0], None)
+    _shared_delete(stale)
+
+
+def _refresh(cache_key, fetch_function):
+    """Re-fetch a single cache key, keeping the old entry on failure"""
+    with _get_lock(cache_key):
+        generation = _generations.get(cache_key, 0)
+        try:
+            data = fetch_function()
+            _store(cache_key, data, generation, time.monotonic())
+        except Exception as e:
+            logger.error("Error refreshing %s: %s", cache_key, e)
+
+
+def _refresh_in_background(cache_key, fetch_function):
+    """Start re-fetching a stale key on its own thread, unless that is already happening"""
+    with _locks_guard:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    def run():
+        try:
+            _refresh(cache_key, fetch_function)
+        finally:
+            with _locks_guard:
+                _refreshing.discard(cache_key)
+
+    threading.Thread(target=run, name=f'cache-refresh-{cache_key}', daemon=True).start()
+
+
+def _refresher():
+    """Periodically refresh every recently read cache key ahead of its expiry"""
+    while True:
+        time.sleep(max(1, Config.CACHE_TTL // 2))
+        idle_cutoff = time.monotonic() - Config.CACHE_TTL * REFRESH_IDLE_TTLS
+        for cache_key, fetch_function in list(_fetchers.items()):
+            if _last_access.get(cache_key, 0) >= idle_cutoff:
+                _refresh(cache_key, fetch_function)
+
+
+def start_cache_refresher():
+    """
+    Start the background cache refresh thread (once per process)
+
+    Keys are refreshed every CACHE_TTL/2 seconds, so request handlers normally
+    find a fresh entry and never wait on the Kubernetes API.
+    """
+    global _refresher_pid
+    with _locks_guard:
+        if _refresher_pid == os.getpid():
+            return
+        _refresher_pid = os.getpid()
+    thread = threading.Thread(target=_refresher, name='cache-refresher', daemon=True)
+    thread.start()
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Kubernetes API error helpers
+"""
+import json
+from flask import jsonify
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# orjson.loads takes bytes or str directly and raises a ValueError subclass
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _parsed_body(e):
+    """Decode an ApiException's JSON body once and cache it on the exception"""
+    if not hasattr(e, '_parsed_body'):
+        parsed = None
+        body = e.body
+        if body:
+            if isinstance(body, bytes) and orjson is None:
+                body = body.decode('utf-8', errors='replace')
+            try:
+                parsed = _json_loads(body)
+            except (ValueError, TypeError):
+                pass
+        e._parsed_body = parsed if isinstance(parsed, dict) else None
+    return e._parsed_body
+
+
+def api_error_message(e, default=None):
+    """
+    Extract a readable message from a Kubernetes ApiException
+    
+    Args:
+        e: ApiException raised by the Kubernetes client
+        default: Message to use when the body has none (defaults to e.reason)
+        
+    Returns:
+        The 'message' field of the JSON error body, or the default
+    """
+    error_msg = default if default is not None else f"{e.reason}"
+    error_body = _parsed_body(e)
+    if error_body:
+        error_msg = error_body.get('message', error_msg)
+    return error_msg
+
+
+def api_error_response(e, default=None):
+    """
+    Build a JSON error response for a Kubernetes ApiException
+    
+    Args:
+        e: ApiException raised by the Kubernetes client
+        default: Message to use when the body has none (defaults to e.reason)
+        
+    Returns:
+        Tuple of (JSON response, HTTP status) mirroring the API server status
+    """
+    return jsonify({'error': api_error_message(e, default)}), e.status
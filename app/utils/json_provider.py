@@ -0,0 +1,107 @@
+"""
+JSON provider backed by orjson for faster request and response (de)serialization
+"""
+from flask import Response, current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# Items serialized per chunk by stream_json_list
+STREAM_CHUNK_ITEMS = 200
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson"""
+    
+    # Let Flask's default() format datetimes so responses match the stdlib provider
+    option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+    
+    @property
+    def dump_option(self):
+        """orjson options for serializing, sorting keys when sort_keys is set (the Flask default)"""
+        if self.sort_keys:
+            return self.option | orjson.OPT_SORT_KEYS
+        return self.option
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as JSON
+        
+        orjson output is always compact. Falls back to the stdlib provider for
+        other json.dumps arguments (e.g. indent in debug mode), since orjson
+        does not support them.
+        """
+        kwargs.pop('separators', None)
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.dump_option).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        """
+        Build a JSON response (used by jsonify)
+        
+        Encodes straight to bytes, skipping the str round trip of dumps(). Pretty
+        printing in debug mode still goes through the stdlib provider.
+        """
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.dump_option | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON
+        
+        orjson.JSONDecodeError subclasses json.JSONDecodeError, so request
+        parsing errors are handled the same as with the stdlib provider.
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def init_json_provider(app):
+    """
+    Install the orjson provider on the app when orjson is available
+    
+    Args:
+        app: Flask application
+    """
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+def stream_json_list(items):
+    """
+    Build a JSON array response that is serialized while it is sent
+    
+    Items are encoded a chunk at a time, so the worker never holds the whole
+    encoded array and the first bytes go out before the last item is encoded.
+    
+    Args:
+        items: List of JSON-serializable items
+        
+    Returns:
+        Streaming application/json Response
+    """
+    provider = current_app.json
+    if isinstance(provider, OrjsonProvider):
+        def encode(chunk):
+            return orjson.dumps(chunk, default=provider.default, option=provider.dump_option)[1:-1]
+    else:
+        def encode(chunk):
+            return provider.dumps(chunk)[1:-1].encode('utf-8')
+    
+    def generate():
+        yield b'['
+        for start in range(0, len(items), STREAM_CHUNK_ITEMS):
+            if start:
+                yield b','
+            yield encode(items[start:start + STREAM_CHUNK_ITEMS])
+        yield b']'
+    
+    return Response(generate(), mimetype='application/json')
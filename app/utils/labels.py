@@ -2,12 +2,12 @@
 Label filtering utilities
 """
 
-# System label prefixes to filter out
-SYSTEM_LABEL_PREFIXES = [
+# System label prefixes to filter out (a tuple, so one str.startswith call checks them all)
+SYSTEM_LABEL_PREFIXES = (
     'kubectl.kubernetes.io/',
     'kubernetes.io/',
     'k8s.io/'
-]
+)
 
 
 def filter_system_labels(labels, strict=False):
@@ -27,7 +27,7 @@ def filter_system_labels(labels, strict=False):
     if strict:
         return {
             k: v for k, v in labels.items()
-            if not any(k.startswith(prefix) for prefix in SYSTEM_LABEL_PREFIXES)
+            if not k.startswith(SYSTEM_LABEL_PREFIXES)
         }
     else:
         # Only filter kubectl.kubernetes.io (backward compatible)
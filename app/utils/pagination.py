@@ -0,0 +1,48 @@
+"""
+Kubernetes list pagination utilities
+"""
+
+# Objects requested per page; bounds API server memory and response size on large clusters
+LIST_PAGE_SIZE = 500
+
+
+def paged_list(list_function, page_size=LIST_PAGE_SIZE, list_metadata=None, **kwargs):
+    """
+    Yield the items of a Kubernetes list call one page at a time
+    
+    Follows the list's continue token until the server reports no more pages.
+    Works with both custom object lists (dicts) and typed client lists.
+    
+    Args:
+        list_function: Kubernetes client list method (e.g. k8s_api.list_namespaced_custom_object)
+        page_size: Objects to request per page
+        list_metadata: Dict that receives the list's resourceVersion (optional)
+        **kwargs: Arguments for the list method
+        
+    Yields:
+        List items (dicts for custom objects, client models otherwise)
+    """
+    continue_token = None
+    while True:
+        if continue_token:
+            # The continue token pins the list's snapshot; resourceVersion may not be repeated
+            kwargs.pop('resource_version', None)
+            kwargs.pop('resource_version_match', None)
+            kwargs['_continue'] = continue_token
+        result = list_function(limit=page_size, **kwargs)
+        
+        if isinstance(result, dict):
+            yield from result.get('items') or []
+            metadata = result.get('metadata') or {}
+            continue_token = metadata.get('continue')
+            resource_version = metadata.get('resourceVersion')
+        else:
+            yield from result.items or []
+            metadata = result.metadata
+            continue_token = metadata._continue if metadata else None
+            resource_version = metadata.resource_version if metadata else None
+        
+        if list_metadata is not None and resource_version:
+            list_metadata['resourceVersion'] = resource_version
+        if not continue_token:
+            return
@@ -0,0 +1,133 @@
+"""
+Background task utilities
+
+Long-running operations (e.g. application cleanup) run on a small thread pool
+and report progress through a task record that clients poll by task id. When a
+shared cache is configured, records are mirrored there so any worker can
+answer the poll.
+"""
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from app import extensions
+
+logger = logging.getLogger(__name__)
+
+# Background tasks allowed to run at once per process
+TASK_WORKERS = 4
+
+# Seconds a finished task's record is kept for polling
+TASK_RETENTION_SECONDS = 3600
+
+_executor = ThreadPoolExecutor(max_workers=TASK_WORKERS, thread_name_prefix='task')
+_tasks = {}
+_tasks_lock = threading.Lock()
+
+
+def _shared_key(task_id):
+    """Shared cache key for a task record"""
+    return f"task:{task_id}"
+
+
+def _publish(task):
+    """Mirror a task record to the shared cache, if configured"""
+    if extensions.shared_cache is None:
+        return
+    try:
+        extensions.shared_cache.set(_shared_key(task['id']), dict(task, log=list(task['log'])),
+                                    timeout=TASK_RETENTION_SECONDS)
+    except Exception as e:
+        logger.warning("Failed to publish task %s: %s", task['id'], e)
+
+
+class _TaskLog(list):
+    """A task's progress log, mirrored to the shared cache on every new line"""
+    
+    def __init__(self, task):
+        super().__init__()
+        self._task = task
+    
+    def append(self, line):
+        super().append(line)
+        # Polls answered by another worker only see what has been published
+        _publish(self._task)
+
+
+def _prune(now):
+    """Drop finished tasks older than the retention period (called with the lock held)"""
+    expired = [task_id for task_id, task in _tasks.items()
+               if task['finished'] and now - task['finished'] > TASK_RETENTION_SECONDS]
+    for task_id in expired:
+        del _tasks[task_id]
+
+
+def _run(task, function, args, kwargs):
+    """Run a task function and record its outcome"""
+    task['status'] = 'running'
+    _publish(task)
+    try:
+        task['result'] = function(*args, log=task['log'], **kwargs)
+        task['status'] = 'finished'
+    except Exception as e:
+        logger.exception("Task %s failed", task['id'])
+        task['error'] = str(e)
+        task['status'] = 'failed'
+    task['finished'] = time.time()
+    _publish(task)
+
+
+def submit_task(function, *args, **kwargs):
+    """
+    Run a function in the background
+    
+    The function receives a 'log' keyword argument: a list it can append
+    progress messages to while it runs.
+    
+    Args:
+        function: Callable to run
+        *args, **kwargs: Arguments for the function
+        
+    Returns:
+        The new task's id
+    """
+    now = time.time()
+    task = {
+        'id': uuid.uuid4().hex,
+        'status': 'queued',
+        'log': None,
+        'result': None,
+        'error': None,
+        'created': now,
+        'finished': None
+    }
+    task['log'] = _TaskLog(task)
+    with _tasks_lock:
+        _prune(now)
+        _tasks[task['id']] = task
+    _publish(task)
+    _executor.submit(_run, task, function, args, kwargs)
+    return task['id']
+
+
+def get_task(task_id):
+    """
+    Get a task record
+    
+    Args:
+        task_id: Id returned by submit_task
+        
+    Returns:
+        Dict with id, status (queued/running/finished/failed), log, result,
+        error, created and finished, or None if the task is unknown
+    """
+    task = _tasks.get(task_id)
+    if task is not None:
+        return dict(task, log=list(task['log']))
+    if extensions.shared_cache is not None:
+        try:
+            return extensions.shared_cache.get(_shared_key(task_id))
+        except Exception as e:
+            logger.warning("Failed to read task %s: %s", task_id, e)
+    return None
@@ -0,0 +1,756 @@
+"""
+Watch-based caches for NDK custom resources and the core kinds the dashboard reads
+
+A background thread per resource kind lists the objects once, then follows the
+Kubernetes watch API and applies ADDED/MODIFIED/DELETED events to an in-memory
+store. List fetches read the store instead of re-listing from the API server.
+"""
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from config import Config
+from app import extensions
+from app.utils.cache import mark_stale
+from app.utils.pagination import paged_list
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; lists are then parsed in one go
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Cache keys derived from each watched kind; marked stale whenever an event arrives
+WATCHED_RESOURCES = {
+    'applications': ('applications', 'protectionplans'),
+    'applicationsnapshots': ('snapshots', 'protectionplans'),
+    'protectionplans': ('protectionplans',),
+    'appprotectionplans': ('protectionplans',),
+    'storageclusters': ('storageclusters',),
+    'applicationsnapshotrestores': ('applicationsnapshotrestores',)
+}
+
+# Core kinds behind the application pods/PVCs views, with the CoreV1Api methods that list
+# all of them (for the watch) and list one namespace / read one object (when not synced)
+WATCHED_CORE_RESOURCES = {
+    'pods': ('list_pod_for_all_namespaces', 'list_namespaced_pod'),
+    'persistentvolumeclaims': ('list_persistent_volume_claim_for_all_namespaces',
+                               'list_namespaced_persistent_volume_claim'),
+    'persistentvolumes': ('list_persistent_volume', 'read_persistent_volume')
+}
+
+# Label NDK puts on snapshots created by a protection plan
+PROTECTION_PLAN_LABEL = 'dataservices.nutanix.com/protection-plan'
+
+# Seconds before the server closes a watch and we reconnect from the last resourceVersion
+WATCH_TIMEOUT_SECONDS = 300
+
+# Seconds to wait before retrying after an unexpected watch failure
+WATCH_RETRY_DELAY = 5
+
+_stores = {}
+# Process that started the watches; a forked worker doesn't inherit the threads
+_watches_pid = None
+_watches_guard = threading.Lock()
+
+# resourceVersion of the last direct list per (plural, namespace, excluded namespaces)
+_list_resource_versions = {}
+
+# Bumped on every store change so streaming endpoints can wait instead of polling
+_change_version = 0
+_change_condition = threading.Condition()
+
+
+class ResourceStore:
+    """In-memory copy of one custom resource kind, kept current by a watch"""
+
+    # Whether changes wake wait_for_change (the stats stream and delete waits follow NDK kinds)
+    notify_changes = True
+
+    def __init__(self, plural, cache_keys):
+        self.plural = plural
+        self.cache_keys = cache_keys
+        self.synced = False
+        self._items = {}
+        # (namespace, name) -> store key, for single-object lookups
+        self._by_name = {}
+        self._lock = threading.Lock()
+
+    def _list_call(self):
+        """Client list function and its arguments for this kind"""
+        return extensions.k8s_api.list_cluster_custom_object, {
+            'group': Config.NDK_API_GROUP,
+            'version': Config.NDK_API_VERSION,
+            'plural': self.plural
+        }
+
+    def _prepare(self, item):
+        """Trim an object before it is stored"""
+        return item
+
+    def _index_reset(self):
+        """Clear secondary indexes before a resync (called with the lock held)"""
+
+    def _index_add(self, key, item):
+        """Add an object to secondary indexes (called with the lock held)"""
+
+    def _index_remove(self, key, item):
+        """Remove an object from secondary indexes (called with the lock held)"""
+
+    def list(self, namespace=None, exclude_namespaces=None):
+        """
+        Get the stored objects in the same shape as list_*_custom_object
+
+        Args:
+            namespace: Only return objects from this namespace (optional)
+            exclude_namespaces: Namespaces to leave out (optional)
+
+        Returns:
+            Dict with an 'items' list
+        """
+        with self._lock:
+            items = list(self._items.values())
+        if namespace:
+            items = [item for item in items if item.get('metadata', {}).get('namespace') == namespace]
+        if exclude_namespaces:
+            items = [item for item in items if item.get('metadata', {}).get('namespace') not in exclude_namespaces]
+        return {'items': items}
+
+    def get(self, namespace, name):
+        """Get a stored object by namespace and name, or None if it doesn't exist"""
+        with self._lock:
+            key = self._by_name.get((namespace, name))
+            return self._items.get(key) if key is not None else None
+
+    def count(self):
+        """Get the number of stored objects"""
+        with self._lock:
+            return len(self._items)
+
+    def _resync(self):
+        """Replace the store with a fresh list and return its resourceVersion"""
+        items = {}
+        list_metadata = {}
+        list_function, list_kwargs = self._list_call()
+        for item in _stream_list_items(list_function, list_kwargs, list_metadata):
+            item = self._prepare(item)
+            items[_item_key(item)] = item
+        with self._lock:
+            self._items = items
+            self._by_name = {_name_key(item): key for key, item in items.items()}
+            self._index_reset()
+            for key, item in items.items():
+                self._index_add(key, item)
+        self.synced = True
+        mark_stale(*self.cache_keys)
+        if self.notify_changes:
+            _notify_change()
+        return list_metadata.get('resourceVersion')
+
+    def _apply(self, event):
+        """Apply a single watch event to the store"""
+        event_type = event.get('type')
+        # Core kinds arrive as client models; the raw dict is stored for every kind
+        obj = event.get('raw_object', event.get('object'))
+        # BOOKMARK events only advance the resourceVersion, which the Watch tracks itself
+        if event_type not in ('ADDED', 'MODIFIED', 'DELETED') or not isinstance(obj, dict):
+            return
+
+        obj = self._prepare(obj)
+        key = _item_key(obj)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._by_name.pop(_name_key(old), None)
+                self._index_remove(key, old)
+            if event_type != 'DELETED':
+                self._items[key] = obj
+                self._by_name[_name_key(obj)] = key
+                self._index_add(key, obj)
+        mark_stale(*self.cache_keys)
+        if self.notify_changes:
+            _notify_change()
+
+    def run(self):
+        """List, then follow the watch forever, resyncing when it falls behind"""
+        resource_version = None
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = self._resync()
+
+                watcher = watch.Watch()
+                list_function, list_kwargs = self._list_call()
+                for event in watcher.stream(
+                    list_function,
+                    **list_kwargs,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS
+                ):
+                    self._apply(event)
+                # Continue from where the server-side timeout left off
+                resource_version = watcher.resource_version or resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old: relist to catch up
+                    logger.info("Watch on %s expired, resyncing", self.plural)
+                else:
+                    logger.warning("Watch on %s failed: %s %s", self.plural, e.status, e.reason)
+                    self.synced = False
+                    time.sleep(WATCH_RETRY_DELAY)
+                resource_version = None
+            except Exception as e:
+                logger.warning("Watch on %s failed: %s", self.plural, e)
+                self.synced = False
+                resource_version = None
+                time.sleep(WATCH_RETRY_DELAY)
+
+
+class SnapshotStore(ResourceStore):
+    """Snapshot store that also keeps each protection plan's snapshots sorted by creation time"""
+
+    def __init__(self, plural, cache_keys):
+        super().__init__(plural, cache_keys)
+        # (namespace, plan) -> ascending list of (creationTimestamp, name, store key)
+        self._by_plan = {}
+
+    @staticmethod
+    def _plan_entry(key, item):
+        """Index bucket and sort entry for a snapshot, or (None, None) if no plan created it"""
+        metadata = item.get('metadata', {})
+        plan = (metadata.get('labels') or {}).get(PROTECTION_PLAN_LABEL)
+        if not plan:
+            return None, None
+        entry = (metadata.get('creationTimestamp', ''), metadata.get('name', ''), key)
+        return (metadata.get('namespace'), plan), entry
+
+    def _index_reset(self):
+        self._by_plan = {}
+
+    def _index_add(self, key, item):
+        bucket, entry = self._plan_entry(key, item)
+        if bucket is not None:
+            bisect.insort(self._by_plan.setdefault(bucket, []), entry)
+
+    def _index_remove(self, key, item):
+        bucket, entry = self._plan_entry(key, item)
+        entries = self._by_plan.get(bucket)
+        if not entries:
+            return
+        index = bisect.bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+        if not entries:
+            del self._by_plan[bucket]
+
+    def plan_snapshots(self, namespace, plan):
+        """
+        Get the snapshots a protection plan created, newest first
+
+        Args:
+            namespace: Protection plan namespace
+            plan: Protection plan name
+
+        Returns:
+            List of snapshot dicts
+        """
+        with self._lock:
+            entries = self._by_plan.get((namespace, plan), [])
+            return [self._items[key] for _, _, key in reversed(entries)]
+
+    def all_plan_snapshots(self):
+        """Get every snapshot a protection plan created, across all plans"""
+        with self._lock:
+            return [self._items[key] for entries in self._by_plan.values() for _, _, key in entries]
+
+
+class CoreResourceStore(ResourceStore):
+    """Store for a core Kubernetes kind, indexed by namespace for label selector lookups"""
+
+    notify_changes = False
+
+    def __init__(self, plural, list_method):
+        super().__init__(plural, ())
+        self.list_method = list_method
+        # namespace -> set of store keys
+        self._by_namespace = {}
+
+    def _list_call(self):
+        return getattr(extensions.k8s_core_api, self.list_method), {}
+
+    def _prepare(self, item):
+        # managedFields is often the bulk of an object and is never read here
+        item.get('metadata', {}).pop('managedFields', None)
+        return item
+
+    def _index_reset(self):
+        self._by_namespace = {}
+
+    def _index_add(self, key, item):
+        self._by_namespace.setdefault(item.get('metadata', {}).get('namespace'), set()).add(key)
+
+    def _index_remove(self, key, item):
+        namespace = item.get('metadata', {}).get('namespace')
+        keys = self._by_namespace.get(namespace)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_namespace[namespace]
+
+    def select(self, namespace, label_selector=None):
+        """
+        Get a namespace's stored objects matching a label selector
+
+        Args:
+            namespace: Namespace to read
+            label_selector: Label selector string (optional)
+
+        Returns:
+            List of object dicts
+        """
+        requirements = _parse_label_selector(label_selector)
+        with self._lock:
+            items = [self._items[key] for key in self._by_namespace.get(namespace, ())]
+        return [
+            item for item in items
+            if _selector_matches(requirements, item.get('metadata', {}).get('labels') or {})
+        ]
+
+
+# One requirement of a label selector: "key", "!key", "key=value", "key!=value",
+# "key in (a,b)" or "key notin (a,b)"
+_SELECTOR_REQUIREMENT = re.compile(
+    r'\s*(?:(!)\s*([^\s,!=()]+)'
+    r'|([^\s,!=()]+)\s*(?:(==|=|!=)\s*([^\s,()]*)|\s+(in|notin)\s*\(([^)]*)\))?)\s*(?:,|$)'
+)
+
+
+def _parse_label_selector(label_selector):
+    """
+    Parse a label selector string into (key, operator, values) requirements
+
+    Raises:
+        ValueError: If the selector can't be parsed
+    """
+    requirements = []
+    position = 0
+    selector = (label_selector or '').strip()
+    while position < len(selector):
+        match = _SELECTOR_REQUIREMENT.match(selector, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid label selector: {label_selector}")
+        position = match.end()
+        if match.group(1):
+            requirements.append((match.group(2), 'DoesNotExist', ()))
+        elif match.group(4):
+            operator = 'NotIn' if match.group(4) == '!=' else 'In'
+            requirements.append((match.group(3), operator, (match.group(5),)))
+        elif match.group(6):
+            values = tuple(value.strip() for value in match.group(7).split(','))
+            requirements.append((match.group(3), 'In' if match.group(6) == 'in' else 'NotIn', values))
+        else:
+            requirements.append((match.group(3), 'Exists', ()))
+    return requirements
+
+
+def _selector_matches(requirements, labels):
+    """Check labels against parsed label selector requirements"""
+    for key, operator, values in requirements:
+        if operator == 'Exists':
+            if key not in labels:
+                return False
+        elif operator == 'DoesNotExist':
+            if key in labels:
+                return False
+        elif operator == 'In':
+            if labels.get(key) not in values:
+                return False
+        elif key in labels and labels[key] in values:  # NotIn
+            return False
+    return True
+
+
+def _item_key(item):
+    """Store key for an object: its UID, or namespace/name if it has none"""
+    metadata = item.get('metadata', {})
+    return metadata.get('uid') or (metadata.get('namespace'), metadata.get('name'))
+
+
+def _name_key(item):
+    """(namespace, name) of an object"""
+    metadata = item.get('metadata', {})
+    return metadata.get('namespace'), metadata.get('name')
+
+
+def _notify_change():
+    """Wake everything blocked in wait_for_change"""
+    global _change_version
+    with _change_condition:
+        _change_version += 1
+        _change_condition.notify_all()
+
+
+def wait_for_change(version, timeout):
+    """
+    Block until a watched resource changes
+
+    Args:
+        version: Change version the caller last saw (None returns immediately)
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The current change version, unchanged if the wait timed out
+    """
+    with _change_condition:
+        _change_condition.wait_for(lambda: _change_version != version, timeout)
+        return _change_version
+
+
+def _stream_list_items(list_function, list_kwargs, list_metadata):
+    """
+    Yield the items of a cluster-wide list one at a time
+
+    The response is parsed incrementally with ijson so a large list is never
+    held as one buffer plus one fully decoded document.
+
+    Args:
+        list_function: Client list function (e.g. list_cluster_custom_object)
+        list_kwargs: Arguments for the list function
+        list_metadata: Dict that receives the list's resourceVersion
+
+    Yields:
+        Object dicts
+    """
+    # Raw JSON, so core kinds are stored as dicts like custom objects
+    response = list_function(_preload_content=False, **list_kwargs)
+    try:
+        if ijson is None:
+            result = json.loads(response.data)
+            list_metadata.update(result.get('metadata', {}))
+            yield from result.get('items') or []
+            return
+
+        builder = None
+        # use_float keeps numbers JSON-serializable (no Decimal)
+        for prefix, event, value in ijson.parse(response, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'items.item' and event == 'end_map':
+                    yield builder.value
+                    builder = None
+            elif prefix == 'items.item' and event == 'start_map':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'metadata.resourceVersion':
+                list_metadata['resourceVersion'] = value
+    finally:
+        response.release_conn()
+
+
+def list_custom_objects(plural, namespace=None, exclude_namespaces=None):
+    """
+    List NDK custom objects, from the watch store when it is in sync
+
+    Falls back to a direct, paginated API list while the store is unavailable. Excluded
+    namespaces are then filtered by the API server with a field selector.
+
+    Args:
+        plural: Custom resource plural (e.g. 'applicationsnapshots')
+        namespace: Only return objects from this namespace (optional)
+        exclude_namespaces: Namespaces to leave out (optional)
+
+    Returns:
+        Dict with an 'items' list, as returned by list_*_custom_object
+    """
+    store = _stores.get(plural)
+    if store is not None and store.synced:
+        return store.list(namespace, exclude_namespaces)
+
+    scope = (plural, namespace, tuple(sorted(exclude_namespaces)) if exclude_namespaces else None)
+    last_resource_version = _list_resource_versions.get(scope)
+    try:
+        return _list_from_api(plural, namespace, exclude_namespaces, scope, last_resource_version)
+    except ApiException:
+        if last_resource_version is None:
+            raise
+        # e.g. "Too large resource version" after an API server restore: list unconditionally
+        _list_resource_versions.pop(scope, None)
+        return _list_from_api(plural, namespace, exclude_namespaces, scope, None)
+
+
+def count_custom_objects(plural):
+    """
+    Count NDK custom objects in the watch store
+
+    Args:
+        plural: Custom resource plural (e.g. 'applicationsnapshots')
+
+    Returns:
+        Number of objects across all namespaces, or None while the store is not in sync
+    """
+    store = _stores.get(plural)
+    if store is None or not store.synced:
+        return None
+    return store.count()
+
+
+def _list_from_api(plural, namespace, exclude_namespaces, scope, resource_version):
+    """
+    List NDK custom objects from the API server
+
+    With the resourceVersion of the previous list and resourceVersionMatch=NotOlderThan,
+    the API server can answer from its watch cache instead of a quorum read from etcd.
+    """
+    kwargs = {}
+    if resource_version:
+        kwargs = {'resource_version': resource_version, 'resource_version_match': 'NotOlderThan'}
+    list_metadata = {}
+
+    if namespace:
+        items = paged_list(
+            extensions.k8s_api.list_namespaced_custom_object,
+            list_metadata=list_metadata,
+            group=Config.NDK_API_GROUP,
+            version=Config.NDK_API_VERSION,
+            namespace=namespace,
+            plural=plural,
+            **kwargs
+        )
+    elif exclude_namespaces:
+        items = paged_list(
+            extensions.k8s_api.list_cluster_custom_object,
+            list_metadata=list_metadata,
+            group=Config.NDK_API_GROUP,
+            version=Config.NDK_API_VERSION,
+            plural=plural,
+            field_selector=','.join(f'metadata.namespace!={ns}' for ns in sorted(exclude_namespaces)),
+            **kwargs
+        )
+    else:
+        items = paged_list(
+            extensions.k8s_api.list_cluster_custom_object,
+            list_metadata=list_metadata,
+            group=Config.NDK_API_GROUP,
+            version=Config.NDK_API_VERSION,
+            plural=plural,
+            **kwargs
+        )
+    result = {'items': list(items)}
+    if list_metadata.get('resourceVersion'):
+        _list_resource_versions[scope] = list_metadata['resourceVersion']
+    return result
+
+
+def get_custom_object(plural, namespace, name):
+    """
+    Get a single NDK custom object, from the watch store when it is in sync
+
+    A store miss falls through to the API, since an object created moments ago may not
+    have reached the store yet.
+
+    Args:
+        plural: Custom resource plural (e.g. 'applications')
+        namespace: Object namespace
+        name: Object name
+
+    Returns:
+        Object dict, as returned by get_namespaced_custom_object
+
+    Raises:
+        ApiException: 404 if the object doesn't exist
+    """
+    store = _stores.get(plural)
+    if store is not None and store.synced:
+        item = store.get(namespace, name)
+        if item is not None:
+            return item
+
+    return extensions.k8s_api.get_namespaced_custom_object(
+        group=Config.NDK_API_GROUP,
+        version=Config.NDK_API_VERSION,
+        namespace=namespace,
+        plural=plural,
+        name=name
+    )
+
+
+def custom_object_known(plural, namespace, name):
+    """
+    Check whether the watch store has seen an NDK custom object, without calling the API
+
+    Args:
+        plural: Custom resource plural (e.g. 'applications')
+        namespace: Object namespace
+        name: Object name
+
+    Returns:
+        True if the store is in sync and holds the object, False otherwise
+    """
+    store = _stores.get(plural)
+    return store is not None and store.synced and store.get(namespace, name) is not None
+
+
+def list_core_objects(plural, namespace, label_selector=None):
+    """
+    List a namespace's pods or PVCs matching a label selector, from the watch store when it is in sync
+
+    Args:
+        plural: 'pods' or 'persistentvolumeclaims'
+        namespace: Namespace to list
+        label_selector: Label selector string (optional)
+
+    Returns:
+        List of object dicts with API field names (e.g. spec.nodeName)
+    """
+    store = _stores.get(plural)
+    if store is not None and store.synced:
+        return store.select(namespace, label_selector)
+
+    list_function = getattr(extensions.k8s_core_api, WATCHED_CORE_RESOURCES[plural][1])
+    # Raw JSON so both paths return dicts; resourceVersion=0 reads the API server's watch cache
+    response = list_function(
+        namespace=namespace,
+        label_selector=label_selector,
+        resource_version='0',
+        resource_version_match='NotOlderThan',
+        _preload_content=False
+    )
+    try:
+        return json.loads(response.data).get('items') or []
+    finally:
+        response.release_conn()
+
+
+def get_persistent_volumes(names):
+    """
+    Get PersistentVolumes by name, from the watch store when it is in sync
+
+    Without the store, several volumes are fetched with one cluster-wide list
+    (served from the API server's watch cache) instead of one read per volume.
+
+    Args:
+        names: PersistentVolume names
+
+    Returns:
+        Dict of PersistentVolume dicts with API field names, keyed by name;
+        volumes that don't exist are left out
+    """
+    names = set(names)
+    if not names:
+        return {}
+
+    store = _stores.get('persistentvolumes')
+    if store is not None and store.synced:
+        volumes = {}
+        for name in names:
+            item = store.get(None, name)
+            if item is not None:
+                volumes[name] = item
+        return volumes
+
+    if len(names) == 1:
+        name = next(iter(names))
+        try:
+            response = extensions.k8s_core_api.read_persistent_volume(name=name, _preload_content=False)
+        except ApiException as e:
+            if e.status == 404:
+                return {}
+            raise
+        try:
+            return {name: json.loads(response.data)}
+        finally:
+            response.release_conn()
+
+    list_kwargs = {'resource_version': '0', 'resource_version_match': 'NotOlderThan'}
+    volumes = {}
+    for item in _stream_list_items(extensions.k8s_core_api.list_persistent_volume, list_kwargs, {}):
+        name = item.get('metadata', {}).get('name')
+        if name in names:
+            volumes[name] = item
+    return volumes
+
+
+def list_plan_snapshots(namespace, plan):
+    """
+    List the snapshots a protection plan created, newest first
+
+    Reads the pre-sorted index of the snapshot watch store when it is in sync,
+    otherwise lists the namespace by plan label and sorts.
+
+    Args:
+        namespace: Protection plan namespace
+        plan: Protection plan name
+
+    Returns:
+        List of snapshot dicts
+    """
+    store = _stores.get('applicationsnapshots')
+    if store is not None and store.synced:
+        return store.plan_snapshots(namespace, plan)
+
+    result = extensions.k8s_api.list_namespaced_custom_object(
+        group=Config.NDK_API_GROUP,
+        version=Config.NDK_API_VERSION,
+        namespace=namespace,
+        plural='applicationsnapshots',
+        label_selector=f'{PROTECTION_PLAN_LABEL}={plan}'
+    )
+    items = result.get('items', [])
+    items.sort(key=lambda item: item.get('metadata', {}).get('creationTimestamp', ''), reverse=True)
+    return items
+
+
+def list_all_plan_snapshots():
+    """
+    List the snapshots created by any protection plan
+
+    Reads the snapshot watch store's plan index when it is in sync, otherwise
+    makes one cluster-wide list by plan label.
+
+    Returns:
+        List of snapshot dicts
+    """
+    store = _stores.get('applicationsnapshots')
+    if store is not None and store.synced:
+        return store.all_plan_snapshots()
+
+    result = extensions.k8s_api.list_cluster_custom_object(
+        group=Config.NDK_API_GROUP,
+        version=Config.NDK_API_VERSION,
+        plural='applicationsnapshots',
+        label_selector=PROTECTION_PLAN_LABEL
+    )
+    return result.get('items', [])
+
+
+def start_resource_watches():
+    """Start one watch thread per NDK resource kind and watched core kind (once per process)"""
+    global _watches_pid
+    if not Config.WATCH_RESOURCES or not extensions.k8s_api:
+        return
+
+    with _watches_guard:
+        if _watches_pid == os.getpid():
+            return
+        _watches_pid = os.getpid()
+
+    for plural, cache_keys in WATCHED_RESOURCES.items():
+        store_class = SnapshotStore if plural == 'applicationsnapshots' else ResourceStore
+        store = store_class(plural, cache_keys)
+        _stores[plural] = store
+        thread = threading.Thread(target=store.run, name=f'watch-{plural}', daemon=True)
+        thread.start()
+
+    if extensions.k8s_core_api:
+        for plural, (list_method, _) in WATCHED_CORE_RESOURCES.items():
+            store = CoreResourceStore(plural, list_method)
+            _stores[plural] = store
+            thread = threading.Thread(target=store.run, name=f'watch-{plural}', daemon=True)
+            thread.start()
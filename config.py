@@ -22,15 +22,28 @@ class Config:
     SESSION_TIMEOUT_HOURS = int(os.getenv('SESSION_TIMEOUT_HOURS', '24'))
     PERMANENT_SESSION_LIFETIME = SESSION_TIMEOUT_HOURS * 3600
     
+    # Login attempts allowed per client IP (Flask-Limiter syntax)
+    LOGIN_RATE_LIMIT = os.getenv('LOGIN_RATE_LIMIT', '20/minute')
+    
     # Kubernetes configuration
     IN_CLUSTER = os.getenv('IN_CLUSTER', 'false').lower() == 'true'
+    # Max pooled connections to the API server; keep above gunicorn threads plus parallel fetches
+    K8S_CONNECTION_POOL_MAXSIZE = int(os.getenv('K8S_CONNECTION_POOL_MAXSIZE', '50'))
     
     # Cache configuration
     CACHE_TTL = int(os.getenv('CACHE_TTL', '30'))  # seconds
+    WATCH_RESOURCES = os.getenv('WATCH_RESOURCES', 'true').lower() == 'true'  # keep NDK lists live via watches
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', '')  # share cached responses across workers (optional)
+    STATS_STREAM_MAX_CLIENTS = int(os.getenv('STATS_STREAM_MAX_CLIENTS', '4'))  # open stats streams per worker
+    DEFER_BACKGROUND_TASKS = os.getenv('DEFER_BACKGROUND_TASKS', 'false').lower() == 'true'  # set by gunicorn_conf.py when preloading
+    
+    # Logging configuration (DEBUG, INFO, WARNING, ERROR)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
     
     # NDK API configuration
     NDK_API_GROUP = 'dataservices.nutanix.com'
     NDK_API_VERSION = 'v1alpha1'
+    NDK_API_GROUP_VERSION = f'{NDK_API_GROUP}/{NDK_API_VERSION}'  # manifest apiVersion
     
     @staticmethod
     def init_app(app):
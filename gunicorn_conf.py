@@ -0,0 +1,52 @@
+"""
+NDK Dashboard - Gunicorn configuration
+
+Usage:
+    gunicorn -c gunicorn_conf.py run:app
+"""
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# gthread workers serve requests from a thread pool, so slow Kubernetes API
+# calls don't block other requests and all threads share the worker's cache
+# and watch stores. 'gevent' is also supported.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+
+# Load the app once in the master and fork it into the workers. gevent must
+# monkey-patch the standard library before the app (and the kubernetes client /
+# urllib3) is imported, so it always loads the app per worker.
+preload_app = worker_class == 'gthread'
+
+if preload_app:
+    # Background threads started in the master would not exist in the workers
+    os.environ.setdefault('DEFER_BACKGROUND_TASKS', 'true')
+
+# Imported only after DEFER_BACKGROUND_TASKS is set above
+from config import Config
+
+# Background task records (and cached responses) live in each worker's memory
+# unless CACHE_REDIS_URL is set; without it a task poll could reach a worker that
+# doesn't know the task, so more than one worker requires the shared cache.
+workers = int(os.environ.get('GUNICORN_WORKERS', '2' if Config.CACHE_REDIS_URL else '1'))
+if workers > 1 and not Config.CACHE_REDIS_URL:
+    raise RuntimeError(
+        f"GUNICORN_WORKERS={workers} requires CACHE_REDIS_URL so every worker can answer "
+        "task polls; set CACHE_REDIS_URL or use GUNICORN_WORKERS=1"
+    )
+
+threads = int(os.environ.get('GUNICORN_THREADS', '16'))  # gthread only
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '1000'))  # gevent only
+
+# Kubernetes API calls (restores, deletes) can take a while
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Start the cache refresher and watch threads in each preloaded worker"""
+    if preload_app:
+        from app.extensions import start_background_tasks
+        start_background_tasks()
@@ -21,6 +21,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeProtectionPlanFilter();
     loadSettings();
     loadAllData();
+    initializeStatsStream();
 });
 
 // Tab Management
@@ -293,6 +294,27 @@ async function loadStats() {
     }
 }
 
+// Keep the stat counters live from the server-sent stats stream
+function initializeStatsStream() {
+    if (!window.EventSource) {
+        return;
+    }
+    
+    const source = new EventSource('/api/stats/stream');
+    source.onmessage = function(event) {
+        const stats = JSON.parse(event.data);
+        if (stats.error) {
+            console.error('Error streaming stats:', stats.error);
+            return;
+        }
+        
+        document.getElementById('stat-applications').textContent = stats.applications || 0;
+        document.getElementById('stat-snapshots').textContent = stats.snapshots || 0;
+        document.getElementById('stat-clusters').textContent = stats.storageClusters || 0;
+        document.getElementById('stat-plans').textContent = stats.protectionPlans || 0;
+    };
+}
+
 async function loadApplications() {
     const loadingEl = document.getElementById('applications-loading');
     const contentEl = document.getElementById('applications-content');